@@ -17,7 +17,6 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import logging
-import math
 
 from PySide6 import QtGui
 
@@ -153,35 +152,13 @@ class CombinedLogMagChart(LogMagChart):
         self.drawMarkers(qp, data=self.data11)
         self.drawMarkers(qp, data=self.data21)
 
-    def calc_scaling(self) -> None:
-        if self.fixedValues:
-            maxValue = self.maxDisplayValue
-            minValue = self.minDisplayValue
-        else:
-            # Find scaling
-            min_val = 100.0
-            max_val = -100.0
-            for d in self.data11 + self.data21:
-                logmag = self.logMag(d)
-                if math.isinf(logmag):
-                    continue
-                max_val = max(max_val, logmag)
-                min_val = min(min_val, logmag)
-
-            for d in self.reference11 + self.reference21:
-                if d.freq < self.fstart or d.freq > self.fstop:
-                    continue
-                logmag = self.logMag(d)
-                if math.isinf(logmag):
-                    continue
-                max_val = max(max_val, logmag)
-                min_val = min(min_val, logmag)
-
-            minValue = 10 * math.floor(min_val / 10)
-            maxValue = 10 * math.ceil(max_val / 10)
-
-        self.minValue = minValue
-        self.maxValue = maxValue
+    def scaling_sources(
+        self,
+    ) -> tuple[list[list[Datapoint]], list[list[Datapoint]]]:
+        return (
+            [self.data11, self.data21],
+            [self.reference11, self.reference21],
+        )
 
     def copy(self) -> "CombinedLogMagChart":
         new_chart: LogMagChart = super().copy()
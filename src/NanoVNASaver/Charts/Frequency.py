@@ -379,6 +379,10 @@ class FrequencyChart(Chart):
         except ValueError:
             return self.topMargin
 
+    def getYPositions(self, data: list[Datapoint]) -> list[int] | None:
+        """all y positions at once, None to fall back to getYPosition()"""
+        return None
+
     def frequencyAtPosition(self, x, limit=True) -> int:
         """
         Calculates the frequency at a given X-position
@@ -683,8 +687,10 @@ class FrequencyChart(Chart):
         color: QtGui.QColor,
         y_function=None,
     ):
+        y_positions = None
         if y_function is None:
             y_function = self.getYPosition
+            y_positions = self.getYPositions(data)
         pen = QtGui.QPen(color)
         pen.setWidth(self.dim.point)
         line_pen = QtGui.QPen(color)
@@ -692,14 +698,18 @@ class FrequencyChart(Chart):
         qp.setPen(pen)
         for i, d in enumerate(data):
             x = self.getXPosition(d)
-            y = y_function(d)
+            y = y_function(d) if y_positions is None else y_positions[i]
             if y is None:
                 continue
             if self.isPlotable(x, y):
                 qp.drawPoint(int(x), int(y))
             if self.flag.draw_lines and i > 0:
                 prevx = self.getXPosition(data[i - 1])
-                prevy = y_function(data[i - 1])
+                prevy = (
+                    y_function(data[i - 1])
+                    if y_positions is None
+                    else y_positions[i - 1]
+                )
                 if prevy is None:
                     continue
                 qp.setPen(line_pen)
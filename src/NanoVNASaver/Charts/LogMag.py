@@ -19,8 +19,11 @@
 import logging
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
-from PySide6 import QtGui
+import numpy as np
+import numpy.typing as npt
+from PySide6 import QtCore, QtGui
 
 from ..RFTools import Datapoint
 from ..SITools import log_floor_125
@@ -30,13 +33,14 @@ from .Frequency import FrequencyChart
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TickVal:
     count: int = 0
     first: float = 0.0
     step: float = 0.0
 
 
+@lru_cache(maxsize=128)
 def span2ticks(span: float, min_val: float) -> TickVal:
     span = abs(span)
     step = log_floor_125(span / 5)
@@ -47,6 +51,17 @@ def span2ticks(span: float, min_val: float) -> TickVal:
     return TickVal(count, first, step)
 
 
+def gain_arrays(
+    data: list[Datapoint],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """returns frequencies and gains (dB) of data as numpy arrays"""
+    freq = np.fromiter((d.freq for d in data), np.float64, len(data))
+    z = np.fromiter((d.z for d in data), np.complex128, len(data))
+    with np.errstate(divide="ignore"):
+        gain = 20 * np.log10(np.abs(z))
+    return freq, gain
+
+
 class LogMagChart(FrequencyChart):
     def __init__(self, name="") -> None:
         super().__init__(name)
@@ -62,6 +77,15 @@ class LogMagChart(FrequencyChart):
 
         self.isInverted: bool = False
 
+        self._gain_cache: dict[
+            int,
+            tuple[
+                list[Datapoint],
+                npt.NDArray[np.float64],
+                npt.NDArray[np.float64],
+            ],
+        ] = {}
+
     def drawValues(self, qp: QtGui.QPainter) -> None:
         if len(self.data) == 0 and len(self.reference) == 0:
             return
@@ -78,30 +102,49 @@ class LogMagChart(FrequencyChart):
         self.drawData(qp, self.reference, Chart.color.reference)
         self.drawMarkers(qp)
 
+    def scaling_sources(
+        self,
+    ) -> tuple[list[list[Datapoint]], list[list[Datapoint]]]:
+        return [self.data], [self.reference]
+
+    def _gain_arrays(
+        self, data: list[Datapoint]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        # data lists get replaced on every sweep, so the identity of the
+        # list is a sufficient key to reuse the arrays between repaints
+        cached = self._gain_cache.get(id(data))
+        if cached is None or cached[0] is not data:
+            if len(self._gain_cache) >= 8:
+                del self._gain_cache[next(iter(self._gain_cache))]
+            cached = (data, *gain_arrays(data))
+            self._gain_cache[id(data)] = cached
+        return cached[1], cached[2]
+
     def calc_scaling(self) -> None:
         if self.fixedValues:
             maxValue = self.maxDisplayValue
             minValue = self.minDisplayValue
         else:
+            data, reference = self.scaling_sources()
+            gains = [self._gain_arrays(d)[1] for d in data]
+            # Also check min/max for the reference sweep, sweeps are sorted
+            # by frequency so the displayed span is a slice of it
+            for d in reference:
+                freq, gain = self._gain_arrays(d)
+                start = np.searchsorted(freq, self.fstart, "left")
+                stop = np.searchsorted(freq, self.fstop, "right")
+                gains.append(gain[start:stop])
+
             # Find scaling
             min_val = 100.0
             max_val = -100.0
-            for d in self.data:
-                logmag = self.logMag(d)
-                if math.isinf(logmag):
-                    continue
-                max_val = max(max_val, logmag)
-                min_val = min(min_val, logmag)
-
-            # Also check min/max for the reference sweep
-            for d in self.reference:
-                if d.freq < self.fstart or d.freq > self.fstop:
-                    continue
-                logmag = self.logMag(d)
-                if math.isinf(logmag):
-                    continue
-                max_val = max(max_val, logmag)
-                min_val = min(min_val, logmag)
+            g = np.concatenate(gains)
+            if self.isInverted:
+                g = -g
+            g = g[np.isfinite(g)]
+            if g.size:
+                min_val = min(min_val, float(g.min()))
+                max_val = max(max_val, float(g.max()))
             minValue = 10 * math.floor(min_val / 10)
             maxValue = 10 * math.ceil(max_val / 10)
 
@@ -127,23 +170,37 @@ class LogMagChart(FrequencyChart):
         self.draw_swr_markers(qp)
 
     def draw_db_lines(self, qp, max_value: int, min_value: int, ticks) -> None:
-        for i in range(ticks.count):
-            db = ticks.first + i * ticks.step
-            y = self.topMargin + round(
-                (max_value - db) / self.span * self.dim.height
-            )
-            qp.setPen(QtGui.QPen(Chart.color.foreground))
-            qp.drawLine(
-                self.leftMargin - 5, y, self.leftMargin + self.dim.width, y
-            )
-            if db > min_value and db != max_value:
-                qp.setPen(QtGui.QPen(Chart.color.text))
-                qp.drawText(
-                    3, y + 4, f"{round(db, 1)}" if ticks.step < 1 else f"{db}"
+        db = ticks.first + np.arange(ticks.count) * ticks.step
+        y = self.topMargin + np.round(
+            (max_value - db) / self.span * self.dim.height
+        ).astype(int)
+        qp.setPen(QtGui.QPen(Chart.color.foreground))
+        qp.drawLines(
+            [
+                QtCore.QLine(
+                    self.leftMargin - 5,
+                    y_line,
+                    self.leftMargin + self.dim.width,
+                    y_line,
                 )
+                for y_line in y.tolist()
+            ]
+        )
+
+        labeled = (db > min_value) & (db != max_value)
+        qp.setPen(QtGui.QPen(Chart.color.text))
+        for value, y_label in zip(
+            db[labeled].tolist(), y[labeled].tolist(), strict=True
+        ):
+            qp.drawText(
+                3,
+                y_label + 4,
+                f"{round(value, 1)}" if ticks.step < 1 else f"{value}",
+            )
 
     def draw_swr_markers(self, qp) -> None:
-        qp.setPen(Chart.color.swr)
+        lines = []
+        labels = []
         for vswr in self.swrMarkers:
             if vswr <= 1:
                 continue
@@ -153,8 +210,16 @@ class LogMagChart(FrequencyChart):
             y = self.topMargin + round(
                 (self.maxValue - logMag) / self.span * self.dim.height
             )
-            qp.drawLine(self.leftMargin, y, self.leftMargin + self.dim.width, y)
-            qp.drawText(self.leftMargin + 3, y - 1, f"VSWR: {vswr}")
+            lines.append(
+                QtCore.QLine(
+                    self.leftMargin, y, self.leftMargin + self.dim.width, y
+                )
+            )
+            labels.append((y, f"VSWR: {vswr}"))
+        qp.setPen(Chart.color.swr)
+        qp.drawLines(lines)
+        for y, label in labels:
+            qp.drawText(self.leftMargin + 3, y - 1, label)
 
     def getYPosition(self, d: Datapoint) -> int:
         logMag = self.logMag(d)
@@ -164,6 +229,17 @@ class LogMagChart(FrequencyChart):
             (self.maxValue - logMag) / self.span * self.dim.height
         )
 
+    def getYPositions(self, data: list[Datapoint]) -> list[int]:
+        gain = self._gain_arrays(data)[1]
+        if self.isInverted:
+            gain = -gain
+        finite = np.isfinite(gain)
+        y = np.full(len(gain), self.topMargin)
+        y[finite] = self.topMargin + (
+            (self.maxValue - gain[finite]) / self.span * self.dim.height
+        ).astype(int)
+        return y.tolist()
+
     def valueAtPosition(self, y) -> list[float]:
         absy = y - self.topMargin
         val = -1 * ((absy / self.dim.height * self.span) - self.maxValue)
@@ -460,7 +460,7 @@ class TDRChart(Chart):
     def _draw_max_point(
         self, height, x_step, y_step, min_index, qp: QPainter
     ) -> None:
-        id_max = np.argmax(self.tdrWindow.td)
+        id_max = self.tdrWindow.index_peak
 
         max_point = QPoint(
             self.leftMargin + int((id_max - min_index) / x_step),
@@ -526,23 +526,21 @@ class TDRChart(Chart):
         qp.setPen(pen)
         y_step = (max_impedance - min_impedance) / height
 
-        tdr_points = [
-            QPoint(
-                self.leftMargin + int((i - min_index) / x_step),
-                (self.topMargin + height)
-                - int(np.real(self.tdrWindow.td[i]) / y_step),
-            )
-            for i in range(min_index, max_index)
-        ]
+        bottom = self.topMargin + height
+        x_pos = (
+            self.leftMargin
+            + (np.arange(max_index - min_index) / x_step).astype(int)
+        ).tolist()
+        td = np.real(self.tdrWindow.td[min_index:max_index])
+        tdr_y = (bottom - (td / y_step).astype(int)).tolist()
+        step_Z = self.tdrWindow.step_response_Z[min_index:max_index]
+        step_y = (
+            bottom - ((step_Z - min_impedance) / y_step).astype(int)
+        ).tolist()
+
+        tdr_points = [QPoint(x, y) for x, y in zip(x_pos, tdr_y, strict=True)]
         step_response_points = [
-            QPoint(
-                self.leftMargin + int((i - min_index) / x_step),
-                (self.topMargin + height)
-                - int(
-                    (self.tdrWindow.step_response_Z[i] - min_impedance) / y_step
-                ),
-            )
-            for i in range(min_index, max_index)
+            QPoint(x, y) for x, y in zip(x_pos, step_y, strict=True)
         ]
 
         pen.setColor(Chart.color.sweep)
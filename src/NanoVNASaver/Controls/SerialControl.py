@@ -17,13 +17,15 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import logging
-from time import sleep
+import math
+from time import monotonic, sleep
 from typing import TYPE_CHECKING
 
 from PySide6 import QtWidgets
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
 from ..Hardware.Hardware import Interface, get_interfaces, get_VNA
+from ..Hardware.VNA import VNA
 from .Control import Control
 
 if TYPE_CHECKING:
@@ -32,6 +34,70 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# rescans within this time (in seconds) reuse the last scan result
+RESCAN_CACHE_TIME: float = 1.0
+# time (in seconds) to keep retrying to identify the VNA after opening
+# a port, and the pause between the attempts
+HANDSHAKE_TIMEOUT: float = 1.0
+HANDSHAKE_RETRY_WAIT: float = 0.01
+
+
+class PortScanSignals(QObject):
+    finished = Signal(list)
+
+
+class PortScanner(QRunnable):
+    """runs get_interfaces() in a worker thread as probing the ports
+    may block for a while"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = PortScanSignals()
+
+    @Slot()
+    def run(self) -> None:
+        interfaces: list[Interface] = []
+        try:
+            interfaces = get_interfaces()
+        except Exception as exc:
+            # probing may fail in odd ways (e.g. UnicodeDecodeError), the
+            # control waits for finished, so it has to be emitted anyway
+            logger.error("Unable to scan serial ports: %s", exc)
+        finally:
+            self.signals.finished.emit(interfaces)
+
+
+class HandshakeSignals(QObject):
+    finished = Signal(object)
+
+
+class Handshake(QRunnable):
+    """identifies the VNA on an opened port in a worker thread, a device
+    that does not answer blocks get_VNA() for seconds"""
+
+    def __init__(self, iface: Interface) -> None:
+        super().__init__()
+        self.iface = iface
+        self.signals = HandshakeSignals()
+
+    @Slot()
+    def run(self) -> None:
+        vna: VNA | None = None
+        deadline = monotonic() + HANDSHAKE_TIMEOUT
+        try:
+            while vna is None:
+                try:
+                    vna = get_VNA(self.iface)
+                except IOError as exc:
+                    if monotonic() >= deadline:
+                        logger.error("Unable to connect to VNA: %s", exc)
+                        break
+                    sleep(HANDSHAKE_RETRY_WAIT)
+        except Exception as exc:
+            logger.error("Unable to connect to VNA: %s", exc)
+        finally:
+            self.signals.finished.emit(vna)
+
 
 class SerialControl(Control):
     # true when serial port was connected and false when it was disconnected
@@ -41,9 +107,14 @@ class SerialControl(Control):
         super().__init__(app, "Serial port control")
 
         self.interface = Interface("serial", "none")
+        self.interfaces: list[Interface] = []
+        self._last_scan: float = -math.inf
+        self._scanner: PortScanner | None = None
+        self._handshake: Handshake | None = None
         self.inp_port = QtWidgets.QComboBox()
         self.inp_port.setMinimumHeight(20)
-        self.rescanSerialPort()
+        # initial scan is synchronous, auto connect relies on its result
+        self.set_interfaces(get_interfaces())
         self.inp_port.setEditable(True)
         self.inp_port.currentIndexChanged.connect(self.update_connect_btn_state)
         self.btn_rescan = QtWidgets.QPushButton("Rescan")
@@ -79,8 +150,31 @@ class SerialControl(Control):
         self.connected.connect(self.update_settings_state)
 
     def rescanSerialPort(self):
+        if self._scanner is not None:
+            return
+        if monotonic() - self._last_scan < RESCAN_CACHE_TIME:
+            self.update_port_list()
+            return
+        self._scanner = PortScanner()
+        self._scanner.setAutoDelete(False)
+        self._scanner.signals.finished.connect(self.rescan_finished)
+        # the scan probes the ports, keep them from being connected meanwhile
+        self.update_settings_state(bool(self.is_vna_connected()))
+        self.app.threadpool.start(self._scanner)
+
+    def rescan_finished(self, interfaces: list[Interface]) -> None:
+        self._scanner = None
+        self.set_interfaces(interfaces)
+        self.update_settings_state(bool(self.is_vna_connected()))
+
+    def set_interfaces(self, interfaces: list[Interface]) -> None:
+        self.interfaces = interfaces
+        self._last_scan = monotonic()
+        self.update_port_list()
+
+    def update_port_list(self) -> None:
         self.inp_port.clear()
-        for iface in get_interfaces():
+        for iface in self.interfaces:
             self.inp_port.insertItem(1, f"{iface}", iface)
         self.inp_port.repaint()
 
@@ -108,12 +202,24 @@ class SerialControl(Control):
                 logger.error("Unable to open port %s", self.interface)
                 return
             self.interface.timeout = 0.05
-        sleep(0.1)
-        try:
-            self.app.vna = get_VNA(self.interface)
-        except IOError as exc:
-            logger.error("Unable to connect to VNA: %s", exc)
+            self.interface.reset_input_buffer()
+        self._handshake = Handshake(self.interface)
+        self._handshake.setAutoDelete(False)
+        self._handshake.signals.finished.connect(self.handshake_finished)
+        self.update_settings_state(False)
+        self.app.threadpool.start(self._handshake)
 
+    def handshake_finished(self, vna: VNA | None) -> None:
+        self._handshake = None
+        if vna is None:
+            with self.interface.lock:
+                self.interface.close()
+            self.update_settings_state(False)
+            return
+        self.app.vna = vna
+        self.device_connected()
+
+    def device_connected(self) -> None:
         self.app.vna.validateInput = self.app.settings.value(
             "SerialInputValidation", False, bool
         )
@@ -171,13 +277,21 @@ class SerialControl(Control):
         # Eanble Connect/Dicsonnect button only if:
         # a) serial was already connected
         # b) serial is disconnected AND inp_port was selected
+        # c) no port scan or handshake is running
         port_selected = self.inp_port.currentData() is not None
-        self.btn_toggle.setEnabled(self.is_vna_connected() or port_selected)
+        self.btn_toggle.setEnabled(
+            not self.is_busy()
+            and bool(self.is_vna_connected() or port_selected)
+        )
 
     def is_vna_connected(self) -> bool:
         return self.app.vna and self.app.vna.connected()
 
+    def is_busy(self) -> bool:
+        return self._scanner is not None or self._handshake is not None
+
     def update_settings_state(self, was_connected: bool) -> None:
-        self.btn_rescan.setEnabled(not was_connected)
+        self.btn_rescan.setEnabled(not was_connected and not self.is_busy())
+        self.inp_port.setEnabled(not self.is_busy())
         self.btn_settings.setEnabled(was_connected)
         self.update_connect_btn_state()
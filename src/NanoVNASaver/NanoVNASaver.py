@@ -130,6 +130,8 @@ class NanoVNASaver(QWidget):
         self.dataLock = threading.Lock()
         self.data: Touchstone = Touchstone()
         self.ref_data: Touchstone = Touchstone()
+        # bumped on every saveData() as sweeps refill the same lists in place
+        self.data_version = 0
 
         self.sweepSource = ""
         self.referenceSource = ""
@@ -492,6 +494,7 @@ class NanoVNASaver(QWidget):
         with self.dataLock:
             self.data.s11 = data
             self.data.s21 = data21
+            self.data_version += 1
             if self.s21att > 0:
                 self.data.s21 = corr_att_data(self.data.s21, self.s21att)
         if source is not None:
@@ -18,6 +18,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import logging
 import math
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -25,8 +26,9 @@ import numpy.typing as npt
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QShortcut
+from scipy import fft  # type: ignore
 from scipy.constants import speed_of_light  # type: ignore
-from scipy.signal import convolve  # type: ignore
+from scipy.signal import find_peaks  # type: ignore
 
 from ..RFTools import Datapoint
 from .Defaults import make_scrollable
@@ -43,18 +45,18 @@ logger = logging.getLogger(__name__)
 # when using kaiser window (numpy.kaiser()). From Christian Zietz,
 # https://groups.io/g/nanovna-users/topic/should_the_builtin_tdr_mode/77043091
 #
-def kaiser_correction(lens11, arg):
-    factor = np.sum(np.kaiser(lens11, arg))
-    logger.debug("kaiser correction (%s, %s) factor: %s", lens11, arg, factor)
+def kaiser_correction(window):
+    factor = np.sum(window)
+    logger.debug("kaiser correction (%s) factor: %s", len(window), factor)
     return factor
 
 
 WINDOWING_FUNCTION = (
-    ("Hanning", np.hanning, lambda lens11, arg: lens11 / 2.0, None),
+    ("Hanning", np.hanning, lambda window: len(window) / 2.0, None),
     # The 1/0.42 is the Amplitude Correction Factor for the Blackman window.
     # 0.42 is the average amplitude of the window across its range.
-    # ("Blackman", np.blackman, lambda lens11, arg : lens11 / 0.42, None),
-    ("Blackman", np.blackman, lambda lens11, arg: lens11 / (1 / 0.42), None),
+    # ("Blackman", np.blackman, lambda window : len(window) / 0.42, None),
+    ("Blackman", np.blackman, lambda window: len(window) / (1 / 0.42), None),
     (
         "Minimal (Kaiser, \N{GREEK SMALL LETTER BETA}=0)",
         np.kaiser,
@@ -122,6 +124,50 @@ CABLE_PARAMETERS = (
 MIN_DATA_LENGTH = 2
 
 
+def step_convolve(td: npt.NDArray) -> npt.NDArray[np.complex128]:
+    """convolve(td, ones) + convolve(td[::-1], ones) with ones of len(td)
+
+    Both convolutions are running sums and the one of the reversed td is
+    total - acc[n-2-k], so a single cumulative sum gives the result. Its
+    second half mirrors the first one around 2 * total.
+    """
+    n = len(td)
+    acc = np.cumsum(td, dtype=np.complex128)
+    total = acc[-1]
+    result = np.empty(2 * n - 1, np.complex128)
+    np.subtract(acc[:-1], acc[-2::-1], out=result[: n - 1])
+    result[: n - 1] += total
+    result[n - 1] = 2 * total
+    np.subtract(2 * total, result[: n - 1], out=result[n:])
+    return result
+
+
+def find_peak(td: npt.NDArray) -> int:
+    """index of the most prominent peak of td, the maximum if there is none"""
+    values = np.real(td)
+    index_max = int(np.argmax(values))
+    if values[index_max] <= 0:
+        return index_max
+    # prepend the minimum so a reflection at distance 0 counts as a peak too
+    peaks, props = find_peaks(
+        np.concatenate([[values.min()], values]),
+        prominence=values[index_max] * 0.1,
+    )
+    if not peaks.size:
+        return index_max
+    return int(peaks[np.argmax(props["prominences"])]) - 1
+
+
+@lru_cache(maxsize=16)
+def get_window(
+    function, correction, arg, length: int
+) -> tuple[npt.NDArray[np.float64], float]:
+    """returns the (read-only) window and its amplitude correction factor"""
+    window = function(length) if arg is None else function(length, arg)
+    window.flags.writeable = False
+    return window, correction(window)
+
+
 class TDRWindow(QtWidgets.QWidget):
     updated = QtCore.Signal()
 
@@ -129,11 +175,19 @@ class TDRWindow(QtWidgets.QWidget):
         super().__init__()
         self.app = app
 
-        self.td: npt.NDArray[np.complex128]
+        self.td: npt.NDArray[np.complex128] | npt.NDArray[np.float64]
+        self.index_peak: int = 0
         self.windowed_s11: npt.NDArray[np.complex128]
         self.distance_axis: npt.NDArray[np.float64]
         self.step_response_Z: npt.NDArray[np.float64]
 
+        self._s11_source: list[Datapoint] = []
+        self._s11_version: int = -1
+        self._s11: npt.NDArray[np.complex128] = np.empty(0, np.complex128)
+        self._s11_mirrored_source: npt.NDArray[np.complex128] = self._s11
+        self._s11_mirror: npt.NDArray[np.complex128] = self._s11
+        self._fft_buf: npt.NDArray[np.complex128] = np.empty(0, np.complex128)
+
         self.setWindowTitle("TDR")
         self.setWindowIcon(get_window_icon())
 
@@ -215,6 +269,7 @@ class TDRWindow(QtWidgets.QWidget):
     def updateTDR(self):
         TDR_format = self.format_dropdown.currentText()
         TDR_window = self.window_dropdown.currentData()
+        is_lowpass = "lowpass" in TDR_format
         if self.tdr_velocity_dropdown.currentData() == -1:
             self.tdr_velocity_input.setDisabled(False)
         else:
@@ -237,7 +292,7 @@ class TDRWindow(QtWidgets.QWidget):
             logger.info("Cannot compute cable length at 0 span")
             return
 
-        s11 = np.array([complex(d.re, d.im) for d in self.app.data.s11])
+        s11 = self._s11_array()
 
         # In lowpass mode, the frequency is measured down to DC. Because the
         # impulse response is real, we can flip over the frequency data so
@@ -247,94 +302,132 @@ class TDRWindow(QtWidgets.QWidget):
         # can't flip the frequency data. We need to keep everything complex.
         # We are only able to determine the magnitude of the impulse
         # response in this mode.
-        if "lowpass" in TDR_format:
-            s11 = np.fft.fftshift(
-                # Include negative frequencies
-                np.concatenate([s11, np.conj(s11[-1:0:-1])])
-            )
-
-        if TDR_window["arg"] is None:
-            self.windowed_s11 = TDR_window["function"](len(s11)) * s11
-        else:
-            self.windowed_s11 = (
-                TDR_window["function"](len(s11), TDR_window["arg"]) * s11
-            )
+        if is_lowpass:
+            s11 = self._s11_mirrored(s11)
+
+        window, correction = get_window(
+            TDR_window["function"],
+            TDR_window["corr"],
+            TDR_window["arg"],
+            len(s11),
+        )
+        self.windowed_s11 = window * s11
 
-        if "lowpass" in TDR_format:
-            td = self._tdr_lowpass(TDR_format, s11, TDR_window)
+        if is_lowpass:
+            td = self._tdr_lowpass(TDR_format, correction)
         else:
             td = np.abs(
-                np.fft.ifft(
-                    self.windowed_s11, self.app.tdr_chart.get_fft_points()
+                fft.ifft(
+                    self.windowed_s11,
+                    self.app.tdr_chart.get_fft_points(),
+                    workers=-1,
                 )
             )
             # Convolving with a step function is unnecessary, we can only get
             # the magnitude of impulse response
             if TDR_format == "Refl (bandpass)":
                 self.step_response_Z = (
-                    td
-                    * self.app.tdr_chart.get_fft_points()
-                    / TDR_window["corr"](len(s11), TDR_window["arg"])
+                    td * self.app.tdr_chart.get_fft_points() / correction
                 )
 
         time_axis = np.linspace(
             0, 1 / step_size, self.app.tdr_chart.get_fft_points()
         )
         self.distance_axis = time_axis * v * speed_of_light
-        # peak = np.max(td)
-        # We should check that this is an actual *peak*, and not just
-        # a vague maximum
-        index_peak = np.argmax(td)
+        self.index_peak = find_peak(td)
 
-        cable_len = round(self.distance_axis[index_peak] / 2, 3)
+        cable_len = round(self.distance_axis[self.index_peak] / 2, 3)
         feet = math.floor(cable_len / 0.3048)
         inches = round(((cable_len / 0.3048) - feet) * 12, 1)
 
         self.tdr_result_label.setText(f"{cable_len}m ({feet}ft {inches}in)")
         self.app.tdr_result_label.setText(f"{cable_len}m")
-        self.td = list(td)
+        self.td = td
         self.app.tdr_chart.data = [
             Datapoint(0, 0.0, 0.0)
         ]  # A bit of cheating otherwise the super().wheelEvent() exits
         # without doing anything.
         self.updated.emit()
 
-    def _tdr_lowpass(self, tdr_format, s11, tdr_window) -> np.ndarray:
-        pad_points = (
-            self.app.tdr_chart.get_fft_points() - len(self.windowed_s11)
-        ) // 2
-        self.windowed_s11 = np.pad(
-            self.windowed_s11, [pad_points + 1, pad_points]
-        )  # Pad array to length self.app.tdr_chart.get_fft_points()
-        self.windowed_s11 = np.fft.ifftshift(self.windowed_s11)
-
-        td = np.fft.ifft(self.windowed_s11)
-        step = np.ones(self.app.tdr_chart.get_fft_points())
-        step_response = convolve(td, step)
-        step_response_rev = convolve(td[::-1], step)
+    def _s11_array(self) -> npt.NDArray[np.complex128]:
+        # sweeps write their segments into the same list, so the data
+        # version tells when it changed; convert once per update, not per
+        # redraw
+        data = self.app.data.s11
+        version = self.app.data_version
+        if (
+            self._s11_version != version
+            or self._s11_source is not data
+            or len(self._s11) != len(data)
+        ):
+            self._s11_version = version
+            self._s11_source = data
+            self._s11 = np.fromiter(
+                (d.z for d in data), np.complex128, len(data)
+            )
+            self._s11.flags.writeable = False
+        return self._s11
+
+    def _s11_mirrored(
+        self, s11: npt.NDArray[np.complex128]
+    ) -> npt.NDArray[np.complex128]:
+        # Include negative frequencies, already fftshifted to
+        # conj(s11[n-1]) ... conj(s11[1]), s11[0], s11[1] ... s11[n-1]
+        if self._s11_mirrored_source is not s11:
+            n = len(s11)
+            mirror = np.empty(2 * n - 1, np.complex128)
+            np.conj(s11[:0:-1], out=mirror[: n - 1])
+            mirror[n - 1 :] = s11
+            mirror.flags.writeable = False
+            self._s11_mirrored_source = s11
+            self._s11_mirror = mirror
+        return self._s11_mirror
+
+    def _fft_input(self, fft_points: int) -> npt.NDArray[np.complex128]:
+        if self._fft_buf.size != fft_points:
+            self._fft_buf = np.empty(fft_points, np.complex128)
+        # Zero pad to fft_points and ifftshift in one go: the DC bin at the
+        # center of the mirrored data goes to index 0, the negative
+        # frequencies wrap around to the end of the buffer
+        center = len(self.windowed_s11) // 2
+        buf = self._fft_buf
+        buf.fill(0)
+        buf[: len(self.windowed_s11) - center] = self.windowed_s11[center:]
+        buf[fft_points - center :] = self.windowed_s11[:center]
+        return buf
+
+    def _tdr_lowpass(self, tdr_format, correction) -> np.ndarray:
+        fft_points = self.app.tdr_chart.get_fft_points()
+        td = fft.ifft(self._fft_input(fft_points), workers=-1, overwrite_x=True)
+        if tdr_format == "Refl (lowpass)":
+            self.step_response_Z = np.real(td) * (fft_points / correction)
+            return td
 
         # This fixes the issue with the impedance being wrong when the
         # length is zero
-        step_response = step_response + step_response_rev
+        step_response = step_convolve(td)
 
         # calculate step response based on the format that the user selected
-        step_Z = 50 * (1 + step_response) / (1 - step_response)
-        step_refl_coefficient = np.abs((step_Z - 50) / (step_Z + 50))
+        # with step_Z = 50 * (1 + step_response) / (1 - step_response).
+        # Its reflection coefficient is the step response itself, so only
+        # |Z| needs step_Z. Work in place to save temporary arrays.
         if tdr_format == "|Z| (lowpass)":
+            step_Z = np.add(1, step_response)
+            step_Z *= 50
+            np.subtract(1, step_response, out=step_response)
+            step_Z /= step_response
             self.step_response_Z = np.abs(step_Z)
             return td
+        step_refl_coefficient = np.abs(step_response)
         if tdr_format == "S11 (lowpass)":
-            self.step_response_Z = 20 * np.log10(step_refl_coefficient)
+            np.log10(step_refl_coefficient, out=step_refl_coefficient)
+            step_refl_coefficient *= 20
+            self.step_response_Z = step_refl_coefficient
             return td
         if tdr_format == "VSWR (lowpass)":
-            self.step_response_Z = np.abs(
-                (1 + step_refl_coefficient) / (1 - step_refl_coefficient)
-            )
+            vswr = np.add(1, step_refl_coefficient)
+            np.subtract(1, step_refl_coefficient, out=step_refl_coefficient)
+            vswr /= step_refl_coefficient
+            self.step_response_Z = np.abs(vswr, out=vswr)
             return td
-        if tdr_format == "Refl (lowpass)":
-            self.step_response_Z = np.real(
-                td
-                * self.app.tdr_chart.get_fft_points()
-                / tdr_window["corr"](len(s11), tdr_window["arg"])
-            )
         return td
@@ -0,0 +1,1674 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00V\xf7\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x81\x08\x06\x00\x00\x00\x08b\xb2n\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x19tEXtCom\
+ment\x00Created wit\
+h GIMPW\x81\x0e\x17\x00\x00 \x00ID\
+ATx\xda\xed\xbdw\x90$\xd7y'\xd8\x00\x19A\
+\x86\x96\x0a\xea\x1fE\x10A\xe9\x8f\x8d\xe3IwZ\x05\
+\xd7(t\xa1\x8d\x0d\xediO\xda\xd3I\xa7\xe3\x89\xbb\
+K\xad\x13\xc9\x95t\x94(\x91\x04)\x82\x00H\x003\
+\xf0 \x06\x00\x87$\xbc\x19\xd8\xc1x\xef]\x8f\xef\x99\
+\xe9\x9e\xee\x99\xf6\xdeW\x97\xf7\xbe\xcbe~\xf7\xfd^\
+\xbe/\xebUvVw\x0f\x0c\x09ml#\x125]\
+]\x95\xf9\xde\xfb\xbc\xefx\xe8\xa1\x87:\xfe\xa1\x5c\x0f\
+>\xf8`\xc7\xc3\x0f?\xdc\xf1\xc4\x13O|\xec\x91G\
+\x1e\xf9\xe47\xbe\xf1\x8dO|\xf3\x9b\xdf\xec\xf8\xfa\xd7\
+\xbf\xde\xf1\xe8\xa3\x8fv\xec\xd8\xb1\xa3\xe3\xed\xb7\xdf\xfe\
+\xe5\xe7\x9f\x7f\xfe\xf3\xd3\xd3\xd3\x7fT,\x16\xbf\x95\xc9\
+d~\x94\xcb\xe5v%\x93\xc9\x8b\xa1Ph4\x12\x89\
+\xf0K(\xc7\xaf\xd5\xd9\xd9Y{~~\xde\xc6\xbf\xc3\
+\xe1p\x8e\xaf\x10_\xa3\xfc\x9d\x8b\xf8\x0e\xbe[*\x95\
+\xbe533\xf3G\xcf=\xf7\xdc\xe7\xdfy\xe7\x9d_\
+\xc63\xf8\xd9\xea\x99x6\xd6\xc0\xcf\xfe$\xd6\x84\xb5\
+a\x8d\xff\x90\xce\xf4#\x0fp\xbc\xe2`\xf9\xf56~\
+\xbd\xed\x81\x07\x1e\xe8\xf8\xeew\xbf\xdbq\xff\xfd\xf7w\
+\x1c=z\xb4\xe3\xc8\x91#\xbf\xbak\xd7\xae\xdf\xbft\
+\xe9\xd2\xdf2\xc0^\x8e\xc5b\x9d\x0c\xd0\x00_\x8dh\
+4J\xfc;\x00L\x8c\x00\x94\xcf\xe7\x89\x01K\xd9l\
+V\xfd{ii\x89\x18\xe0\xee\xfbr\xc5\xe3q\xc2w\
+\xf8\xfb6\xee\x81{\xf1\xe7\x02\xfc~'\x9e\xd1\xd5\xd5\
+\xf5\xb7x&?\xffW\xb1\x06\xac\x05k\xc2\xda\xb0F\
+\xbd\xd6\x96=\xfc\x0f\x04x\x0f\x80g\xca\x02\xc0?v\
+\xdf}\xf7ul\xd8\xb0\xa1\xe3\xfb\xdf\xff~\xc7K/\
+\xbd\xd4188\xf8\x9b}}}\xdf\xa9\xd5j{\xca\
+\xe5\xf2\x18\x03\xad\x0a\xc0%\x12\x09\x05@~O]\x96\
+e\xa9\xcb\xb6mu\xc9\x8f\xfc;\x95J)d\xf0\xfe\
+\xc8\xe7\xe5\xfbr?|\x16\xc8\x81\xd7B\xa1P]^\
+^\x1ek4\x1a{n\xde\xbc\xf9\x1d\xac\x09k\xc3\x1a\
+\xb1V\xac\x19k\xc7\x1e>\xca\x88\xf0\x91\x04>\xb3\xd8\
+\xdb\xf8\xf5c\xa0\xaa\x1f\xff\xf8\xc7\x1d\xcf<\xf3\xcc\xc7\
+/_\xbe\xfc\x1bL\xcdw3\xd5v1\x00\xb2L\x89\
+\xa0n\x05\x0c\x00\xa7^\xafW\x19vu\xbe\x1a|Y\
+\x80\xa3\x06\xa0\xbc\xba\x17\x03M\x01\x18\x08\x93N\xa7[\
+\x80m\x22\x0d\xbe\xab\x91\xc5\xd6\xf7\xc4\xbd\xebx\x16\x9e\
+\x09\x04\x02\x87\xc0Z\xb0&\xe6\x14]X#s\x88\xdf\
+\xc0\x9a7o\xde\xac8\x03\xf6\xa2\xf7\xf4?\x10`5\
+\x8a\x17\xd6y\xd7]wu<\xf6\xd8c\x1d\x07\x0e\x1c\
+\xb8\x83\x0f\xf4+Li\x07\x18XU\x00\x0c\x00g\xb9\
+\x0c \xda&\xc0\x05X\xf2jR\xb1\xf9;9\x1fV\
+\xaf\x10\x0b\x00\x9e\xf9\x9e\xf9Y/'\xc0\x8d\x05\xa9\xf0\
+\x15\xfeU\x10\xc2f}C\xdd\x0b\x1c\x82\x11\xa3\xaa\xd7\
+\xfc\x15\xec\x01{\xc1\x9eD\x94}\x948\xc2G\x85\xd5\
+\xdf\x0e\xf9\x89\xeb\x07?\xf8A\xc7\x993g~mj\
+j\xea\x09\x06\xf4(\xa8\x1c\x80\x02\xd0q\xfe\x0e\x8c\x14\
+ l\x83\xbam/\x90\xfd\xd8\xba\xfc\x08\xb0\x85\x03\xf8\
+!@\xbb\xef\x9b\xdc\xc1\xe00\xb6\xe6\x126#\xa6\xc5\
+\xe2A\xdd\x1b\xdc\x819\xc5(+\x9bOtvv\xfe\
+\x1a\xf6\x06}\x01\xfb\xc4\x9e?\x0a\x88\xf0\xf3f\xf5\xf8\
+\xb7b\xf5\x9b6m\xea`\xc5\xea\xd7\x99\x82^`\xa0\
+\xc7EY\xe3\x03\xadkJ\xb7=\x07\xbf\x82\xb2\xcdW\
+\xefe\xbe\x0f\x11 \x08\x00\xaa\xf5\xe3\x14\xab}\xdf\x8f\
+;\x98\x88\xa8\x91\xa1\xce:J\x1d\x08\xa69\x03~^\
+\xd8\xbd{\xf7\xafc\xaf\xd83\xf6\x8e3\xf8y\x22\xc1\
+\xcf\x13\xfbn\xfb\xde\xf7\xbe\xa7\x90\xe0\xd0\xa1C\xff$\
+\x10\x08<\xcb\xdax\x06\xd4\xce\xecS\xf1t\xb0w\x93\
+\xed\xca\x81\xafF\xe1kq\x00A\x00\xbcB\xfb\x07\xcb\
+\xc6\x0f\xdekw\xef\xd5\xee\xebE\x0cS\xef\xd0\xd8\xd0\
+0\xb9\x02\x8b\x8aL0\x18|\x16{\xc6\xdeq\x06\x22\
+\x16\xfe\xbbF\x00\xc1r\xde\xb4b\xf7\xd0\x96\x99-\xfe\
+2\xb3\xc7\x8d\xcc\xde\x838\x1c\xb0y\x03\xe8`\xa7\xb6\
+\x17\xf0kQ\xe8z\x90C\xee\x05E\x0ef\xa0(\x86\
+kq\x81\xb5.\x1fd\xb0M\x11\x01\x9dA\xccLF\
+\x84\xe0\xe2\xe2\xe2F\x9c\x01\xce\x02g\x82\xb3\xf9Y\x8b\
+\x85\x9f\xa9\x03\x87\xcd\xa3\xdb\xbf\xfd\xedowl\xdb\xb6\
+\xedvf\xef_dj\x1f\x03\x15\xe2\xe2\xc3\xa9ie\
+\xce\x11\xf2m\x0ev\xad\x1f?@\xf8Q)^\xfd\x10\
+@\xfe\xb6\x9e\x1fS\x04\x98\xdf7u\x05/W\xd0{\
+\xac\x89\x88c\x11\x813\xf8\x22\xce\xe4\xce;\xefTg\
+\xf4\xb3t(\xfd\xac\x1c9\xb7\x01\xcb\x7f\xf2\x93\x9ft\
+\x9c>}\xfas\xbc\xe9\x1d\x0c|\x0b\xb2\x915hW\
+\x8bo\xa7\xd0\xf9\xd9\xf0\xb7\xc2\xa6M\xa0\x9b2\x9b\x9f\
+\xad\x14\xb5j\xb5\xda\xf2}\x00\xb3R\xa9\xa8\xf7\xe5\xd5\
+\xbc\xf0\x1e\xaev\xca\xa2\xd7\xa44\x90\xc1\x14\x0d\x16\xdf\
+\xab\x01\x91\xc7V\x83\xc5\xc8\xb0\xe3\xd4\xa9S\x9f\x83\xd9\
+\x8b\xb3\xd2\x0e\xa5\x0f\x1d\x11>t\xaa\xdf\xb8q\xe3\xed\
+p\x8a<\xf5\xd4S\x1d\xbc\xd9?g\xaa\x9b\x01\x0b\xe4\
+\xcd\xdb\x06\xe0m\x93\xea\xfd\xd8\xf6j\x9a\xf9j\x8a\x9a\
+\x17\x08\xa6%\x80\x8bu\x0f%\x9b\x01\x08\xed\xfdS\x5c\
+\x81\xe5\xb4z\x0d\x85B\xeaU.\xfc.\x97|\x1e\xaf\
+\xf0\x09\x80\x93\x89\x03\xca\x8b\xb4\x1e.\xe1\xee\x19K\xe1\
+\xef(\x8f##\xd5\x0c\xce\x08g\x05k\x01g\xf7a\
+s\x83\x0f\x15\xbbx\x03\x8a\xf2'&&>\xcd\xf2\xfd\
+yq\x9a\xf0O\xcd\xab\xdc\xdd\x8aLo\x87 \xed\xa8\
+O~X+\x87\x07O\xad\x01@\xc3\xc5kS.a\
+\xb0d\xd8\xf2\x00\x22\xa8\x1b\xc0\x02\x87\xc0\xaby\x99\xef\
+\x01\xd8\xf8<\xbe\x07m\x1f\xf7\x83\xd9\x0a\xe4\xc0+\x9e\
+\xa3}\x16+\x10\xcf\xb4h\xb4\xd3\xaa\x06$\xc4\xf7p\
+Vccc\x9f\xc6\xd9\xe1\x0c\xff\xc1p\x00\x13S\xb1\
+pP>\x1f\xf0o3{\xbb\x00J\x83\xc3\x04\x1c\xd6\
+k6\xf9\xc9\xf7\xb5(~5\xe0\x9b\xf7\xc3\xe1\x03@\
+\xe0:\xa0`\x1c0\xa8\x15\xc0\x03;\xd7^\xbc\xb6\xf7\
+\xf3{\xd6jz\x02\xfe\x06\x04\xc23\xc1Y\x04\xd1\x00\
+\x5c<\xd3\xe7\x19\xb6\x81\xa8\x0dFP{aa\x01\x9f\
+\xbd\x80\xb3\x83\xef\xc0D\x82\x0f\x9a\x1b|(\xe6\x1d4\
+Z,\xb4\xbf\xbf\xffK\x8c\xcd\x11l\x9e/\xb59\xc3\
+[g{\xb5\xf2\xb5\x9c0\xed\x94<\x93\xbd\xca\xfd`\
+JJP\x07@\x07\xa5\x02\xe0^\x80\x82B\xc1\x99\xbc\
+\x96\x80\x17\x91\xda!\x87\x9f\x12\xe8\x155@\x08 \x99\
+ \x03\x10\xd0\x5c\x8bX<\xf87\xaf\xd9fn\xd4\xd0\
+\x08\x13\x19\x1e\x1e\xfe\x12\xce\x12g\xfaa\x98\x8b\x1f\xb8\
+c\x07\x0e\x8e3g\xce\xdc\xce\x14p'\x1f\xbc\xd2v\
+\xe1\x14\xc1\x06A\x81|\xe0\xf6j\x07\xbc\x96\xd6\xdd\x8e\
+\xd5\x0b\xb5\x83\xc5\xcbA\xe3\xd0Me\xcdO'\x80X\
+\xc0g\xf19\x93E\xaf\xa5\x87\xac\xd79\xe4uA\x83\
+\x0b@\x5c\x88\x98\xd0\x1eN\xf5w>3[#\xa3r\
+$\xe1s\x8c\x105\xfe\xcc\x9d\xac<\xdf\x8e\xb3\xfd\xa0\
+\x1dG\x1f\xa8\xa6\xaf\x81\xff\x0b\xbc\xf8\xc7y\xe1\x96\xd6\
+\xae\x1b\xc2\xea\xa1\xec`\xd3\x90\xa3\xed\xbco\xed\x94:\
+\x138^J\xc3+\x10\x0d\x80\x04\xd5{Y\xadG\xee\
+\xae\x00\x14\x0e\x1d\x88#H\xb4\x9a>r\xab~\x87v\
+\x8a(\xfe\x8dg\xea\x90\xb5\xe2P\xda\x22\xb1\xb5\xb3J\
+\x89K\xec\x05g\x893\xc5\xd9\xe2\x8c?H\x0b\xe1\x03\
+\xc1\x22D\xba\x10\xec`3\xe6\xd3\xbcP({6S\
+\x96\xe2\xf1\xfa@\xe5U\xc9Fl\xb4]\xb0\xc6\x8f\xca\
+\xbc\x9f1\x81)\x07\x07\xc0kG\xd2\x0a\xd6\xecG\xa1\
+\x02l\xfc@\x0f\x80\xbc6\xbd\x84k\xc5\x15\xd6\xe3\x10\
+\xf2\xfb\xbc\x9f\xbf\x00\xeb\x862:;;\xab8\x91\x98\
+\x8a \x14|][\x09\xb8\xe1\xf38c\x9c5\xce\xfc\
+\xe7\xce\x01\xc4\xd4\xc3\x82N\x9e<\xf9K\xbc\xf8-`\
+m\xbcp\xcbQ\xf2[\x9d:\xb2i\xc8@\xd3\x07\xef\
+\xe7\xdb_\x8d\xad\xe2\x072^\xe4;\xfe\xed\xe5\x12\xeb\
+\xa1b\xafC\xc8|\x8e\x1f\xe2\xad\xd7\x19u\xabb\x0c\
+b\x08H\x0c\xe2\x10.\x86\xf7tpI\x05\xc1\xf8l\
+-\x98\xa6|\xb6[\x18\x09~I\xa2\x8b\xef\x97\x0b\xbc\
+_\xb7\xeem\x1a\xf8\x9ff\xd6\xf5*\x00k\xe9\x1f\xa1\
+|?\xf6\x8d\xf7\xccd\x0c\x93\xa2\xbdr\xd8\x0bx\xbc\
+\x8a\xc9%\x14\xef'\x1e\xd6\x92\xd9&\xa7\x00\xa5\xe1~\
+8t\xef\xb3\xd6\xa2\xfe\xf5 n;d\x14\x0e\x84\xfd\
+@\xe9\x93g\x8a8\x03w3\xf2\x1a,^\x9f\x05\xe4\
+\xe0\xef\xbd\xea\xe5\x04\xef\x15\x11\xde\x17\xf6@\x1e\xf1B\
+>\xc9\x8b|\x0e\x14\xa4\x17\xeb\x1b\x97\xf73\xd5$\xbe\
+\xdf\x8e\xcd\xfbQ\xbd\x84\x875{\x5c\x95{\xacfN\
+\xfaE\x06\xb1\x16?1\xb0\x1eW\xf1j\xcf\xf1\xf3\x14\
+\xca\xfd\x04\xf9DY\x95\xbd\xe2wp\x05\xbdW\xf7L\
+\xa1\x1b\xc0o\x813g\xc2\xfb\xa4\x8e*\xfe\xec8\x80\
+`\x1a\x9b%\xb7\xb3f\xda\xc1\x0bzHS\x8f\x10\x7f\
+\x0b\xe5\xfbQ\x9c\xc9\xfaL\x0d\xbc\x9d\xbc\x96\xc8\x9d\xa9\
+\xac\xad&:n%\x82\xe7'\x06L`\xfb\x01\x1c\xeb\
+\x06\xbb\x06\x07\x92\xcc$P&\x90\xc8\xef\xc2\x9a\xf1y\
+\x5c^\xae\x22\x11Is-\x82\x94\xf8\xb7\xdc_\xac'\
+\x88\x03&\x04\x0b\xe7\xc6\xff~\x080\x00,\xde+\x17\
+x\xaf\xc0Wl\x87\x0f\xe2ox\xf1\x15\x00\x1fz\x9e\
+\x995\xb3\x9a\x22dn\x16\x96\x026hR\x80\xf7\x15\
+,\x12\xc0\xf7R\xbd\x9f\xa3f\xbd\x1eDs\x8dB\x91\
+8T\xb1 \xcc\xbfc\x8d\x00\x22\xa8\x11\xeb\x10\xf7/\
+\x10\x06\xefI`\xc7L,\xc5\xefr\x89\x13J\x5c\xc7\
+\xb8\xb0'\x91\xf9\x22\xca\xfcR\xd7\x84\xf3\xe1\xfb\xe2G\
+\xd1\xd6\x81\xc5\xe7\x06\xca\xf9\x1b\x13&\xb7\x8a\x04\xef\x09\
+\xf8\xf0N\xdd\xb8q\xe3\x0b\x8c\xdd\x15m\xb6\xd8\xeb\x89\
+\xe2\xb5C\x02\x00\x1fH \xce\x11\xe1\x04\xf8\x1d\x1b\xf7\
+*\x8c\xab)w\xeb\x09\x14\xb5[\x07\x9e\x03\xddD\xa8\
+\x5c\x9c7\x02<IG\x93u\xde\x8aB(\xcf\xc1^\
+q\x0f \x0eX9\xb4\x7f\xe1l\x82\xe0^\xbdH^\
+\x81Hp\x14i\xc4\xb0\xc1\x15\xf8>\x95\xfe\xfe\xfe/\
+\x00&\xef\x05\x09n\x95\x03\xa8\x9c\xbd\xe1\xe1\xe1\xcf3\
+\xf6.\x02\x83\x1d\x0b\xafaF\xbaV\xf5\xe8\xb53\xc9\
+\x04\x09\x80\xed\xa6\xbc\x07E\xaeF\xf5\xb7\x1a7hg\
+N\xca\x1a\xe0\x86\x15\x8a\xc5+\x00#\x08\xb9\x1e\x87\x94\
+\xd5h\x1b\x09\x5c\xb1F\x9c\x9f\xa4\xa5\x0bW1\xf2\x22\
+|\x95`|\x96?#&b\x03\x9c\x84\xcfhqd\
+d\xe4\xf3\x02\xa3\x0f\x9c\x03\x88\x97\xef\xee\xbb\xef\xeex\
+\xed\xb5\xd7>\xc1\xd4qJk\xadu\xbfH\xdezc\
+\xf6^,\x07\xd0q\x00\xda\xf9\xe1\x22\xc3z\x0es=\
+To\xde\xcbt\x1d\x8b\x8e\x01\x00\xcc\xcd\xcd\xa95\x98\
+\xb2\xda'[\xb8y\x9fz\xc3\x01\xba\xbel2\x90\xa3\
+\xd1\xca\xce\xf1;>/\x08e&\xa5\x0a\xd7\x91@\x95\
+\x89\xfc^\xcb\x08H\x09N \x1eC|\x96\xefw\xea\
+\xf5\xd7_\xff\x84dY\xad\x97\x0b\xac\xdb\xd6\xff\xfe\xf7\
+\xbf\x7f\xdb\x93O>\xd91??\xff$\x16\xce\x0f\xaf\
+\xfbi\xfa\xb7\x92>\xe5\xa7\xf8\x80*\xc6\xc6\xc6\xd4\xab\
+\x1f\x92\xac\xd7&_+<,\xf7\x16\xc0\xeb\x10\xb5\x1b\
+8\x925\xf9e\x0aY\x1a\x98~\xcf\xe7Sq\x01\xdf\
+\xee\xa7\x01O(\xc3\x0e\xcf\x050\xbd\x01&\xfc[\x1c\
+f:\xb1t\x85\xd5\xa2\x91@Y\x06HK\x06\x12\x04\
+\x83\xc1'\x01#\xc0j\xbd>\x82ua\xc9\x86\x0d\x1b\
+n{\xe6\x99g:x1\x7f\xca2\xb2\xae5~3\
+\xb9a]T\xb9\x1e]@\xa7U+*\x14\xc5P(\
+f=\xf1\x83v\xb6\xbfW|H\x10\xc8\x14;ro\
+Q\xccZ\x9ei\xd9-\x80\xc5]j\x85\x0a\x85.\xce\
+S\xf8j\x80\x12\x83\xac't\x07hz\xd7(\xff;\
+B\xb9\xb94\x05\xf9o\xc5h\x9e2\x93IJ\x0e1\
+E\xc7\x8bT\x8ei+\x86\xef\x10A\x0e\x80\xca\x7fl\
+Z\x1e\xde\xa0\x96\xc46\xc49\xe4A\x02[s+\x1b\
+\x96\x01s\x8f:\xff\xfe\xa7\x80\x15`\xf6\x81p\x008\
+\x1aP\x03w\xfe\xfc\xf9\xcf0\x85\x0ci\x96\xd5\xf0\x02\
+\xffV\x94!S\x0b7\x832^\x1d@\xb2u\xfc\xe4\
+\xf5z\x12D\xfc\xa8^\x9cPBY^K@LB\
+3Bh\xe3\xfbv\x93\xa2c\xbd!Z\xba0O\x91\
+\xebA\x1a\xf8\xd1\x15\x9a\xd9;F\xb3\xfbFij\xc7\
+0\x05\xcf\xcfQ\xb4'H\xa9\xf1\x04-\x9d\x9bS\xc8\
+\x10\xeb\x0dR\xf8Z\x80\xa2\xddK4\xb5k\x982c\
+\x09\x8aO\x22\xf1$\xe2\x22\x93:\x8bF\xab\x0ea\x9e\
+\x158\x95\xb6\x04Z\xdc\xd8@\x02\xcd\xb1\x1a\x1aI\x86\
+\x00+\xc0l=\xee\xe2uQ\xff[o\xbd\xd5\xc17\
+\x7f\x0d\xd8\x06\xc4\x873\xc2\xab\xf1\xdfj\xbe\x9e)G\
+E\x01\xf4\xfa\x03\xda\xbd\xbf\x96\x9b\xb7]\xe4O\xcc)\
+(N\xedDKK\x80(_P\xc0WQ\x19\x96\xdd\
+\xb1\x1b!\xca\x8c\xc7)\xca\x80\x0f_Y\xa4\xd4H\x8c\
+j\xa5f:\x19>S\xaf\xd6\x99\xea\x0b\x94[HS\
+z\x22A\xd9\xe9\x14\xe5\x03Y*\xa7JT\xc9\x94\xf9\
+ZV\xdca\x8a\x11f\xfc\xe4\x10\xcd\xee\x1f\xe7\xcff\
+\xa8\x92[n\x11#.\xd71\x90\x17\xc4\xa0-\x81\x16\
+\xc5\x94\x91\x03\x9c\x00\xdax\x0d\xebfk\xe55\xc0l\
+=\x5c`-\xb3O\x99|\x8ce\xbf\xcb\x0f(0v\
+5\x0cg\xcf{2\x85\xfc\xa8Yd\xa1\x9f[\xd8\xe4\
+\x04~:\xc1z\xf4\x0b\xfc\xc06\x07\xf0\xbda_\xaf\
+U\xe1R\x16\x03?\x9evR\xc6\x97\x13%\x05\xec\x85\
+cSTX\xcaRf&\xa5^\x1b\x0cl(}+\
+\x14@j\x8a\x0c\x00\x1e\x00\xcfL\xb1\x18\x18\x8eRr\
+4FY\xfe~6\x94\xa5\x85\xe1Y\xf57\xbc7\xb5\
+s\x88\x16ONS)\x92o\x22p\xc3\xf2\xdd\x8b\xe8\
+-f\x0cD{2U\x9e!s\xb8\x02s\xb1\xdfE\
+F\x11`\xb8\x9a.\xb0\xaa\xe2w\xcf=\xf7\xc0\xcf\xff\
+\x8b|\xf3n\xed\x97n\x98>\xfe\xf7k\x82\x89\x1f\xbc\
+\xc5\xce\xf7q\x06-/WZX\xf6Z\x8a\xa1Wc\
+\x97h\x9f\xc8\xd0v\x1eD\xaf)7?0G\xb1\xe1\
+\x10\xcd\x1f\x18\xa7\xd4(\xb3\xd7|E\x01\xb2\x9c(:\
+\x80\xd7\x9f]a\x19(%\xb1\xa1\xc4F\xcb\xc9\xf0\x96\
++\xd9eZN\x96)5\x99\xa0\xb9\x1eF\xa8\xb9,\
+\xe5g\x99[\x8c\xb0\xe9yi\x91\x82\x9ds4\xcb\xcf\
+\xab\x15\xab\xcdz\x85\xc6J\xe7\x10\xce\x02\xdc\xd1P\x96\
+m\x1d\x11U\xa6!_\xdd\x80\x1d`\xb8\x9aB\xb8j\
+f\x0f\xbe4;;{\xa7\xae\xd0\xb1\xcc<\xfd\xf7\xc3\
+\xfa\x85}A\xd1\x92\xb4\xec\x15@\xc1\xbf\xd5g\x91;\
+\x001\xe1\xb0oP\xb2C\xa9\xf5U\x11@\xa8Y\x5c\
+\xb4k!\x8d\xd7\xefo3\x1b\x9e\xdc=LSW&\
+\x14\xdb\xce\x02H\xcc\xfe\xaby\xcdA<\x8a\xa97\xa3\
+\xc8\x09\x8c8kX./S\xb9T\xa6B\x8e\xb9J\
+\x22N\xc9L\x92\xa2\xc9(M\xcfNSt)B\x81\
+\x89\x05Z\x1aZ\xa0\xc4T\x94\x16/\xcf\xd0\xf4\xfeQ\
+\x1a\xf8I7\xcd\x1d\x980,\x87F\xcb\xbe\xccd\x16\
+)oc\xee\x86Rx\x84\x8f-\x9c\xd3\xe2\xe2\xe2\x9d\
+\x9a\x98o[7\x07\xd06\xff\xed\x7f\xff\xf7\x7f\xdfq\
+\xf0\xe0\xc1;\x98\xf2\x17\xb5\x1f\xba\xb1\xda\xe1\xadW1\
+3\xe5\xbeD\xe0\x9a\x07i\xe1d\xf9\xe0\x1c\xc5\xcba\
+\xa7NY\xaeP~\x12QD'\xcbH}\xce\xc2g\
+m\xcb\xbd\xccC\xf2P\xc8:C\xce\xb6\xba\xe7\xc2\xd1\
+I\x06|\x85\x92\xd1$-v\xcfQ)\x9c\xd7\x14\xed\
+\x9fbn\x9a}\x10W\xa6\x17Q2\x8d\xb1\x1e\x00\x06\
+\xdc\x14\xa64\x9b\xd4N\x9c\xa0T\xa4B\xc9\xd1\xf6\xa3\
+\xb1\x08EbQ\x1a9;H\xd7\x9e\xbb@c\xdb\x06\
+(7\x9fv\x11\xca\x8fX\x80\x00\xe2\xc1\x04Q1\xd2\
+\xab\xf4;\xfe\xf7\xe2\x91#G\xee\x00,\x01S?.\
+\xe0\x8b\x15\xf7\xdf\x7f\xbf\xb2\xf9\xa7\xa7\xa7\x1f\xd1\x11\xb2\
+\xb5\x1d>\xf6\xfal~\xc1^\x1cJ.\x97\xd7lN\
+\x03P+\x5c.\xd0-\xa6\xf2R\x88\xec\xec(\xd9U\
+^\x87\xa2\xfa\x1a\xa5\x92L\xd5\xf1\x18\x9b\x22\xfa\xb3\xb6\
+\xc8L\x87[\xc0K\xa6\x80_(\xaa\x0f\xb8\xc1\x9d\xc6\
+\xca\xcc\xa0\x86\xb2\xdb\xb5]/\x91\xc1\x9baZbm\
+\x1e\xca[\x96Y~pn\x89\xaa\xf5\xea\xaa\x81\x22\xbc\
+\x8f\xb3\xc2s%\x09\x14\xc8\x07V\xed\xf5$\x0a\x92\xe0\
+\x0c\x8c\xc3r\xf5\x87j\xb5Fur\x92Y\x07\xb7_\
+\xa7\x81\x9d\xbd4\xb9\x7f\x98\x7f/\xb9\x88\xe0\x15e\x9a\
+\xed\xab?\xf3\xb3\xed`0X\x87\xab\x99\xb9\xc0#\x80\
+%`\xban\x0e\x80\x9c\xf4\xad[\xb7\xfe\x0acQ\x00\
+\xd9(\xe2\xee]\x95\x82\xc8^W\xf2fk\x04\xcca\
+\xa5\x8a\x8a\x9d3\xe0\x93I\x93\x9d\x19\x22;~\x99\xec\
+\x99\xd7\xc9^\xd8\xc9\xd7v\xb2\xc7\x9f!\x8b_\xad\xc0\
+n\xb2\xf9\xca\x8c\xbe\xc9\xf6\xf5>j${\xd9.\x81\
+\x88\xaa\xa9:q\xc00\xce\x07\x9b\xcf\x17n1U\xc3\
+b\xf3\x86o\x95+\xd3\xf8\xeb7(~3DY\xd6\
+\xe4\xa1\x91\x17\x98Bc\xd1\x98\xaf\x02+\x80G\xb2\x86\
+\xb8\x8eM\x9f~\xbb\xb40\x89>z\xc3\xcc\x8a\xcb\xe0\
+;\x0d1[-J\xb15\x11\xec^\xa0\x9b{\xaf\xd3\
+\xd2\xec\x12U\xac\xaa\x12\x09b:\x0a\x82\x01\x01\xb0\x16\
+p\x83\xb9\xb99$\x96\xc2?\x10\xd8\xbe}\xfb\xaf\x00\
+\xa6kr\x00\xf9\x00\xb4G\xc6\xe2\x87\x81\xc5f\x94\xaf\
+\x05\x98\xb6\x87\xfd\xd9\xb4\xaaVn\x86\x80u\xd6\x90\xf3\
+\x9e\xd4U\x17\xe6\x18\xb0{\x89\x96\xf6\xb3Y\xd0I\x94\
+\xba\xce\xfcl\x89\xa8^R\x8a!\x95YW(G\xc8\
+Z\x8e\xf1+SN5A\xd5\xc8eJ\x0co\xa5\xe2\
+\xc4[D\xf3o\x13en0g\x08S\xb6\xe4\x98T\
+\xe5T\x91RcqE\xc9\xd0\xe0\xa1\xc8\x01\xb0Kg\
+f\x1d{\x9d\xedy\x98k\xc9\x99\x0c\xed\xd8R\xa5\xed\
+\xafW\xe9\xf1\xbf\x8a\xd0Dg\x94\xea\x85\xe5\x16\x85T\
+\xba\x8f\x98\xc8\x8d\xc3\x96\x88\xa0X)k\xe5!\xcaw\
+\xc5$]M!mhE\xb2V\xac\xa9=D\xae\x04\
+h\xfe\xdc\x94\xe2H1\xe6\x82%\xcd\x11\xcc\xe0\x19s\
+m(\xbd\xb6\xf6\xab4tF\xf6\xc3\xb0\xe6\xfc\x02E\
++4\x7f\xf8\xfbO\x9c8\xf1\x19fOKP*t\
+j\x97mb\xa7\xf2g\xd7D\x0926f\xb7\x07\xbe\
+h\xafN\x02dV\x81]\xb1n\x06*E\xcf1u\
+\xefb\xde{\xd5\xe1\x00\x86D\xb15b\xb9\x05\xf8Z\
+<X\xfaq\x95\x1a\xdf34O\xa5t?\x95\xe7\xf7\
+P\xee\xc6S\x94\xee\xeb\xa2\xe4D\x99\x82\xe7\xe6h\xee\
+\xe0(\xe5\xd9d\x8b\xf5\x85\x1csl2\xa9\xec\xf9\xd8\
+\xf5\x90r\xd8\xc0\xf4\x1a\xdc\xdcEO|a\x98~\xf8\
+\xaf\xae\xd0O\xefb\xd1QR\x9e\xae\x16\xed\xdbL\xdc\
+\x10\xa7\x95\x19\xaf\xf0\xb3.\xbc!g/1x\xc3\xcf\
+m\xfd\x12\xbc\xd3J\xaeBE\xd6C\xa2W\x97\x94\xb5\
+\x003U\x85\x95S\xe9\x96\xfb\x89>\xc0\xeb\xb2\x19\x11\
+,&6\x9b\xdf[b\x8b\xe03\x88\x13x-\x02/\
+K\xb8}\xe3\xc6\x8d\x1d\xe3\xe3\xe3w\xe9\x12'h\xfe\
+VS^:\xac\x1aJ\xc9\xec\xdeQ\x07\xf3\xc4\x0e\xb6\
+\x0d7m\x1b\xad\x1c\x0aJ,\x1aQ\xc0S\xd4\x15\xef\
+\x22kq7S\xee \xb3\xbc\x0a5\x9b\xb14\x94\xfc\
+'\xc5Y\xb4E\xa0t\x84\x86\xab\xe8AlX\xf5\x1a\
+\x9e\xae>6tt\x94n\x1c\x1c\xa4\xc2\xe8UJ\xec\
+\xb9\x8f\xf2\x03'\x95\x9d^c\xa5\xdd\xaa\xd5\x95\xc3\xa6\
+\x9c,R\x91\xedl\xd8\xf1\x99\xe9$\xa5'\x98#\x0c\
+\xc5\xa8\x12\xcb\xd2|_\x9a\xbe\xfeGI\x9a\x1c\xa9+\
+\x14\xab\xd7d?M\xe4\x05\xf0Aa8h\x1d\x09]\
+3L\xed'\x0a\xe5~\xde\x04\x97vy\x88\xe2c\x80\
+\x09\x99\x99q\xfc\x09\x8bG\xa7\x15<$W\xc2L\x8a\
+\x95<\x03\xe4\x112\x97Q5\x98,\x12\xee\x02l\x19\
+\xf8\xb7\xfbr\x00\xa1\xfe\xfd\xfb\xf7\x7f\x8a\xbf\xdc\x0f\xcf\
+\x924fh\xc9\xb0\x85]\xcd\x87\x07o\x18(\x0a\xf6\
+\xaa\xdd&w\xcf\x8b\xfd1\xd6n\x0b\xc5e\xb2+I\
+j\xcclq\xe4{\xbd\xe8\x01\xbc\xa5.\x17\x91\x9c^\
+,\xce=M\x8e\xa3y\x04\xcc\xb2\xe4x\x94\xa6N\x0e\
+S\xb0\x7f\x91\x02sq\xca-\xb2\xc2\xd4\xf7\x0e\x95n\
+\xbcI\xc9\x9bc,&R,\x0abJ\x96b\xcd\xe5\
+X\x91\x96\xd3eu?\xbbi\xa2\xd3\xe8\x18\x1c@\xa6\
+5\xd0\x04,8\x00\x0e\x9b\x95*u\xb8fO\x01?\
+\x17\xb5_m\xa0\x9c\x8b\xc9\x0dE\xac\x98^N\xbf\x88\
+\xa9\x1b,c\x04\x06\x01\xa6\x19\x06\x0b\xc7&\xf9\xfc\x1c\
+\x85:\xb0\x18p\x03K\xe2\xf8\xe2\xf5\xda,\xa6\xeah\
+\x85\xc7\x5c\xab\x9f\xb9\xc0\xa7\xa4\xb6\xc0\x0f\x01>\x06\xd9\
+\xbfs\xe7\xce?D?\x1e\xc6\x1c\xb4F\xb3\xb4\x0f\xc0\
+\xbd1\xdc\x99\x13\xef\x0e(\xd7e\x85\x0f\x11\xben\xbc\
+\xe7.\xd6j\xe5\x00M\xa5\x87m\xfeH\x9c\xa9\xb1H\
+\xd6\xcc\xabL\xf9\xbb\x18\xde\x15\x07\xd8\xda\xec\xd3\xfc\x1e\
+(\xb7z~}\xc3R\x887\xbd{\x84fv\x8e\xd0\
+\xf4\x991\x0a\xdc\x5c\xa0<\xcb\xf2p\xef\x02\xdb\xee\xb3\
+\xb44\xc2:\xc2\xecYjL\xbe\xccR%\xaa\x01\xdd\
+\xfc\xbf\xe9\xc8qX\xbd\x08\x97\x95\x0a\x9bX\x15\xd2P\
+J\xb2\x80\xfc(\xd6\xaf4\xbd]y:\x94a\x1d\xca\
+]\x11\xaf\xf0\xf5k\x80\xeb\xf1+\xbc\x90\xf9@\x86B\
+\x97\x16h\xfe\xc24\xa5\xf3i\xaaV\x1c7\xb1\x84\x97\
+\x1d\x82SM\xb4\xac@ \x80\xbe\x04U&\xee?\xbc\
+\xf7\xde{\x81\x00\x1f[\x81\x00\xa8\xe3\xdb\xb4i\xd3m\
+\xbc\xb9-R\xaf\xaf3NTEO<\x16\xa7\x22\x03\
+\xb1\xc0r(=\x1cw\x02$0Y\x98\xb5\xc2\xe7]\
+N\x97\x5cq`[\x9e\xc5\xabl\x96\x18k\xd3L\xfd\
+\xa1\x03\xd4\x88_q\x80\xa0\x81\xdf\x04\xbc\x06\xcd\x8a\x03\
+\xb0\xdd\xd8\xbbj\xee4\x18\xa5\xc1\x9f^\xa3\xa5S\xac\
+\xcc\xddd\x8a\x5c\x08)w-\xd8\xbc\xddp\xcc\xc1l\
+!Mq^S-?\xc7\x8a\xe56\xb2\x8a!\x87\xb9\
+\xd4W\x9a\x84\xf2\x0c\x94.Z\xd6Jg\x92\xe9O\x10\
+\xaa\x17\x8d\xdf/ic\xad\xda\x00\xb9D!\xf6z(\
+Wkm'\xef\x17\xa39\xca\x8c'\xa8\xf7\x8d.J\
+/53\x8a\xcd\x94{\xe8p\xe8\x93\xc8\xef\xd5\xe0s\
+`\xb8n\x01\x8c\x01\xeb\x16\x04@\x16\x09z\xdb\x9d>\
+}\xfa\xb3\xfc\xe1(\x14\x08h\xff\xf2P`\x178A\
+4\x12\xa5\xfe\xd7\xbb):\x15\xa6\x1a\xcbh1U\xea\
+\x95:\xa5\xc6\xe3\xca\xef\xed\xe7g/\x95XaI\xf0\
+\xa227\xa9\xb1\xb4\x87\xdfw\xe4\xbb\xa5\x81o\xb7 \
+\x80f\xc9\xb6cY\x98\x8a'\x10\x0c!\xd5\xa1\xe7{\
+(9\xe4Pu<\x9dP6\xba|\xc7\xd5E\x10A\
+\xcb\xb1\x96\x1e\xcbP62L\xf6\xfc[dU3\xae\
+\xfe\xd0>Um%\xe5\x9b\x1183t\xbd\xd2\x91\xb5\
+v%\x91\x17\xb9\xda\xe5!\x8aV/\xbd\x08\xe4\x82\xd2\
+)\xe2 \x17\xc9\xd2\xf0\xde\x9b4\x7fdR\x99\xd3\xea\
+\x8ct\xb4S8\x81\xe62\x0dtE\x05l\xcf\x9d;\
+\xf7Y]\xbb\xa9\xfc\x02n\xd0\x07X\xc1\x1f\xf8\xaa6\
+\xfd,\xb3\x0b\x97l\xa0^\xaeS\xf0\xd2<\xa5b\xa8\
+\xa5\x0f7\x13\x1a@\xf9\xac4e&\x92*\xb2\xe5\x98\
+\x88\x0d\xbdPfE\xf1\x14\xe5\x92\xf3\x0c\x847\x94)\
+\xe7pyO\x05\x8eh\xfavk@E\xbc_\xea\xf9\
+\xa5\x1aE\xae\x06\x14\xeb\x936o\xa9d\xcau\xf6\xf8\
+E\xd0\xd0>0\xce\xa2*6v\x80\xaa\xf3\xdb\x9d\x03\
+\x86C\xa9ax\x1b}\xccU\x00_\xb7r\xf1\x95\xf7\
+\x12]\x84\xfc\xf5C\x02?\x0a6\x01,\xeb\x95\xc4\x0e\
+\xe1\x08\x8a\xd0tz\x98\xf4!\xf0\xf6&\x90t\xb5\xf9\
+\x85y\x0aM\x05i\xea\xed!\x8a\xdf\x08;\xfbe\xc5\
+\x17\xe7op\x02\xc4\x08\x90Jn!\xdb\x89\x91\xed\xab\
+\xda$T\xae~i\xdd\xa2\x1a22\x9b8\xc4\x18c\
+9\xae\xeefj\xb2\xd4\xf2-u\xceRz\xcc\x89\x90\
+\xd5\xd8\xfe\x12\x19\x86Ee\xb2\x19\xb6K\x8b\x94\x9dK\
+QqI{\xf8x\xc3UP\x0aSa5p\x84l\
+\x98{\x0a\x005_\xe0\xaf\xa0FK4`\xa2H\xf7\
+\x12\x9bmKl\xcb\xc7\x94\xe2Wg.\x82\xe7\x82J\
+\x5c\x8e\xd3&\x01\x04T\x9d\xe7\x83\xce\x0e\xbfB\xc5\xd0\
+U\xaa+\x17\xa2\x7f_ \xb3\x87\xa0\xb8W\xdb4\x91\
+t]\xaf8\x03]\xc9\xb3\xae>C\xa6\x22\x88W\x94\
+\xce\x8b\xbb\x18\x80\xc5\xb9\xe2\xbe~\xfd\x09Tl\x81\x11\
+\x0ff\xe0\xdc\xcc,E\x12\xac\x00_\x1d\xa7\x9e'\xce\
+S)Rh\xe6\x15\xf03p?\xe9r\xca\xcf\xb0\x98\
+\x0b\xc0*8\x84N-\x80\xb9\xe2\x00\x8f?\xfe\xb8\xea\
+\xd6\xc5\xa6\xdf\x1d\x8c}I<\xd8hl\xa4\x17\xebl\
+6\xc4\xf6g)\x96_\xc1\xd6\xc0\x9a@\x89\x116\xf1\
+b\xc9\x18\x05\x86\x16(>\xe1\xb89\x0b\xc52\xa5\xc2\
+\xd3d/ne\x16\x9c\xd7:A\xc3\x95\xb5\xa4u\x04\
+\xf2+\x02\xd5\xca l\xe0\xe0\x85\x05\xca\xce;1v\
+\x88\x1e\xd3\xff\xbd\x96\x22&.^Z\x8ePv\xec]\
+\x8a\x84C|(\xcbk%^\xfa\x9aw~v\xbeD\
+\xe6\xcc\x8c\x1d\xef\xe7\xfc\xc2\xba\xf8\x1e\x9e\x03\xd3\x12\x08\
+`\x12\x9d\x9f\xff\xc0/\x89\xb6\xce&.\xdc\xc6\x03\xaf\
+uS\xcfO/R6\x9dU\xca\xa2\xe9nF\x9d&\
+t9\xa4\xda\xf1\x99%\xa7\xa6\xa6\xee\xd0UE\x1d\xe8\
+\xbc\xfd\x09\x98\x06W\xae\x5c\xf92o\xbc\x81*\x14\xd8\
+\xfe\xae\xcd\xaa\xe5J\xf4\xda\x922\xfdV\xab\xd2\x95\xae\
+\x19\x99\x5c\x86\x91`\x9e\x02\xfd34\xb7\xc8bb\xe1\
+8\x93\xf0Q\xed\xc7\xf6\xc9\x98m\xa3\xf9\x82\x9d\xe5\x17\
+\xb3\x0a\xe8@\x18\xc4\xd1\x8b\x8c\xe5uf\xe1\xc0n\xd7\
+\x9b\xb8Fe\x90\x8bp\x95\x8c\xf2\x18.g\x03\x8c\xac\
+\x09e\x96z\x1d984Q\xcc\xd6S\xb7h\xfa8\
+@\xbd\xabU>\x9b\xb2\x1f\xc8+\xca\xa5T\x01\x999\
+\x88\xaby\x07Et@L81\x0c[\x89\xc7\xbeM\
+\x97h\xa1w\x96\x12\xd9\xa4\x1b7\x90\x1e\xca\xf0\x09L\
+LL\xd8\xb0\x08z{{\xbf\xac\x03D\x1fC\xf7\x89\
+O\xa2\x95i__\xdf+\xba2\xb5%\xd9S\xe2\xdd\
+\xe1\xcb\x8b\x0e\xf5y\x12\x15\x5cvk\x86Bm\xc7\xcc\
+\x8aMDh\xf0\xe4\x0dJ]\x7f\x86\x92\x0b\x97(\x97\
+/\xf3\xc1V[\x95\xbdJ\x965\xf4\x00\xa1\xeb\xaa8\
+|D\xdb\x07\xc0\xa7\xd8\xcc\xab\xf1\xe6\xaa\xcc\x05\x92#\
+1uo\x1c\x9e\xd9\xe1s-\xb3\xcbE:6;\xad\
+\xc5\x1dd\xe7\xa7\x94\xb8\xc8\xe5\x1cy\x0b\xb9+,\x5c\
+X\xb0\xb7Dl\xb5\xaa`?q\xe0\x17*\x16\xc5\x0e\
+\xcf\xd0\x89\xb5\xeez\xf1\xbb\xec\xc9\xaf4\xcd\x9bd*\
+\x5cG\x9d\xb5\xe6\xd0s\xfb\xc6in\xef8U\xed\x1a\
+\x85Ca\xa9-T{\x84E\xc7\x88]\x1f\x1e\x1e&\
+\xbe^A{}\xd6\x01>\xde\xf1w\x7f\xf7w\x1d\xc7\
+\x8f\x1f\xff\x14\xdf\xb0\x17\x0d\x0at\xe4\xaf)K\x18 \
+\xd5B\x95\x16\x8eOQ9Yr4\xf3\x86\x8f\xb3\xa7\
+%\x86\xdfP\x00\xcd#\xb3uq\x81\xaa\x97\xef\xa2|\
+d\x84\x95\xb1<SWP\xf7\xcfI;XZ\xe7E\
+\x06\x0f2u&\xb4/\xa8\xee$\x5c.\xd7\x94\xf3\x06\
+\xcf\x062!kf9QT\xeb\x01\x85z\x139W\
+\xadG\x804\xd3\xf7\xb5B\xc7\xc9\xca\x8e\x91\xa4vb\
+\xad\xd2\xd6\x15\x5cE\xa7\xbd\xf9\x9ac\xab\x95\xae{{\
+\x0f\xca\xe1\x9b\xc0\x03\x82`\xed~\x95@f\x8c\xc4\x8b\
+4\x82\x14\xb8\xa7p\x0e\xe8\x0d\xcc\xca)\xca\x5c\x0c\x81\
+\xaal\x9e-\x9e\xfe%\x1ax\xfa*U3\xcbNZ\
+[\xc4\xa9-\x94\xeac\xe6\x1a\xf5\xae\xae.\x84\x89{\
+\x01s\xf8\x04\xd4\xd0\x83m\xdb\xb6\xfdo\xfc\xc7\x94V\
+\xa8\x1a\x92\xec).HP\xdf\xec\xc1q\xe5\x8a\xf4\xe3\
+\x00\xae\x1c\x17\xf9\xde\xb0\x15\x02DX_(.3\xd0\
+\xba\xff?\xca\x0d\x5cWn\xd9\x1a+\x80\xf9\x1cd,\
+\xda\xb7\xc4(\x1c\x0cP~\xf2]\x96\xf3KJ9S\
+6n(O\x813\xb3\x8e]\x0f\xd1\xcd\xf6|r8\
+\xa6\x9eQ*7[\xba\xb4\xf3>\x9a!V\xb9\xc4\xdf\
+`GN\x91\x15\xedt\xe2\x09\x8d\xba{\xc0\xd8;\xea\
+\xf3q\xb0\xe0\x08^O\xe6Zz\x86\x090pR \
+\x12\x00&\xdf\x03\xab\xf7\xab~2\xff-\xec\xdaD(\
+|\x1e\xefIG\x11 \x80\xf4\x1fB\x11\x8b\x9au\x90\
+\xcd\xa9D\x930\x8b\x84\xde-]4\xf2V\x1f5\xd8\
+4\xc7\xe1I\x98\x18^A\xfenchh\x08{L\
+\xed\xd9\xb3\xe7\xb7\x14\x02@\x1b<u\xea\xd4\x7f\xc5\x8d\
+\x90_nv\xe6\x94+\xc6\xb2?;\x97v3a\x5c\
+\x0a\xd0^;\xc9\x9a\xb5u\x0a\x94\xd5XV\xda\x7fl\
+q\x90\xea\xa3O\x91\xdd\xfb5\xaa\xa4\xe2\x14\x1f\x8e+\
+;\xbe\xc5\xd6]\xceS~|+E\x03\xe3\xbcIf\
+\x8dl\xd7/\xf5\xcc\xab@\x8d\xb8\xed\x90XY\x8a\x15\
+[*\x8a\xd7\x93\xdd#\x96\x84\xa3c\xe8\x90sv\x84\
+\x15\xd2\x1d\xda\x11\xd5h)\xb6\x00\xb5\x98\x1c\xc1\x0c\xed\
+\xae\x96J\xe6\xe7\xe7\x17O\x9cD\x0a!\xafW\xd3\x0f\
+D\xf6kv\xed:\x9b\xc0M\xb0_\xf9\xae\xa9@J\
+\x9b[\xf7<\xf9\xbf\xf8x\x84\xae=}\x8e\x16\x06\xe7\
+\xa8T-\xbb\x0d0t\xba=&\xa4\xd4\xc19.\x5c\
+\xb8\xf0\x1f\xe1\x0f\x80\xeb\xb7\x831o\x13\xfe\x08\x843\
+s\xf0\xd5B\xf9\xbf\xf9C\x13*\x12\xa5\xec{\x83-\
+\xb9H`5\x939\xacT?Y\xd3/Re\xf4G\
+T\xba\xf1 \xd9s\xafQ#7\xe3\xb0\xf5b\x85\xd2\
+\x93\x09*\x84r\xdak\xa8\xef\xc5\x22\xa0\x11\xbfF\x95\
+j\x83r\xbc\xd8\xd9\xabS\xcc\x19\xc2\x8c\x0cl\x8a\x05\
+\x93\x14\x1d\x08\xba\xc8\x07\xb6\xe6\xa7\xa0\xb5-\xc40\xd6\
+\xa8~\xcdM\x90\x1d:fd\x145\x0bC\xcd$K\
+\xa1X\xbc\x8f\x034\x01\xbbZ\xa8\xd7\xbb.\x10\xd6\xcc\
+\xcc\x8c\xeb\x98\xf1S\xf2\xbc\xa2\x00\xf6:(\x1e\x1c\xc1\
+|\xae\xc9-\x80$X\x9bi\x1e\x02\xd9\xeb\x95\x06\x8d\
+m\xe9\xa7\xd9\x93\x93\x94\xcc\xa6(\xe1\x14\x8f\xb8\xa9\xf0\
+|\xdf\xea\xb5k\xd7`\xe5=\x89\xa6\xd5\x1d\xef\xbc\xf3\
+\xce?\xe2?\x1c\xd4\x8aO\xdd4\xffT\x92\xc1D\x5c\
+y\xdd\xdc\xc5\xdb\x1eV\x086\x0a+\xae\xce\xfc=r\
+\x96\x1a3\xaf\x92\x9d\xbcB\xa9\xa9CT\xca,\xb9\xe1\
+[\xdb=0\xd1\xe6sN$\x0f\x9b\x8a]a\xb6|\
+F!\x05\x92#\x11\xb0\x01\xd5\xe4\x0b9F\x86I\x9a\
+\x1f\x99\xa3h\xdc\x91\xd1\x08\xc6x\xa9\xc1\xaf[W\xf3\
+\xef\xb6K\xed\xea\xd3\x99a\xb2\xe6\xdf\xd5\xfb\xa9\xbb\xac\
+W)T>M\xa3\xb1\x0eP\xb1I\x89\xed:\x82z\
+\xd7!9\x03R\xec\x22.\xdav\xe5f\x92(\x82=\
+\x22\xc1\xc4\xaf7\x81\xe9\xa8\x02\x92H\x96\xb3\x88l\xfc\
+\xcc\x1f\x9e\xa4\xd9\xddc-\xcd'\xf09\xbe\xa7\xca\x14\
+\xea\xef\xefG\xa8\xf8(\x1aRvl\xde\xbc\xf9s\x8c\
+\x00#\xda\xa4\xb2\xdc\x87\xea\xd0/r\xe3\xe0{_\xa1\
+\x15\x0bU\xa9\x8b)2x\x98\xec\xe0!\xfe\xd5\x91\xdb\
+\x91x\x86\x0a\xa5\x0aTT^\xd8J\xad8;\x93\xa4\
+\xc2\x92\xa6\x0a\xb6\x02\xac\xd0A\xc5\xe6g\xf6\x8e\xba9\
+\xf25\xd6=\xd2c\x09\xb7A#\x0e\x06iN\xe2)\
+\xc3\xc6\xc0\xa6E\x83o\xd7\xae\xd5\xf9]\xeb\x00\xb1\x8b\
+\xac\x07\x9cq\xb3\x91\xf07\x00\xa8\x99l\xdah)\x0b\
+\x13\x80\xe1\x19\x00\xa2(\x8af\xdd\x9e\x97+\x98T*\
+\xfd\x90\xf0}<\xa7]v\xb3\xc9u\xc4\xcc\x93\x941\
+/\xb7\x90\xfbc=X78\x97B\xe20\xeb\x08\x85\
+4M\x9c\x1d\xa6k\x8f\x9dS)q@\x7f\xdc\x17\x9f\
+\xc5=\x99\xfd[\xa3\xa3\xa3\xd0\x1ff\xee\xbf\xff\xfe\x8f\
+\xc3\xfc\xfb]~PYS\x95m\xa6&!\xe9\x03\xae\
+W\x98a\xb6\xd6\xfe[\x15\xbf\x86\x02\xb0\x1c\xaa\xb2\x04\
+lr2xY\xdb\x87\xc9\xe7f\xf8\x9a\xec\xcev\x82\
+1@\x02$h4\xaa\x0c\xc0\xc4~\xca\x0e\x5c\xa6R\
+B\xf5\x8cV\x7fG\x16\xae\xb2<t\x80H\x0e\x1ek\
+\xc5f\xa4U\x8c\xd4\xd0\x81\xc2\xb0Y\xe1\x10-\x8a\x9a\
+X\x01\xc1\xa3deF\xd1\x92\x5c\xad\xbf\xaa3k\xcd\
+\x0a$?\xf6\xecFCu\xcf?\x11\x0fZwjA\
+\x063\xef\xd1\x1b\xef\x17\xc0b\xed&AI-\xa0\xe9\
+\xdb\x90\x94y\x9f\x0e\xa3\xael\x87\xe2*%n\xd9\x8c\
+\xd3\xa3 \x9b\xce\xd0\x8d\x1f]\xa2\xf9\xfe\x19\x8a\xa5\x1d\
+\xb3\x16k\xd6y\x0168\x00+\x82\xf5\x9e\x9e\x9e_\
+\xec`,\x15\xff\x7f\xf3\x01Z\xfb\x87\xd3ej\xc7\x10\
+\xd5\x97k\xaeBE\x9a\x8dSCo:\xd5G\xf6\xfc\
+\xb6f&\xafn\xd2h:S\xda\xf6\xcd\xb1\xa0\xf1g\
+)\xbbP\xa2l\x7f'\xe5\xce?\xa5\x02EP&\x1d\
+\xcd?\xeap\x22\xfe\x5c\xad\xda\x9aJf\x1e8\x9e#\
+5\xf7\x00\x0a\xd8\xa7\x1c\x0a\x0e\xc4]\x07s'\x0a\x1d\
+e{,\xe0f\xb2\x16\x8c\x90\xecjy\x8f^[\x5c\
+\x0a8\x81\x94x\x9e\xd42z\x0bZ\xdau\x12\x07E\
+Jb\x89(\x7f~H\x88=\x89\x83\xc9\xdb^\x07\xdf\
+\x07W\xc4\xfe\xfe\xb7\x00\x00 \x00IDAT\x94x\
+\x85\x99\x9c;\xb3g\x94\xe6P_P\xaf)\xbd\x09\xf7\
+\xc0>\xf1\x9c\xe1\xe1ak||\x1c\x1f\xfb\xe7\x1d\xcc\
+\xd2\x1e\x82\x89\xa0\xe5\x9f+\xff\x01h\xb0dd\xa0X\
+^eGb\xf7\x15\xb6\x0c\xc0\xfa\x97c\x9aC8T\
+&ro\x85\x92d\xad\xcc'Ti]\xd92\x8d\xbc\
+:D\xd9\xeb\xfb\xf8\xe4n\xa8{\xa5'b\x0a\x01\xe5\
+\x1e\xcb\x15\xa7+\xd8Z\xa5\xe2\x82\x10\xd2\x13X\xc9\xef\
+ \x8b\x8dx\x9a\xe2\xc1\x09*\x8c\xbf\xc9\xac1\xcb\x0a\
+g\xd5\xd5\xb4\xc5._\xa1\x00\xaf\xe2\xd1\xf3v\x10\x91\
+\xb2nq,\xe9\xa6\x98+\xe4\xbd\xa9c\x88\xf7\x10J\
+\xa2\xf8\x1f\xfc\xb8\x90p\x1cq0\x99\x96\x108\xa2n\
+\x17\xe3\xdc_\xa7\xea\x81s\xdf|\xaaK\x05\xe9\xccz\
+G\xe8\x01,\x06\xec\xee\xeen\x9b\x11\xf6\xcb\xa8\xf8}\
+\x1d\xd8\xd8\x9a*\xed(0\xf1\x1b!\x0a_]tX\
+g\xbd\x19fu}\xeb\x91\x93D\xc9^\xc7\xa9\xc2r\
+^\x14D\xb3\xeb\x95(Cn\xe2(5\x11A\x0a'\
+\xc0\xf2\xa3=\x11J\xdc\x9c\xa0\xea\xc4\x1bTK\xb1|\
+\x1fI8!N\xfd}\xef\x80\xa7v-[}\x9dA\
+\xbc\xaeb\xb9J\xb9\x99\x83\x94\x9d:\xc8\xc8\x00\xa5\xce\
+\xe9\xf6\x8d\xc3\x97\xc35\xb9\x8b_$\xaf]S\x08S\
+\xdc\x08+\x07\x85I\x8e\x9e\xb7[\xa9i.\xe2\xb9\xb0\
+\xe7E\xa4\x98\xcd!\xbce\xf3R\x17(N&AX\
+=w\xa0\xf9y\xdbI\xdc\xe9\xff\xd1U\xb7\x8aIq\
+Qma\x8c\x8d\x8d\xa9\xb8\x00\xef\xf7Q \xc0\x09\xaf\
+\x0bR\xcc\xbfD\x7fX\xa5\x7f\x91\xeb\xfc\xb1\x5cw-\
+!\x993\xc0\x14\x8b\x94.\xcb)\xe80e\x93\xd8\xa8\
+~\xde4\xb1YE\xa7\x00\xa5'Gx\xf3\xe9:\xe5\
+\x07/R\xfa\xe2vZ\xce\xe8|<-_e^_\
+\xbb,[_\xd7\xb4\xd4\xf2\xe3#\xe5\x10Q\xec\x94J\
+A\xc3\xef\xf5\xba\x13\xcdD\xa2\x84):$\x22\xa7\x13\
++\xdb\xe6\xf5{\xd3\xb5DQ5k\xf7\xf1}\xd1S\
+\xccZ\x01\x13\xd1d\xa0\xa5\xa9\xf8\xf9\xf9 $\x85\x0c\
+2\xdf4KM\xff\x81\xabo\xd8N\xc6\xd4\xe0\xb3=\
+\x94\x9dM\x91c\xac5]\xd1\x83\x83\x836\x9b\x82\xb8\
+\xff\xd6\x0e\xde\xf4\x0d\xb3\x16^\x80__\xae\xd3\xc2\xf1\
+i\x16\x03\x05\xed\xdc\xb14\x22h\xbb\x14\x8a\x1f\xe4\xbf\
+Q&%\x97x\xc1L\x0c\xf6\xb5\x97\xf5\xdf\x82\xe7\xe7\
+U\xa8Y\xc9\xced\x8eRg\xde\xa0Fz\xdc\xa9\xca\
+\xd5\xa6\x9ah\xea\xde\x04J\xd3\x1fa\xb7x\xfe\xa4\xca\
+\x08\x1c\x8b\xd9\xfd\xe2^\xb2\xd2\xc3NB\xaa\xba'\xb9\
+lQ\x0e\x12\x07.@\x13\xd3O*{pI\xc7/\
+i)\x8f\xcf\x9b\x0a\xa0\xac\xc5\x04\x86\x9c\x01\xceXl\
+q\xa9\xf7\x07 !\xc3\xc5\xadm\xb6\x8e\x91\xaa\x22A\
+$<G\xea\x1b%\x11\x14\xeb09\x89+\xcet&\
+\xf5\x00s\x00\xa4\xc0\x93\xe6\xeab&\xa2\xeb\xe8\x993\
+g\xf0\xf9\xf3\x1dlV\xcdy[\xb1\xa8EW\xea*\
+\x97\x1e\x0e \xd7\xc6\xd4Y\xb9\x94\xe7\x9b\xce\xbe\xceF\
+r\xa6y\xd8\x924Rw\x22u\xde\xba~\xff\xcb\xf1\
+\x03 \xaf\xb0\xa4\x1b'\xa4gsT\x5cX\xa4\xda\xf0\
+\xebTML\xeb\xcdUt\xec\xbf\xd2\xde\xef\xbf\xc24\
+m\x90[m\x12>A6R\xceU\xe0\xa4\xe1f\x04\
+\x01H\xa0\xaa\xb5F\xc5\x00Q\x04\xf0\xc2\xaa\x05@\x02\
+$\x19:!\x8d\xad\x84M\xfb\xddS:\x91\x80\xe3L\
+NN\xbaH&\x03\xb3L\xa0\x8a{\x18\x9f\x03\xfb\x16\
+\x84\x93v:&\xb2I\xea\xba\x12\xe9\xfc\xdf\xc0\xd3W\
+(\xd09\xe7\xe4t\xd4\xea\xae\xe8Ex\xb8\xab\xab\x0b\
+\xcf\x1f\x05\x02$\xcd\x94$SYI\x0cE\x94\x19&\
+mQ\x90\xc8\xa1\x9c:\x81\xbddO\xfe\xc49s\xc9\
+\xae\xd1\x00\x11\x04\xf0k\xfb\xb6\x22:\xc6\xff\xa1\xe0\x01\
+\xdeA\xb5\xa9t\x99EA\xd4\x19\xd1YNQyt\
+\x1f\x95\xe7\xfa\xa8\xca{\x0e\x85\xa3\xca\xbc\xb4\xed\x86\x9b\
+\xcd#\xf9\x86\xcd\x0b\xef;\xa9jjmU\xe6^\xd1\
+\xf3d\x87\x18\x01j%\xd7\xf3'f\xa299\xd4\x14\
+\x7f^\xc7\x8b_\xb1\x0b\x80\x03 `\x9f\x00\x928z\
+\x80\xa8\x90\xff\xf0W\x08\xa5\x03i\xf4\xc40u\x09{\
+\x97\xef\xe1>@\x18\xe9\x09(\xbe\x06\xfc\x0d\x14\x8d\xef\
+\xc0}+\xc8\x87g\x888\x11\x85[8\x02\xee\x9ba\
+30S\xca\xd2\xc4\x8e\x01\x1a\xdbr\xd3E\x0e\xe1r\
+\x08\xf9\xb3)\x08\x04\x88@\x04\x94\xbd\x915\x85}\x85\
+*M\xbe3D\xa5p3\xcb\xc4\xa1v\x86F\xaa\x9b\
+\xf9\xd4\xbc\xab`\xd9B\x81\x9a\x95\xfa\xcd\xe1i\x97'\
+7\xbdcX\x95\x5c+\xdda<A\xa5h\xc1\xf5\xde\
+Y\x95$\x95o\xbcM\xa5\x89\x0b\x14\x8d\x05\xa8\xdah\
+%\xf6\x15._\xf3'7\xc2:\x0aj\x0e\xfa\x9b\xe6\
+\xd1*\x93C\xd7\xd3\x01|=\x95\xd0\xa6\x8f\x1e\xc8\x81\
+\xfb\xcb%f\x984\x81B\x8b8\x19Y#\xbe\x01\x19\
+d\x8d{\x00\xd0x\x1fb\x02\xba\x8a\xfc( \x1b\x0d\
+*\x05\x01p/\xe8\x08\xc1\xa5 \xc5\xb2q\x1a8\xd6\
+K\xd7\x1e9\xeb\xd4Hz\xb6\x83{\xf2U\xec\xe0\xff\
+5\x80E\xa2\xf0\xe0\x82\xc9UL\x17(\xdc\xbbD\xc5\
+\x5cQ\xfdm\x19\xef/W\xa9R\x88Su~\x0f-\
+\x17\x12\xeaw\x94>\xab\xbf\xeb\x0bX\x09\xec\xc7F\xe4\
+\x9e\xe6\xdf\x9d{\xe9\xcf\xf2\xbd\x97\xae\xceS1[\xa0\
+\x02?/r3\xe8\xfe\x1di\xe4e<\xaf\xc2\xacw\
+\xfc\x04\x85.\xbc\xc6zg\x17\xd5\x0bsT-\xb2,\
+\x5c\xce\xa9\x22Jg\x90SE\x05\x9fj\xf9\x00\xd5\x22\
+Whyn/-\x07N\xd2r>\xc4{\x01\xa5\xb6\
+\xae\x01k\x92\xa4NiK\xe3\xbb\xceU\xafr\xcb}\
+\xe5\x9e\x00\x0cX\xbb$pJ2\xa7\x99\xe0)\x9f\x17\
+\xed\x1f\x1cA\xb8\x81\x88\x17\x11+b\xa9\x00\xb8\xe6\xf3\
+e\x80\x158\x84|W\xd2\xf3f\xa7girq\x8a\
+\xba\xb7_\xa6C_\xdbF]=Wh\xd0\x89\x02J\
+\xcfC{``\x00\xeb\xac\xa3\xfe_a\x83\x9bt\x18\
+\x0c\xa9<\xb3\xe9\x9e\x09\xea\xdfy]\x95*\x87\xd8d\
+\x82g/\x14aL\x9b\xeb\xa1\xd4\xd8v\xe7\xf7PX\
+\x99S2@I\x92\x16\x81\xd9\xe6\xd0%\x91\x97\x92\xd0\
+\x88\xfb\x85\x22!\x0a..\xd1\xe4\xc51\xfe=LS\
+W'hqt\x9e\x9f\x17Qkp>\xcf\xcf\x08\xf3\
+\xefl\xb6\x8d\x5c\xbaJ\xb3g\x0fSv\xe4m6\xe5\
+\xf6\xb2\xd88@\xe9\xe17(1q\x88R\xa3[y\
+M;);s\x94\xb9\xc9>\x0aM]V\xfdw\xc2\
+\x91\x04\xaf3\xa4\x92#\xc2\x91\xe6\xe0'q\x14\x81\xad\
+\x82bd\xed\xce\xda\xf4\xe7\xb0fW\xce\xe3\xdf\xcc\x9a\
+\xa3q\x95I\x14\xe6+\x12u\xc2\xd9\xcew\x83\xee>\
+q\x96\x10\x01\xde\xbdKy\xb8\xb0q\xbcB\xae\xe3\xf3\
+&k\xc7\xef@\x0c\xb9p\xaf\x1b7n\xa8\xcei\xde\
+!V\xe2\xec\x92g\x00\xc0\xf8\xfb\xe8\xc8(\xf5\x0e\xdf\
+\xa0K\xef\x9c\xa3}\x7f\xf16u^<K\xe7\xce\x9f\
+\xa7\xeb\xd7\xaf\xab\xfb!3\xa8\xbb\xbb[\xf9\x04\xa0\x03\
+4$\x0a\xd6\x92\x17\xb7\x90\xa5\xc0\xa9\x19\x95nd\xeb\
+\x9ay\xc5E\xa1\xf9't^\xbfr\xfc\xac\x9c\xd1\xe3\
+\xd7\xdcie\x06\x8d\xad\x14\xcc\xd9}\xe3l\xf2\x95)\
+5\x12w\xf2\x08,K\xebr:\xc9\x13&M\xadJ\
+\x11\x98\x81K\xacI\xb3^R/\xb0\x85\xd1`s\xae\
+\x14Vb\xc2.\xc7\xb43\xaa\xe1I.5J\xce\x8d\
+\xd4\xb3v\xc3\xa3W$\xaa\xea\xb5(\xe5\x09\xe5\xe9x\
+F~\xc6)d]\x8e\xf2{i\xd7\x99%\xcf\x95\x5c\
+\x003\xa1\x16\x978\x8b$>\x0f\x8a\x05\xa1H\xa5\x91\
+\x00T(_\xa8\x19\x9f\x03\xfb\xd7\xcd\xb8[\xc4\x80\xf8\
+\xf8e4\x0e\xee\x05?\xff\xcc\xd44\x85\x12a\xea\xdd\
+{\x95\xce\xde}\xc4M=7,\x16\x84\x85\x810\xf5\
+\x0e\xfe_\xb9E\x09\x14\xdb<\x98\xa3p\xd7\xa2\xd1\x04\
+\xd1\xb1\xab\xed\xd4\x0d6\x01/5\xfd\xeb\x1e \x9b\x0d\
+\xa0\xdby\xd5\x1c\x9b\x94T\xd7\x8d\xf0\xa5\x05'\x938\
+\x9cs\xcdM\xef\xf7\x94\x1b\x18\xbd\xf2\xad*\xd5Ku\
+JO\xa4\x94\x8e\x22\xd5d\xcd\x88\xa3\xdd\xe2\x92^+\
+f\x8f\xa4\x14\xe5\x03\xf1\x16g\xe2\x1e\x0dg\x8d6\xfa\
+\x02\xe4\x19\xe0\x89\xebl\xe0\xcf8\xfe\x8f\x0a_\x85)\
+\xb2R\xbddg\x06\x18!\x03TfV\xbc\xcc\xda*\
+\x90\x0aI\x9e\xd2W\xd8\x1c9'\x96\x828s\xa4a\
+\x95\xca\xf2e1`z/\x85\xfd\x0b\x92\x8ag\xd1d\
+\xf5r?\xfc\x0e\xb1+\x93G\xf2\xd9\x1c\xe5\xcayU\
+1u\xfd\xc1\x0b.v\x1a\x0a\xb0\x0d\xb1\xc2\xdf)B\
+\x09Lz\x11@\x99c\xac\x99O\xed\x1cV\xaeE\x07\
+\x01t0\x05\x08\x80\xda}\xe1\x00\x1e\x04\xf0k\x7f\xee\
+\x97\x14\xa9\x8a<\xd0|i\x22A\x99\xe9\x14Y5\xc7\
+<\xf3\xfb\xbc$jV\x97\xab\xba\x1epY\x15\xa2\xd4\
+\x8b\x15\x9d\xd6U7\xbe\xbbF\x92\x88\x11M\x93\xd4\xef\
+\xd6\xa6\x90\x0d\x97[(@\xa7{\x98\xe2'\xf9\x1c\x96\
+\x9d.\xe1\xa5\x8a\xba\x12\xc9\x14\x05!\x1a\xe6\x07)9\
+\x7f\x85\x12S'(2\xdb\xc7\x9c*Ms\xf3\x0b\x94\
+L\xc4U\xca\x1b\xbe\x83\xf5\xfb\xf9\x0b\x00@\xb0ma\
+\xe3@\x18\xacG\xb4\x7f|W&\x90A\x5c\x00\xc8\x12\
+\x01\xc5\xfd$\x07Q\xc2\xbd\xd2y%\xca\x16\xd3r\xbd\
+\xa2*\xa2o>\xd3\xa5L@\xd3\xb2\x81\x15\xd0\xdb\xdb\
+\xe7X\x01^?\x80\xd8\x8a\xe5x\x81.\x7f\xeb\x84\x8a\
+\xcd;=j\x9c\x90\xab\x9df\xb3\x22\xd1%\x01h\xdf\
+\xc1\xcc~\xfd\xef\xdd`\x92\xe18B\xed\xfe\xf4\xae\x11\
+\xaa\xe4+m\xfb\xf4\xaf\xa8\xa0\xb1T\x16\x81\xca\x15D\
+\xce\xa0\xf8\x0f\xda\x16exJ\xd4\xcc\x22\xd7R\x09n\
+\xdb\x88[\x92&E\xa2\x95\xe5\x02U\x82\xa7);\xb9\
+\x9fRl}$\x92i\xa5\x1b\xa0\x18&\xae4\xf9\x88\
+J(Ejy\xa9\x5cUM)\x90\xd3h%\xae\xa9\
+\x1e\x05\xb1HP)\xb0\xde\x1f\x9c3\xa8Y8\x03\x00\
+\x0a\x1d\xc4l@-?\x02\x5c\xe9? bA\xd8\xbf\
+\x98\x97f\x12\x8b\x13\xae\x8e(\x8e\xa9<\xf5\xd7\x96\xa8\
+\xef\xb1K\xae\x1b_\xce\x17\x95_\x17/^\xc0\xf3G\
+\x95'PJ\x9dM\x0e\x00\xb6\xbc\xe7\xb7^U\xb9y\
+\xea\xcb\x08Dh\x04\xb0\x19\x01\x9a\x1c`e\xd7.S\
+\xb6z\xbb|\xaa*\x1eM\x0d3\xfb\xc7ir\xdbP\
+\xb3\x09\x92\xed?w\xd7t\x05\x9b\xf1\x05\xe4\x0c\x22d\
+\x0c]\xc2\xadP\xb6\xad\x16`7\xb3\x95\x9b=\x05\xe4\
+\x98\xcb\x95:-\x85\x22\xcc\xbay\xcd\x19F\x06\x06\x5c\
+j\xa1\x8b\x95\xca\xb7)>q\x84\xe2\xd1 %\xd39\
+\x95\xc0*Z\xbe_o\x1c\xe7\xb9\x8e\xd7\xd2\xcaOQ\
+j\xee\x12\x95rq'\x9f\x91-\x85\xa41?P\xbc\
+\x89\xe2\xf01\xdb\xe0\xbb%\xf4F\xa8Yr\x1d\xc4\xc3\
+(\x88\x80\xf35\xc5\xa44\x9e\xc6$^7\x95\xffz\
+\x88nl\xba\xec\x04\x84\x8c\xdaJ\xe6:\xf6\xe93\xe7\
+p\x8f\xf3\xe8\x04rB\x0a,\x5c`\xe9\x5c\x803\x7f\
+\xbe\x9fF_\xe9s\xde\xab9\xc0\xb6\xb5\x08hr\x80\
+\x95Y\xb3\x12\x0bX\xa1\x04R+5\xc2\xd3\x88\xe6\x0d\
+\xab\x95U5<I\x1b\xcd\xe0L\xb3\x90\x14\xf9\x8a\xcd\
+43\xad\xc7X\xad-\xda\xecz\x99\x1a\x95\x0c\x03\x86\
+\xe5d\x9aekt\x9e\x82s\x834\xd0w\x85\x02\xa3\
+\xa7)?s\x98\x8aS\xdb\xa9\x128B\x8dR\x88\x1a\
+6\xb5T\x14\xbb\xdd\xba\x0cVj\xb6p3\x0b[\xd2\
+a\xd6\xd8\x07\xb7S\x22\xd0\xaf*\xa2\x11\xa7\x87Y\xdb\
+\xf0i\x07/-]$\x88\x04 \x9a\x83%L\x87\x14\
+\x94<(\x8e\xde8\x80\x84\x9e\xc5\xc1\x05\x96\xaf\x5c\xbe\
+=Kt\xe3\x89\xcb\x0a\x96f\x8f\xe1\x81\xfe\x1b\xf6`\
+\xefi\xb4\xd5\xd9\xba\x22\x1ahY\xcd\x02\xcb\xd3\xffi\
+/\x8d\xbc\xdc\xeb<\xac\xaa9\x80V\x02\x1d\x92\xaa\xeb\
+N\x1f\xad)\xd2f\xd5NK,\x80\x8c\xf4i\x96\xff\
+7\x9f\xbe\xc2\xac\xbc\xd2\xcc\xdd7|\xfa\xde\xbaxQ\
+\x8eVd\xe2Z\x0e\xe7\x80B\x09\xc5U\xe0\x05d\xaf\
+T\xcaT\xca\x84(\x17\x19\xa2\xec\xfcYF\x94NJ\
+\xcf\x9e\xa1\x0c_\xf9\xf9\xd3T\x9c\xdbO\x91\xa1\x9dT\
+\x9d\xdb\xc5P\xeb&[\xe7\x09X\xee\xc17\xdc\xca\xe4\
+vQ@\xbb\xa53XF)\x96\x00\xfa\xdc\xd40\x95\
+\x03'\xc9\xce\x0e\xc3\xa3\xd5R\x14c\x86\x84\x01\x10q\
+\x07\x9b\xf5\xfd&\xcb\x96\x22U \x8b\xa4\x86\x9b\xbd\x85\
+\xa5\x04\xcc\xcdi\x10\x0e\xd0\x1b\xa4\xdeG/\xb9\x08Q\
+f\x9173\xc7\xa6\xe5\xf0\xa0=w`#Y\xd5\xe2\
+\xa3+\xf2\x01\x5cK\x807~\xed\xde\xd3\xd4\xf9\xd5\x83\
+n#\x22Et\xe9\x1bd%\xbb\xa5y\x9do\xd5\xab\
+\x9f\x8f\xbd%'\x00\xc9\x8b\xcb5\x1a\xddr\x939@\
+\xae\xa5\x9e\xcd\xf6\x1f\xbd\xae\xd8/\x14Ao\x07oW\
+\xc3\xe5\xef'&b\x14\xe8[\xa4hp\x9eb\x81!\
+\x8aN\x9d\xa5\xf4\xfcy*$\xa6\xa9\x94O\xf0A,\
+\xab\xc0\x90\xea{\xa1\xa6\xd5CkOP6\xe7\x04\xbc\
+T\xb8\xc3S\xba\xb6Zv\x90\xc4\xd9%m\xdb)\x19\
+\xcf;\x8d\x9dR\x0e\xb0\xecL?\xd5S\x03:\x0d]\
+\xf7A\xd0~~\xb1\xe3\xcd\xd9I\xde\xa4Q\xb7\xe3Y\
+\xb1\x99M\x8d\xcf\xe2;2(\xd3\x0c\xbd;9\x01\x0e\
+\x5c\xe6\x0eOP\xf7=\x9d\xealT\xa7\xd4P\x90\xa2\
+\x89\x94=5\xd0kOl\xfb\xbe]\xab\x94\xbe\xdc\xc1\
+\x07\xfbU\xddv\xbci&\xd5\x1c\xaa[<>E\xc7\
+\xff\xdf\x9dL\xfd\xd0\xda\xb5\x8d\x1d\xbfB\xd6\xfcV\xa7\
+\x89\x83\xe4\xd9y\x80\xbcfFP]j\x0d\x17(\xde\
+\x1fi\xa95h\xd7\x5cJ\xea\xdc\xcc\xee\x5c\xe2\x87\x07\
+\x10#\xac\xfc\xc4\x12Q\x0a\x8d\xde\xa0x\xdf9\xaa&\
+\xd9Lc\xdb\x1d\xf9\x88f\xc9\xb9JB5\xcd\xdd\xb2\
+3\x98\xc2\xa9g\xa8\xb7\xa4\xb0\xb5\xeb4.6\xbd\xb8\
+u%{\xb7\xb5^\xb2\xcc\x07\x1eU\x0a\xa2\xc5z\x93\
+UI\xb7L=\x13\x8a7\xdb\xe5\x9a\x89)\x92!,\
+\xd3E\xbd\x15\xca@.X\x10p\xecxl|-\xb8\
+l\xba\xb9\xf9\x0a]\xbc\xef\x04%\x0aI\xd6C\xd8\xfc\
+\x84S/\x9a\xa6\xd1\xcb;\xac\xd8\xd5\x17\x9d\x8c \xc9\
+\x09\xd4\xc0\xb2\xcd\x9ezC\xcf]\xa7\x03\xff\xfaMV\
+\xb4\x12\x0a\xe0\xca\x0fP\x5c${|\xb3\x93\x0d\xe4\xec\
+\xc8\xd7l3-\x01og1WIA\xc5\xef\xf5%\
+\xd5\xcb\xc7\xb2\xfd\x072\x98?bKK\x8c]Q\x1d\
+\x8a%\xd4\xd4\x8c\x92*\xf9\xa2z\x90\x97Vb\xd32\
+\xcfz\x8b\xed\x86\x94W\xce\x06nh\xc5\xa8\xde\xc2B\
+\xc5\x01\xe5\x97\xf9\xa3\x8a`\xb5\xbbVB\xaf~\x85\x9c\
+n\xdaV\x9c\x95\xb5l\x9eU\xfay\xa2\xe4u\xb6\x0c\
+P\xce\x15W\x08kV\x13\x0b\x82\x9b\xdd\xd2%\xbc\xeb\
+77\xc1\x1c7\x07\x87\x8eYY\xac\x06U\xc5\x13\x94\
+\xcc&\xe9\xc2\x03'hd\xf7MB\xf9h&\x95\xa1\
+\x1c\x8b\xa8\xa9\xb9%{\xa6{\x9f\x9d\xef{\xb3\xde\xdd\
+s\xfd\x17Q\x16\xfe9~\xf0\x88N7r\x1bB\xa1\
+031\x18\xa5NV\x04\x91[\xe6\xa4|\x91\xe3\x11\
+\x0b\x1eb2\xc86\xc3\xafm\x1a@\x9b\x8boip\
+\xa8;<\xc2\xd3\x08_C%\xbf\xec(\x9e\xc6\x98u\
+3\xefN\x82\x1d0\x99\xe0\xc0\x00\xf67\xb1^\x03 \
+?NVnVU2C\x90,\xa7\x8a*\xcc\xbc\x9c\
+,\xb9\x22\xa2\x9d_\xc2\x1b\x15\xf4\x02^\xb2{\x81p\
+\xf8\x9cw\xb6\x8fW\xd4\xb5t;\x8f\xc6\x94>\x92_\
+\xbcH\x89\xa9\xd3,\x87\xf3n\xff?/\xc2\x08\x12H\
+~\xa3_\x03m\x13\x09\xb0&!2\xe1\x86R)\x84\
+x\x0et\xac\xe0\x999*T\x8a\x94N\xa6\x95\x8e2\
+\xbd\xb0d-vn\xa1\xc4\x99=3\xf7mx\xf0\xe3\
+\x1d\xef\xbe\xfb\xee?\xe2\x87\x1e\xd42\xa8.\x5c@e\
+\x041\x02\x1c\xfc\xbd\xb7i\xf2\xddA\xc7\xe1\x02\xca\xad\
+3\xd6\x07\xf6\x101'\x10\xac\xf0\xd3\xdaW\xab\xe0\x91\
+\xa4S\xb8\x9b\x97.\xf0\x02C\xf9\x96\xfc:\x09n\x88\
+{\x14\xec\x16\x00\x17M\xb9\xe5\xf0\xb1\x84b\x98\xac\xc2\
+\xbc#\xb7\x0d\xe0!\xbd\x1c\x05\xad\xcb\xa9\xd2\x0a/\xa3\
+\x1b\xe26\xd2\xb8\xccP\xb1\xc8w\x89\xe0I&\x8f\xdf\
+\xec??\xdf\x85|\x16&\xe4,\x90\xb6X\x22+\xd1\
+\xadJ\xd4\x9b\x99J\xf6\x8aTr|O\x9c>\xab\x8d\
+\xab\x01\xc1\x9aa\xf7\x95ipD=\xf7\x9f\xa3\xa1\xbd\
+7\xa8\xc4\x16P\xb9X\xc6=\xed`4^_8\xf3\
+\x94]\x99\x1b8\xba\xe9\x99\x9f4+\x83P?.\x95\
+ArPp\xb2\x9c\xff\xdaa\xba\xf4\xb7\xc7\x5cK@\
+\x1d-R\xc1\xe2]N\xd0\xd6\xd2\xbe\x00{e\x81\x83\
+\x99\xac\xe8\x1d\xac\xa4\x1c#\xa9\xb2*\x12I\x8cE)\
+\x9b\xccR\x8cYfX\xd7\xc0I.\x9d\xd7\x04ka\
+\xd7Xg\xad\xc8\x8a\xd6\xb0\xdbq\xc4\xed\xf0\xa5\x1bK\
+@\x7fI\xe9\xf4r\xdbKM\xc6\x9a\xcc|}\xa1x\
+\xb3\x8d}\xbbz}o\x070o\x9e\xbf\xe3\xd2\x0d1\
+\x020k_\x0eQ==\xac\xf3(\x9a\xcd+\xbc\x1d\
+C\xc4_\xe0\x9d\x1b\xe4U\xb4\xa5\xe6\xa0%\xed\xcev\
+\x1as\xc4\x17bt\xf2+{)\xccJ\xb1*\xefC\
+\x9c!\x91\xa2hh\xb6:y\xfcqf\x19\x89'\x9f\
+\xdc\xf4t\x87\x9aK\x8f\xda@]\xf5\xe2\xd4\x06\x0a\x96\
+\x95\xab\xd4\xff\xccU:\xcb\x96\x00i_\x80\x92\x8fh\
+\xe5\x1a>I\xda\xfb\xa1^\xc5 \x92\x05\xd5\x8c|{\
+/K\x85\x96Z\xb5j4sz\x9c&:Gh\xfe\
+\xe6\x0c-\x8d.\xaa\xc2\xcfZ\x9b\x8e\x9br@\x12P\
+\xb1\x85\xdbd\xc7U\xdd\xbf[\xab\xe0\xe14\xe2\xd3H\
+O%\xa9d\xb6y\xf7\x98\x99\xa2\xb8\x8a\x0f\xdeT\xd0\
+V\x9b\x02\xd6\xaeM\xbd\xf4\xf4W\x1e>\x8c\x87\x81{\
+\x16\xca\x5c\xfc\x1cs\xac\xa5\xe6g\xadV\x11`:\x86\
+$^ \xb1\x033\x97\x10\xeb5k\x03\xc5\x1f\x80F\
+\x1d\xb1L\x5c\x95\xd7]\xbe\xf3\x84\x8a\x99\xa42)J\
+B?H\xe7\xed\xc0\xc8\xe5z\xfc\xdcO\xe8\xf2\xe5\xae\
+\xffx\xff\xfd\xf7ut|\xe3\x1b\xdfP\xd5\xc1\xfc\x80\
+\x94v+\xb2i\xcd\xc7\x86\xb2pf\xa1}\x8f]T\
+\x96\x00\x5c\xc2Jn\xe1\xbc\x98\xdd\xda\x0b[y\xf1\xb5\
+\x16\x1b\xde\xaf!\xb4\x99\xc1*JT0\x10T\x05\x0b\
+\xb3\xe7\xa7(\xdc\x1b`\xc0\x14(;\x99\x5cy\xd8>\
+~}\x87\xb3\x84Y\xae6\x1c\x85\x94\x0f\xd3vEQ\
+k\x10\xc8M?'G\xf1\x84\xeb\x19=\xf6\xec\x96\xd6\
+p\xcd\xaa\x1f8Y\xa4:w\xadie\xab\xb5}\x91\
+4.\x93# g\x01\xbd\x92\xca\xb1A6\xa3\xaf;\
+\xfe\x0b\x8f\xc9'\xc1\x1co.%\xee\xa7S\xba]\x91\
+\x08\xe4\x82N$>\x17\x15~\x87r\xcaJ&\x1ah\
+\xcc\xee\x1e\xa5\xde\xc7.P\xa6\x9ce\x9d \xcb\x88\x91\
+\xb4S\xf9rc\xea\xeck\x94<\xbe#\xb5k\xf7\xc1\
+\xdf\xba\xf7\xde{:T\x7f\x80\x13'N\xb8\xfd\x01\x94\
+\x0f\x05\xb6\xb6\xf6\xf3#(t\xea\xcf\xf6\xb0i\x15r\
+\xbbk\xdb5f\x8bs\xaf\x93U\x8e\xb9\x0a\xa0_Z\
+\xb6\xb03Y\xb0\x0c\x81\xaci\xb72\xca\xce\xf3\x0c\x10\
+t\x19\x839\xa8\x02O\xb6\xe3\xdc\xb1\xc9v\x93\x1b\xcd\
+\x03Vb \xc2\xec\xba\xc4k\xc8\x0e1\x8b\xcf\xbb]\
+@Z\xc3\xb8\x9e\x14n\xed\x89D\x7f=\x88\x1d\xf1\xa9\
+\x83b@\xf9X\xab\xd8\xf4~\xb2}\xad\x1e\xc8f\xff\
+`\xd3a\xd5\x12\xd5\xe4\xb3\x8b\x05\xc6\xa9\xb8p\x82)\
+b\xd9\x9d{`*\x9a^O\xa3\xd71\x04\xb1\x22I\
+\xa1\xb0\x00$\xdb\x08g\xda\xd0\xdc\x18?\xfd\x9b\xaeP\
+\xcf\x8b\x97i\xb9Q\xa1r\xa1\xc4\xec?A\xf9B\xb6\
+>\xb4\xfb\xfb\xcc\x8e\xc6{\x8f\x9f\xea\xfc\xd4\xbd\xf7\xdc\
+\xdd\xa1:\x84\xa0[D\x7f\x7f\xff+\xba=\xac\x12\x03\
+\xa2\x07\xc0\xcd\xba\xe7\xb7_\xa3\x89\xb7\x07t\x17*'\
+\x0ckG:\x19\x93\xfb\x1c\xbb\xbaQ_\xc1\x8ap\x10\
+\x92\x1c\x22\xd1\xad\x16%\xcavZ\xc0\xa0\x16\x10cR\
+T\x09x\xbc\xe0\xdbr\xcd+[\xd1f>\x19\x9e$\
+\xbb\xb4\xe0 \x8b\xd5\x9c\x17 \xa9_\xabQ(z\xff\
+\xc7\xc7\x22\xeaP\xd2\x19\xa7\xc9\xa2\x19P\xf1\xeb\xd4\xb1\
+\xda0*\xb9\xb7\xd9\xf9\xc3\x04\xa09\x0f\x01\xbe\x86\xe2\
+\xc2)J\xcc\x9c\xa3\x8a\xe1\xe77\xab\x93\xdbU\x1c{\
+\x9bMK\xde\x81\x19lS\xc5.\x0bl\xbd\xfd\xdd!\
+\xe6\xdaN<&\x02\xbdi\xb9f/-\x8c\xd6\x83g\
+\x1e\xa3\xd1\xbe\x9eW\x1e}\xec1\xa7C\x08z\x04\xa1\
+_\xcc\xb5k\xd7\xbe\xcc\xacF\xf5\x08\x92\xb9@\x8a\x1a\
+\x99:/\x7f\xe38]\xbb\xf7\x8cr\xe04\xb4\x1e`\
+\xa5\x87\xc8\x822\xa8U\xcej\xad\xea\xda\xe7b\xafK\
+s\x03\xdf\xd9\xb8\x1a\xc1\xd0\x97\x1f\x1d\xbba\xaeIr\
+\xa8[\x83H+\xdb\xa6:\xc5\x22L\xb9\x0b\x97\xa9V\
+)\xb8\x8e\x1d[\xd7%J\x8f\x82v\xb3\x83 \x86\x92\
+\x99\x04-\x0c\xcfSd0\xcc\xfbk\xac\xf0\xc0\x01q\
+\xbdM\x9cW\x93\xf9\xd2L\xd2\x9c\x01\xb8r\xc2\xa9\xe5\
+\xd6(\xd856\xd3\x16OP80\xc5\x08\x08\x8b\xa7\
+\xb5=\x8c\x1fG\xf5\x22\x95\xe8\x18\xae\xf5\xc5pAi\
+}\x22\x1d\xa5\xe3\x7f\xb1\x93\xae\xdc}\xda\xc9y\x88'\
+(\x93f\xe2\xaaZ\xd6\xf4\xa5\xedv\xe6\xcak\x8d\x1b\
+7o~\xf9;\xdf\xd1=\x82\xd0%\x0c\x1d\xa3\xd8\xf4\
+\xb8\x83\x11 \xa9#\x83\xaaK\x98\xb8\x14\x17O\xce\xd0\
+\xe1?xGk\xd2\xb6Sj\xdf`n1\xf5\x1c\x15\
+c#\x14K0\x8b\x0f\x07I\x8f1m\xb1\xe7\x8d\x01\
+\x87\xad\xe6\x8cai\xc0\x1d\xacL\xc7\x81\x88\x12\x07\x22\
+\xbb\xcd\xf63R\x93(\xf7\xce\x87\xfb(\x16\x09\xb8u\
+\x09\x96\x8f\x8c\xf6\x9aO\x0aA\x8d\x94m5\xbb\xc7h\
+C#&\xa0\x98\x7f\xab5\xa1\xf2R\xbe\xb7\x9f`\xab\
+f\xae[\xe84\xf4L\xa4eV\xdeb\xf0\xd1\x97)\
+\xc3\x9crpp\xc0M\xf8\xf0\xfaB\xfc\x12jMW\
+2\xd6\x0a\x19\x1fa@\xa7\x96K4\xd7\x13\xa1c_\
+:H\xa9a\xc7Q\xa5t\x02&\xeah*e/\x1c\
+\xdfD\xc5\xf1\x9e\xe4\xe4\xec\xc2\x1dw\xdd\xe5\xf4\x0cn\
+\xe9\x13\x18\x08\x04\x0e\xa1\xb7,\xe0o\x06\x15\xe0P\xd9\
+\xfd\xcf^\xa6h\xb7\xd3\xa8a\xb9\xb4L\xc9t\x81\xd2\
+\xdd\x1b)=\xfa\x0e\xe5J\x15\xd6\xde[\xdb\xaey\x83\
+\x15^\xf6&\x114\xf4\x1b\x9e\xd93\xa6\xe6\xf2\xa4'\
+\xe3\xcdz@O\x1b\x1a\x97\xaauh\xb7\x91\x19\xa1\xf0\
+\xd2\xbc\x8a\xbb\xaf\xe5\xb3\xc7\xb3%_^\xc4\x90\x1c\xb4\
+\xca+0f\x015\xed\xf7\xd6\xea&?[\x5c\xd2\xca\
+\xc4\x17\xdf\xdeJp\xd6\xecZ)\xcc\x01\x1a\xd1\xf3\x8a\
+\x88\xd0\x14\x03y\x95\xa6\x9e$\x0d\xa3\xa4\xf8\x04\xc0\x96\
+\xcbL'\x87\x128\x8fQ\xb7\x10\xb1Ka\xa2+\xd7\
+i\xec??Kc\xdf\xde\xa6\xce\x0b\xd9\xc1H\x96-\
+\x14+\x14\x9a\x1d\xb2B\x9d\x9b\xacDd\xe1\xd0\x8f\x7f\
+\xfa\x5c\xc7\x06\xb6\xfeVt\x0a\xe5EH\x5c\xc0\x19\x10\
+\xd5\xb0\xa4]\x10]\xfc\xfa1:\xff\xad#\x94*\xa7\
+\x95\xad\x9e\xce\x16\xa9\x16\xbfAvp\x9f\x0e\xcbZn\
+V\x8e\xd7\xc4\xf2\xcb\xbfw\xc3\xce\x8cd\xc1\x8b\x0b\xaa\
+\x10\xb5\x10\xcc\xb9\xf3q\xa0lJ\xabX\xb7\x8b\xa8\xd8\
+\xfah\xf7V\x98\xd2\xd1\xb7d\xdbzA<K\xfc\xee\
+\xdevpf\x0d\xa4 \x81\xa4\x99\x09'\x10\x05\xcb[\
+9\xdc\xd4Er\xae\xc2\xd7\xae\xb2\xd8\xccc7s\x14\
+-\xb4\xc8/\xcd\xb3\x89\x96W\xfb\x90=H\x9cA\x5c\
+\xce\xd0\xee%\xd9\x16\x97L&\x91\x8e\xa2I\x9d$B\
+S\xe3\x14\xfe\xf2\x83\xd4\xfd\xab\x7fC\xf5\x97\xdf\xa6x\
+\xa9H\xa5|\x01\x89<v8\x99\xb5c\xfd\x87\xac\xe8\
+\xe5\x17P\x14\xab;\x85>\xe8t\x0a\x95^\xc1\xf0\x07\
+tvv~\x96\x0f,\x8a11\x80\x01\x94\x0aL\xba\
+\xca\x96\xb2\xd4\xf7\xe2\x15:\xfc\xc7[u9\x92C%\
+V5\xe7\x8cqYN:&\x9b\x04\x87<,X\xaa\
+eV\xc86\xed\x10B\xf7kt\xb9\xac\xe6\xab\xaa\x15\
+\x9c\xb7\x91\xb3D\xd0T\x9e\x9e\x9a\x9b\xce\xf7\xcaM(\
+\xd9\x8f^\x7f\xe2\x937\xc3\xac\xc2\xc6q\x90\xedb\x0c\
+f\x1d$j\xe9P\x8e\x8e\x06Uf\xb9\x9b7\xb9\xc5\
+l&i*|\xabv\x13\x13?\x89Q\xb3\x88\x82\x95\
+Fz\x98\xc2\xb1\xb4J\x1a\xf1\x9b\x85h\xee\xc9l\x05\
+c&\x86\x22\x08\x86\xa4Y@d\xf2KO\xd2\xcc\xbf\
+\xbd\x87\x92\x81\x05*\xc0\x9f\xc2\xb7\x82\x88I\x84\xe3\x8d\
+\xc9\xb7\x1f\xb1\x0b\x81\xeb\xd1\xf3\x97\xae~\xf6\x01&v\
+\xb7W\xb0\xb7[8#\xc0\x16P\x0dcw\x0d\xf9\xe3\
+\xe1P\xd8\xce\xe4\xb3,\xeb\xf3t\xea?\xec\xa1\xd0\xf9\
+\x05W\xe9P\x9b\x0e\x1fS\x16\x81\x9b!$c`<\
+\x09\x98r\x90+\x92C\xf9?5Is\xfb\x90\xdbt\
+\x1a\x95\xad\x0e\x82xD\x80d\xe9\x96\xa3de\x9d\xda\
+A\xf18\x9a\x14\x08\xbdC<\x86\xeb\x99\x18\xe6*\xbc\
+\xcbue\x22\x02!]G\x93e\xbb\x96\x81\xd9\x8b\xdf\
+LxYs\xba\xb9\xb7g!^\x13W\xa9\x94bE\
+4\x9al\xc9\x85l\xe7b^\xd1DS\x8b*D\xf9\
+2\x05\xe6r=1\xba\xf4\xbfo\xa2\xd4k\xafSA\
+\xa7\xef\x95\x8a\x05;\x9e\xce\xd9\xa9\x99\xde\xda\xcc\xce\x07\
+\xa8XB\xb7\xf0\xa7t\xb7\xf0\x07WL\x0c\xf9\x18X\
+\xc3\xf6\xed\xdb\xffpzz\xba\xca\xec\xa5\xc1\x94e\x99\
+\xe1\xdbKw\x9e\xa0\xd3\xffe\xbfc\x0d4\x1ck\x80\
+\xd0tqa\xabk\xd7\x92m\xadH\xc16;p\x9a\
+\x9d\xb2\xd4f\x91\xf6]\xaeQ\xe8\xf2\xa2\xea\x0dX\x08\
+f\x9d\x8aVj\xedHb\x1b}\x86TJvn\xca\
+u\xe4\x88wPb\xe7\xa2\xc0\xf9\x01\xdf\xaf'\xbfk\
+\x958I\xee\x0a!!\x8e\xccA\x18\x92\xcd+\x8d\x1e\
+M\x0fg\xdb\x0e\xa5\xde\xe9)&\x07\xca\x8dR66\
+K\xf1\xa4\xbf\xc9\xb9ZcJ\x13QT'\xf7J\x8e\
+.}\xfb\x18\x9d}\xe0$-ct\x16\xef\xa5\xae\xf3\
+(s\xc5\xb25{bs\xa3<w\xaaz\xf0\xe8\xc9\
+?\xbc\xe7\xee\xbb\xfd\xe7\x05@\x19D\xcf\xe0\xc3\x87\x0f\
+\x7f\x8a\xe5K?\xe6\xceIpH\x806\x7fl\x8a\xde\
+\xfd\x9f\x9eU-\xdc\x9c\x88\xa1\xf6\x04.\xeef\x8c\xbe\
+&\x83o\x8dM\xb7f\xb6x\x13\x1fZz\xdff\x97\
+UChd\x0a\xa9\xfa\xc0\x86\xa7\x07\xa0\xf3%\x07(\
+\xe5\xb0\xea\xf6eN\xdd\x06\xc5C)2\xabr\xd7\xa2\
+\xce\xb6C\xb0l\xdb\x1d\xf7ji.%\x93\xbc\xf5P\
+&\xdf\xb6-m\xcb\xcb4Wt\xaa\x95I\xa5\xa6Q\
+p?\xc5\x82\x93\x94/\x94W\xc4\x13\xd6jJ\xd9\x8c\
+e8\xef\x87\x86\x97\xe8\xf0\xbf\xdf\xa6\x9ayH~%\
+\xb2\x92\x0b,\xcaS\x81\xc9\xfa\xe4\x9e\xfbl\xab\x9a\xef\
+?y\xf2\xf4\xa7\xbe{W\x9b\x89!Z\x17P\xf3d\
+fff\xee\xd2M\x0e\x9d\x99A\x02,\xa6\xfc\xa3\xff\
+\xd76\xea}\xe4b3ML\xe5\x08\xb09\xb6\xb8\xd3\
+\xf1\x10\xba\x85\x9a\xfe\xe3\xe1Mv\xdd\xd2\x8f\x88\xdf\x9b\
+\xde3B\xd9\xf9\x8c\x1a\xab\xba\x9c\xf1\xd8\xe1\x86\x12h\
+\xa3\xef\x7fvB\xbbRa\x13\xe7\x94r\x84\x04\x09\xbf\
+\xce\x1e~@Y\xdd\xa5k\xb9\x939\xd2\x13I%\x9a\
+\xb0\x02)\xc4T\xf1v-\xff\xdb\x0dz\xf0\xed`*\
+J,\xdc\xd7\xb1\xf3\xca\xa5],\x95\xd7\xd5\xf3\xc0\xcf\
+\xba\x81\x87/\xc3\x16E\xdf\x0b]t\xfa\xbf\xed\xa3l\
+\xc1\x89\xbe\xaa\xc6\x91\xf1(UJl\xfb\xef\xdel%\
+\x86\x0f\xd1b(~\xd7F\xb6\xf6\xda\xce\x0c\xd2\x13C\
+\x15\x17\xc0\x84)\xde\xe8\x92\x9e\x18\xaa\x9a\x87\x89\xc6<\
+\xf2r\x1f\x1d\xfa7o9\x99\xb8\x0a)\x9c\x02\x0a\x8b\
+\x11\x00\xa3\xdel\xdd-\xc4\xf6\x88\x02\xd1\x05\xfc<m\
+n\xcb\x94h\x81\xf2\x0b\x19V\xc4r\x94\x9f\xcf4\xf3\
+\x0c\xc8\xf6\xb8\x9c\xeb\xca\x9fn\xd5\xf9\x00\xd4f\x1d\x96\
+/M\x97\x85c\xb5\x9b6\xden\xa8\x83;\x19\xcd\x98\
+QP\x8a\x17);\x9d\xa6\x22\xa6t\xb1\xc2Iv3\
+\xabGb\x1d\xed\x82F+[\xe9\xea\xb4\xba\xd2\x1cU\
+R#J\xfeK\xb2\x8a\x1f\xe2\xb6\xebD\x02\xf1\xa3\x0a\
+D\x92\xac\xe4.%\xe8\xc2_\x1fU\xbd\x9c\x8b\xb5\x12\
+\xc5\x221\xd5\x1b\x10'\x16\xed\xef\xb1&\xdf\xf8\x81\x9d\
+\xc9D\x96N\x9d\xee\xfc\xcc\xf7\xbew\xd7\xeaS\xc3\xcc\
+\xb9\x81\xcc\xae\x1f\xd6&aCk\x9f\xb64\x198\xf9\
+\xefwQ\x9fp\x81\x9a.\x19G\x80h\xeeM\xb0\x85\
+\x16l\xf7\xdb\x8c\xc4\xb1\xbd\x1bT]\xc9\xae\x05\x94\x1e\
+\x80to\xc5z\xeb\xad\xfepi*\x01%0\x1a\x9c\
+Q\x9e4\xa2\xd6\xceY\xe2\x22]\xcd\xa7\xbf*\x12H\
+\xa8\xb8!H\xc0\xac\xff\xca\xb8\x92\xb7f?>\x89\xc8\
+I?\x80\xb63\x8e\x04\x80\x0d\xe7\xa2\xc8q*\xa7F\
+\xd9\x02H\xad0\x9dW\xeb|\x0e\xc4\x96\xc6\x15\x88a\
+\x00Y\xc3lB\xef\xf9\xedW\x95\x19\x8ds\x98\xc5\x0c\
+\x81H\xd8N\xb3y9\x7fdS#1\xba\x8f\x95\xc4\
+\xda\xc3\xdf\xff\xfe\xbd\xab\xcf\x0d\xf4N\x0e\xdd\xb6m\x9b\
+\x9a\x1c\xaat\x01=<\x12\xbe{\xfc\xcc\xee\x1b\xa5}\
+\xbf\xb3\xc5\xe9\x1e\x02j\x91$\x8a\xe0\x115\xd5S\xa6\
+r\x90\xb5\x92\x0bH\xce\xa04|\x92\xe6\x93\xc2a\xc2\
+]\x0b\xaa5m.\x90U\xfa\xc0\xcaT+V(\x19\
+Q\x92\x8b\xd7\x190\x83ZQk\x18\x8d(\xfd\xdb\xab\
+\xb5c\xb1\xab\x89\x03qH\xa5\xb2iJ,\xc5\xd4\xb0\
+\x0c\x8c\x9e3\x1dF\xb2\x1f\xa9\xcf\x03ez\xbd\xa1\xcd\
+3\x82\xfc\xcf\x92\x15\xbb\xa4\x82Y\xe8y\x00\x0e`\xf6\
+$\xf4\xeb\x80&y\x05\x0a\xf0pf\xd5\x9am\xf0n\
+>s\x85N|q\x97\x0a\xdd\xa3_0\xba\x9e\x95\xf8\
+\xef\x13]'\x1b\x0b'\x7fh\xd7j\xc5\xc0\x8e\x1d\xbb\
+~\xe5\xbe\xfb~\xd0q\xcb\xb3\x83\xe7\xe6\xe6\x1e\xd1v\
+\xb4\xce\x13\xb0]Q\xd0\xfd\x83N\xba\xfe\xd0y\x15j\
+E+\xb2\xba\xcd\x8b\xaa\xb0\xf6~\xf3{d\xa7\x07\x9a\
+\xa3Y\xecV\xf6m\x9a\x85\xde\x96\xef\x0d-\xd3\xd1\x18\
+\x1a]\xaeP3`\xce\xfeUI\x16\x05\x1c\x5c\x82J\
+\xe99&\xf7\x01\xbe\xbf\xc3\x95\x1a\x1e_\xb9\xb7\xf0s\
+\xad\xceb\xde\x1e\x00\xe6\x1c\x00\x19\x13\x07\xaf\xa5J.\
+I\x94\x9af\xa2q\x1f\x00^\xfa\x0d\x09\xb0\xb2\xb9,\
+\xeb\xe5\x8e\xf2\xaa\xea\x02b\x17\x98\xa5,PU\x8d{\
+\x0b\xafHx\x91\x88\x9fd\xfeJ\x93h\x89\xf85\x9b\
+x\xf3\xadz\x83t\xec\x8f\xb7\xd3R\xe7\x1ce\x8a\x19\
+\xcae\x94\x82m\x07\xc7\xe6\xec\xf0\xd1'\xeb\xf1\xc5>\
+\x0a\x84\xa2\x8f\xfc\xf0\x87\x8f\xdf\xda\xec`\x99\x1e~\xe8\
+\xd0\xa1;x1\x8b\xbc\x18'k\xda\x08\xe2\xe0 v\
+~\xeeE\x8a\x1d]\xd2e\xb1\xb6#\x0aJl!\xcc\
+\xbc\xc2\xa6Z\xc2\xb1\x06\x1a\xba5\x89Ga\x12\x93\xcd\
+\xdb\x9dDe\x9eO&ir\xfb\xb0\xaaN\x82\x02&\
+\xa1ig\xe6\xb0n\x97V/\x93\x95\xe8a\xcaZ\xf6\
+\xbd\xbft\xd2\x94\x06\xd0k\xb1W?\x13K\xf2\xee\x94\
+\xa3I;s\xa0\x08c}\x10\x0bf:\xbb)\xa3-\
+=2\x1e\xadna\xa7\xa3\xd4~\xe2\xea8\xc5s\xcc\
+\x99F\xde\xa2txT\x95\x98OOO\xb9\xaed\x01\
+\xb6\x00\x5cF\xd3\x99%cn\xca\x9a\xe5\xf4Q<\xfe\
+'\xdbi\xe8\x95\xeb\x94a3\x10\x05\xa1\xcaGQ,\
+\xd3\xd4\xd6\x17\x1a\xe1s/\xdau\xab\xbex\xe4\xf0\x91\
+;\xbes\xab\xd3\xc3\xb5Y\xa8\x5c\x85\x0b\x0b\x0bw\x02\
+\xfb\x9cd!g\x94\x8c\x0a\xc1\xf2\x9a\xba\xb7]\xa4'\
+\xb6<H;\xeb\xbb\xe8p\xed\x10s\x82\x8a\x83\x04\x89\
+\xab\xaay\xa42\x09\xcd\xe1L\xd4\x9a4\xd9\xe2\x1b\xb0\
+\x9c\xb9x\x0d]\x93\x90\x1aOP\xe4\xca\x22\xb3\xcc\x9a\
+\xeb\x96\x95X\xbd\xa3|\xb2\xee\x91\x1bg\x8b \xa7K\
+\xb8\xa5\xf0\xa4\xd5\xf2\x90jZ3\x06\xb0\x9e\x08\x9f\x99\
+\xd8\xe1r\x04\xdd)\x0d\xba\x0a\xba\xa7)E\xd8j\x9f\
+\xf2\x16\xbd\x16\xa4\x99]\xa3\x148;K3\x07\xc6\xf8\
+\xf7.\xca\x07.R\x9e\x11\x01\xd9\xc1\xd2\xf1Kq\x0a\
+=\xb4\xc2[#\xb8\xa2\x1aIs\xe0\xc1g\xae\xd1\xc9\
+\xaf\xeeU\xbd\x14\x8a%\x07\x19\xcb\xd5\x86\x1d\x1c\xbad\
+\xa7/\xfe\xd0\xca\xa6\x83\x14\x0cE\xef\xdc\xb8q\x83\x82\
+e;8\xfb\xbe)s\x84\xef\xb9\xe7\x1eX\x04\xbf\xc8\
+\x8b\xec\xd6\xec\xba\xa1\xa9\xc3\xb6kl\xd7S\x92\x1ex\
+\xeb{\xf4\xf2\xbb?\xa5\xdd\xb4WM\xb1\xac\xa3#\x97\
+\xeaA\xc2\xbf\x87Ok\xab\xa0\xde\xb6[\xa8\x146\xb8\
+\xfa\x80\xde (l\xf0\xa7\xdd\x8eB\x98O\xab\xa8V\
+K#G\xa9R*.\xb6T*\xfb\x99K\x92l!\
+a\xe9v\xd9\xc1\xde\xa4K\xbf\x89`nb)\xd2\xcc\
+&\xe2\x94\x9bM\xb7p\x01\x11q\xf0i\x8c\xbf=\xa0\
+\xa6\xa8\xa9#X\xe6}\x9ex\x9e\x96\x0e\x9e#\xf4\xd5\
+F\x86P\xd4\x08\xe7\xfaE2W\xe4\x1c\xe8\xb3\x19{\
+\xa3\x9f\x8e}u\x17\xc5\xa0C\xa8\xfa\x0c\xd6\x15\x18$\
+\x91\xc0\x02e/\xfd\xa4\x11\x9b\xeb\xa3|\xa9\xda}\xf2\
+\xe4\xf1_\x04\x0c\xbd\x9a\xff\xba8\x80\x04\x89`\x11\xf0\
+\xc1\xfd.\x03\xa9\xc0\x9a{C\x99\x85\xca\xd3TW\xde\
+\x99\x13\x0b\xc7\xe8K?\xfa\x13\x8a.9\xf2\xcc\xc2\x81\
+a\xc1uV\x96\xd8*\xb0\xd3\xbaG\x0f\xdc\x93\x8f7\
+\x18.\x00\x00\x16lIDAT\xeel\x81\x95\x85\x9f\
+\xaeiX\xd7\x95?\xccj\x17\xcf\xcc\xd2\xf0\xee\x1bT\
+n\x94=\x8e\x10\x0d\x5c\x00?7i\x14\xa9\xe8\xa8\x9b\
+\x0f5KK8i\x0a\xed\xe5\x06\xde(&(\xdf\xaf\
+\xc0\xd5L~Uq\x8c`N\xf7\xe2\xd3Y\xc6\x88\x9f\
+\x84\x0b4\xf0\xe3k\xca\xb9Ez\xd0\xb5\x95\xee#J\
+\xec\xa2\x99\xbd\xc3\x94\xb8\x19\xa1j\xa3\xa2\xa8\xb7]\xd7\
+p\xaf5Q\xaf8\xf2\x1f\x91\xd9}\xffr\x0b\x05\xae\
+\xcf9\x0ap\xcd\xd1/\xe2,\xffS=\xaf[\xb9\xd1\
+\xfd\x8dL\xb1\xc2\xb0Z\xfe]\x0c\x84\x90\xf1p\xb7\xc4\
+\x01\xcck\xc3\x86\x0d\xb7\xbd\xf9\xe6\x9b\x88\x14\xbe\xa6S\
+\xa7k\xca$\xb4\x18\xf7j\xac!S\x86^\xd8\xfc4\
+]\xfc\xdaQG\x19S\xd5\xa9N/\x01\xbb8\xeft\
+\x13\xcb\xcf\xbaTJn6n+v\xcb$N[\xa7\
+\x9f\xab\xd9w\x99\x14]{\xec\xac\x8a?\xb8\xefK\x03\
+\x07\xdb\xa9Q\xa0\xecDS\xcc\xb4I\xd1\xf6N\x01\x15\
+W\xae\x9f7\xcf\x0ca\x9b\xa6j\xbb\x5c\x00\xd5S9\
+\xe4\x0c\xa4\x16\xd6?{p\x8c\x16\x8fO\xeb\xa1\x9a\xcc\
+\x11\x99\xda\xeb\x0b|>\xf9\x01\x8a\x0df(pb\x92\
+XmnA\x00?o\x9fp\x1c\xa9\xd4JO%\xe8\
+\xc8\xff\xfd.\x0d\xbfx]\x9b\xe0\x0du\x16\x99B\xd9\
+\x0e\x5c8f\xe7.>W\x8b\xc6\x95I\xfa\xda\x9bo\
+\xbe\xd1\xf1\xc0\x03\x1bn[\x0b\xbek\x22\x00+\x0f\xb7\
+a\xac\xcc\xf9\xf3\xe7?\xc3rtH\xcb\xc4\x86\x93>\
+\xde@\xc5\x18\xd5\x03\x15:\xf4\xfb\xefP\xcf\xc6s\xcd\
+R\xef\xba.&\x85\xdf~\xfc)&\x95Y\xdd\xa7\xaf\
+\xee\x9f\xb3\xa7\x22{\xcd)\x9d\x0a!X\xb6\xa1\xe0s\
+r\xfb\x90\x1a\x19g\x99%\xdf*\xae\xce\x9fM\xddT\
+\x0a\xa1m\x14\xa9\xac\x96\xba\xe5\xcdU4\xcd93\xa9\
+\xd3[o\xe7k&ZMG\x15j\x1bT$\x93\x81\
+\x82b\x17TUIB\x0d\x15{\xd8b\xb9\xa8\xeb\xf5\
+\xc6U\x82M\xcd\xae\xfbr\x80V\x04\xb3\xdc\xfad\x8c\
+\xc8=\xf8\xc7\xef\xd0\xc8K}\xcdu\xf1Y\xa6sU\
+;\xbd\xd8E\xc5\x0b\x9b\x1b\x8b\xe3*@6t\xfe\xdc\
+\xd9\xcf|\xeb[\xdfR\xb0{\xdf\x08 \x5c\xe0\x99g\
+\x9e\xe9`\xa0\xfc)\xb3\xea:\xdb\xbd\x96\xb4\x96g\x9b\
+T\xa1\xee\xd8\xeb7\xe9\xed\xcf\xfeXe\xf58\x1c\xbf\
+\xee\x98\x81\x0au\xfb\xc9\x1ey\x94\x91!\xa2\xed\xe2\xba\
+\xe2\x8b~\x94\x07\xc0K\x07l\xf1u\xa3\x82x\xea\xdd\
+!%W\xd1\xc1\xd4\xa1\x8c\xba\xc3Z\xf3\xd3j\x1a\xa9\
+T\xdf\x8a\xd7\x90\xdad\x075'\x8a\xd6]\xdb\xda\x9c\
+\x11\x845\xc0\xad\x0c\xdb\xbe\x1d\xf5\xbbu\x86\x1e\xb9\x0f\
+\xaf!8\xc1\xfc\x91\x09:\xfco\xb7Rj\x82\xf9\xe3\
+\xb53\x149\xf8*\xc5zf(tq\x81\x86_\xba\
+\xae&\x80\xabTq\xcf\xd8X\x91\xf3\xaa\xa1\x03\xa4\x1a\
+F\xc0,\xc5\xe8\xec\xb7\x0e\xd1\xd6\xdf|\x8e\xc6\xb7\xdc\
+0\x08\xacN\x99\x5c\xdeN\x87'\xa9:\xf0\xba\x9d\x8f\
+MZ\xf9\xe5Z=\x11\x8f\xfd)`\xb5q\xe3\xc6\xdb\
+\xd6\x03\xdb5? \x0a!\xeb\x02\xb7\xfd\xf0\x87?D\
+C\x89'us\xe5\xbaB\x82\x86c\x9a\x00\xf3\xfb\x7f\
+t\x85\xf6\xff\xab7(\xa3s\xfb\x1c\x16\xa5\xc5A\x84\
+\x15\xc2\xa9\xe7\x15\xd5\xda\xba\xb9\x8f\xe5\xa3\xb4\x01(\xc8\
+vuc\xfc5\xe7shw\x82\x9eE\xca\x04\x8b\x16\
+\x9a\xf3\x89J\xcca\xe0\x16\xd6Z\xbaD#\xc9\x1b\x89\
+k\x93`i\x0ee\x92\xbe\xfa\xde\x89\xa1\xbe\x5c\xc0j\
+\x8dT\x22\xa2\x09.\x10\xef\x0f\xa9\x16\xbb}O\xf6P\
+\xff\x03/\xd2\xc5\xff\xe7/h\xc7?~\x94\xb6\xfd\xcf\
+/\xd0\xeb\x9f~\x92f\x0f\x8c\xe9~\x05\xb63\xda-\
+\x97o*\x97\xd2A\x05\x11\xc9j\x9e\x06\x0f\xf7\xd1\xd1\
+?\xdfA\xc7\xd8\xdc\x9bxk\xc0\x11\x83\xaaa'S\
+~\xbeD)f\xf7\xd5\x9b\xcf\xdb\xe5\xc0\x95z,\x91\
+\xc3@\xcc'\xe1\xbf\x01\xacVS\xfcn\x99\x03\x98q\
+\x82-[\xb6|\x82\x0f\xe3\x94\xee\xb1_w3\x87\xc8\
+i/{\xecOv\xd0\xe9\xff\xbcO\xa5xI\xa9\xb2\
+p\x02\xd5[h\xee-\xa7\xbe\xd0n\xce\xec1C\xae\
+\x92\xaf\xe7\xed\x8a\xadXw(G\xd3\xbb\x86\xd5\x089\
+\x0c\x94t\xaa\x96\xf9\xf0\x92\xfd*E\xdd;\x93\x98|\
+R\xba\xfd\xd2\xba\xcc\xee^\xd2\x91\xd3\xeb\xcd[a\xea\
+\xe9\x00V\x9d\x01\x0f\x87\x15\x94\xb3\xec\x5c\x929T\x83\
+\x12\xfdK\x94\xba\xb0\x87\x16^y\x94\xf6\xff\xce\x8b\xf4\
+\xda\xa77\xd3\xe5o\x1d\xa3\xeb\x0f_\xa0^\xbe\xe4'\
+[\xccQ:\x9bv\xd9<\xf4\x82X8B\x03\xfbz\
+\xa9\xf3\xbb\x87\xe8\xfc\xd7\x8f\xd0\xe4\xdb\x83T\x8c6}\
+\x0eH\x8aIg\x0b\x94\x0aN\xd8\xcb7\xdf\xb4\xab\xa1\
+\xdez4\xa9\x94\xd5S\x80\x0d`\x04X\xad\x07\xf8\xeb\
+F\x00\x03\x11\x14[\x19\x19\x19\xf9<\x1f\xd0\xa2\x0e\xed\
+6tW\x0eE\x93y\x96\xd9g\xfe\xeb>\xba\xc8\x8b\
+W\x00R\x89\x1fu\xa7G\xaf\x8a\x06\xb1\xe96\xb3E\
+\xb5ws\x1a1\xd4[\x80o:b$\xf5I|\xf3\
+\xb8\x0f\xeco\x1cv\xa2?\xa2\xfe]\xc9\xb3\xdd\x5cg\
+\x05\x8c\x15M\xa7$\xac\xbefT\xadm\xba8s\x1d\
+\x88\x04\xe8\x00f~\x9e\xb0\xe9Vd\xb2\xd5$\x15\xa4\
+\xb5#\xb1TZ\xe8#\xc15s\xe95\xb2B\xfb(\
+?\x1fc\xa0_\xa2=\xbf\xf52]\xbd\xeb\xb4\x8a\x9f\
+\xec\xfb\x9d\xd7Y\x1c\x84\xa8\xc0\x08\x9c\x9aOR`v\
+Q\xeds\xa2k\x94\xae>w\x9eN\xfe\xd5\x1e\xba\xf4\
+\xad\xe34\xf0\xd4U\x1a~\xfe\xbaJ\xc4\xb5t\xe7\x13\
+d\xfe\xa4\xb2\x8c4\xc9\xa4\x9d<\xf2c\xaa\xcd]h\
+\xc43%\xe4\xfd-\x0e\x0f\x0f\x7f\xde\x84\xd1z\xaf[\
+\x01\xbe\xab\x0f qdpp\xf0\x0bL1\x15\x151\
+D\xb0\xc0\xe9C\xabN\x08\xca\x10b\x05\x17\xfe\xfa\x88\
+\x93\xe5+%\xe1Z\x1cX\xe9Ae\x1d4r\xa3\xea\
+\xf7T\x22\xae\x9a.\xf9Q\x9a*w\xd6]\xb2\xa5\x13\
+\x09\x8a>\xe7\x0fO(DHO\xa5)\xbf\xc0\xd6I\
+\xfc\x12\x03\xa1\xa0{\x0d6Vu\xf9\xb6+\xee\xf0r\
+\x1d\xe9\xfc)\x0d\x1a%\xb7\x11\xfa\x09D\x07\xbc}\x88\
+\x87,\x1c\x9e\xa2\xd0\x15\xb6,RQ*\xf7\xbdKv\
+\xf0\x94[\xb5\x5c`\xe55>\x14\xa5\xa5\xaey\xba\xf0\
+\x8d#\xb4\xed\xd7\x9e\xa5\x83\xffn+\x9d\xbf\xf3\xa8\xaa\
+\xbc\xde\xf9/_\xa6\x93_\xdbK\x9d\x7fq\x80.\x7f\
+\xf3\x04\x05\xcf\xce\xab\x88h~1\xa3z\xfd\xd7k\xd2\
+\x06\xa6D\xb1L\x8e\xe2\x0b!;\xdf\xf5\x1a+\xde]\
+v\xae\xc8\x0a`*Y\x19\x1e\x19\xfe\x02\xccu\xc0\xc6\
+/\xe0\xf3Ar\x00\xf5\xfa\xc0\x03\x0f(\x19\xc3\xfb\xfb\
+\x1bf\x97\x15\x9d9\xe4r\x02\x00\x1d\xcd\x1fv\xfd\xb3\
+\x97\xe9\xc2\xd7\x8f:r\xdc#\x0e\x1a\xf0\x0f\xcc\xbeH\
+\xf98\x032\x99s\xa7x*\xcd\xda\xdb\xb4R\xd7\xc8\
+\xa9\xc4N=t\x02\xb3r\x91\x98\xb2xj\x96\x0f,\
+E\x85\xa13T\xcf-\xb9>\xfa\xb6~\x7f\x9f\x8a#\
+\xb3\xc9uk\x83K\xcb\x8d4J\xf9\xb59e\x14\xc9\
+\xb1\xa9b\x86F\xf6\xdf\xa4\xae?\xff\x01M?\xf17\
+\xb4x\xe1\x04\xc5\x929\x95\xac\x8a\x86\x0c\x89dB\xd5\
+>\x06\xa6\x16)\x91OR\xe7\xd7\x0f\xd2\xf4\xd91\x95\
+Y\x1dc\xa5\xf6\xc6O/\xd3\xcc\x99\x09\xb5\x1f\xd4E\
+\x04:g\x94H\x91t9X6\x98|\x1e\x8eg\xd8\
+\xe2\xbdn\x97\xfb\xb6R#z\xb5Q(f-\x10 \
+`\x00\xb8\xbc\x17\xe0\xdf2\x02x\x90\xe0\xf6S\xa7N\
+\x01\x09\x1e\xd2U-\xee\xd8y \x81\x1a_vt\x92\
+v\xfd\xd3\x97\xe9\xd2\x9d\xc7\x95#\xc3\xa9\xd6\xad\xbb\xcd\
+\x92\x8a\xf1\x11\xca\xdex\x9c\x1aH\xeeP\xc9D\xd5\x16\
+GKKY\x95\xf6\xcc\x81\x02%f\x00D\xc3\xa1-\
+\x9de6\xda7I\x85\xe9\x1bT\xcd\xd6\xfcC\xb1d\
+\xafhV\xe5\xad\xe4\x95\xa0\x8f\x04\xa5,\xe9\x17d{\
+\xb8\x87\xc4\x0a\xd8\xd4-\xb3\x9d_\x88\x0eP\xe5\xda_\
+S\xf8\xe4I\xba\xf4\xc0e\x1a\xd9}C\x05f\x0a\xe8\
+\x0e^.*\xa7\x19\xf4\x17\x84\xb8\xbb\xbes\x92\x8a\x81\
+|S\xf7`\xa4^\x9a\x0e\xa8} )\xb5\x10\xca\xbb\
+\x19H\x0df\xf9\xc9|\x91\xa2l\x09d\xaf\x9f\xb0\xcb\
+7\xdf \xab8g\x15\xca5\x0b}\x07p\xf6'O\
+\x9eT\xb0x/\xc0\x7fO\x08`^\x98:\xce\x0b\xf8\
+$/\xe49\xb0H=uTE\x0c\x99\xda\xd5+\xbc\
+d\xc7\xbe\xb0C\xb1;\xa4]\x93\x1e?S,0;\
+K2\xa6\x17\x83d\x8f>NV\xf4\x9cv\x16\x19\xb1\
+\x03\xa3\x84\xdb\x8c\x87\x9b\xa5\xdc*\x07`\x22\xa1\xa2\x87\
+\xb1\x8b\x17(\xd97L\xa5HI\x89\x02\xb3\xef\xa1m\
+\x19\x94o\xadd\xff\xd2\x98A\x01\x17\x9f\x83\x87\x11\xc3\
+\xb0JA'\xfb\xd9\xadJj\xb8\xc9\x1d\xceLb\xd6\
+\x0f\x16\xdee\x0c\xea\xa72K\xb1\xc5#\xe3TI/\
+S\xf4\xea\x12-\x9d\x9e\xa5r\xb4\xa8\xd2\xcb`\xbd`\
+\x04\xde\x89\x7f\xb7\x8b\xe6\x0e\x8dS\x91E\x07\x5c\xc9\xb3\
+\xbbFi\xe4P?\xa5#)\xb7\x12\x0a\xcf)-\x97\
+U\xbe\xc0\xec\x89\x0b\x94\xee|\xd3\xaeM\xbc\xc5\xcf\xca\
+\xdaP\xab\x82K\xaa\x99\xd5s'N\x9c\xf8$\x8az\
+\xde\x0f\x0c\xdf\xd3\x97\x04\xd3\xe0h\xc0\x02\x98\x13|\x9a\
+\x0f\xe8U\xdd\xb1\xc2\x92N#\x8c\x00\xb6\xd3s0\xad\
+\x14C\x983\xaa\xdd\x0c\x1c\x1b\x81%UL\xe2\xe4\xc8\
+\x0f\xb1\x89\xf8,\x9bs7\x9ay\xf3p\xed\x8a\x95\xe0\
+q\x91\xca\x80f\xf4\xc5\x97\x0eXP8\x17\x8e\x8eQ\
+\xea\xd2~\xca\x8c\x8c\xb1=\x9e\xd7\x06U\xd3\xb3(\x19\
+?f\xebT\xcb\x98r&#p\x11aT\xd3\xd0f\
+\xdf \xea\xfb&\x91r7\xeb\xa6X\xb6\xe5\x02_q\
+\x07\x8c\xcb\x8b\x9cSN\x9b\xfarUQ2\xee\x81\xcc\
+\xe6x?+\x94\xf3\x19\xd5\xa4b\xf1\xc4\x14\xcd\x1f\x9f\
+\xa2s\x7fu\x88\x06~rMU*#\xb7\x00\xa6k\
+\xae\x98\xa7D:\xe9r\x84T\xae@\xa1\xb9E\xca\xf4\
+\x1d\xa7\xfc\xf9\x9f\xda\xb5\x88\xf2\xfcY\xa5\xf2\xb2\x15\x8d\
+(\x97\xfb\xab8s\x9c\xbd8{\xde\x0b\xf5\xbfo\x0e\
+ >\x02\x8d\x04\xbf\xc4\x14\xbaE\xd7\xd59\x0a\xbe\x13\
+\xdc\xb1\x85\xf5\xf7l8G;\xff\x97\x17ihG\x1f\
+U\xa8\xe6t\x0b\xd3\xed\xe7,\xb4R[\xd8A\x16\x12\
+L\xcb\x11\xb7\xbd\xbfR\x1c\x8d\xa9\xa3RQ\x04J\x94\
+\xd8;\xfa\xf0I\xc885\x12\xa6\xc5\xfd\x87(ze\
+\x80E\xc3\x02+\x8ce7\x8d\xddu%k1`\x0e\
+mv\xba\x9ai76,\x89\xc45\xb2'6\x93\x1d\
+>\xa3\x87P4\xf4\x88{\xdd\x9c\x18U\xc9\x91\xd3\xaa\
+k\xaa\x88\x18t\x22\x81\xb3\x07\x8936\xd9\xdeIn\
+jx\xc3yV\x8c\x97yM\xd9\xf9\x94\xea\x94\xe6\xe4\
+MX\x14^BS\xca4E\x98\xea\xa3cc\x94\xbb\
+\xb2\x95j\xd3{yy*\xcck\xb1\x1ed\xa1_2\
+#\xda\x16\x9c5\xce\x5cl\xfd\xf7\x0a\xfc\xf7\x8d\x00\xa6\
+\xbbX8\x01/\xf6y\xcc\xa4\xd1\xc5%\xb6N\xf5\xb2\
+E\xf9\xea~\xe6<\xed\xfc\x17/\xd1\xd0O\xbb\xb5J\
+\xc6@\x85\xe2\xa5\x95?\x15J\x9e{\x87\xecT\xaf\x1a\
+I\xd3D\x84F\x8b\xdf\xc0,\xf6T\x1e\xbdPX\xd5\
+\xc8\x81\xe9\xd8L\xc1P\x0aG_\xe9\xa2\xa9]\x93\x8c\
+\x14\x91\x96\xf1\xaan\xccB7\x84F\xd3&\xe5\xfc\xb1\
+u\x94\x11)\xeeC\x1bY4=\xd1\xec,j\x1b\xaf\
+\xcbq\x06\xfeY\x06\xfe5\xd5#\xa1\xd1\x901\xbbI\
+\x9a\xde=\xea \x97\xdbc\xd9r\x92J\xf9\xef\xe8\xb9\
+x\xea?\xedU\x9fG\xa0(9\x18c\x1b?K\xb9\
+R\x9e\x02\xe1(M\x8fNR\xee\xe6q*_\x7f\x05\
+\x8d\xa8\xf9H\xeaN\xfb\xa3l\xc6\xc6\x99\xe2lY\xe4\
+\xb6P\xfe\xfb\xbd\xde\xf7\x0d\x04\xfb\x10s\x86Np\xfa\
+\xf4\xe9_\xe0\x85>\xce&\x95\xa5\xe5tC&\x92\xe7\
+\xb29\xbbD\xac\xfd\xf6\x86h\xf7?}\x89.\xb3B\
+T\xd2N\x0eP\x9e:0r\xaag1\xe0\xd9\x9ey\
+\x8d\xa1\xc3\x88\x82\x96\xf0\xd4l\xf3j\xbbM\x1c\x1b+\
+\x10\x01\x99\xb6H\x14\xad\x14BD\xb5qJ\xde\x98\xa6\
+\xc9m\xa34\xf1\xce %\x87\x22\xde&\xaf\x0a\xa9\x22\
+\xacP\x15\xcb\x8e\x89\xdaH\xf5\xab\xe7\xda\xa1#\x8c\x84\
+\x03\xac`\x8c\xb1-\xb7\xe8\x04\x9e\x90\xf7\xc8&,\x0a\
+;\xd1\xa2\xde\x8d j\xa56=-^\xca\xd6\x00\x94\
+\xa5s\x01\xaf\xddw\x96fv\x8eh\x9fCQu7\
+\x9b\x1f\x0aR`0H\x85\x89k\x14>\xfb\x02\xe5\x86\
+w\xf3\x97S\xa4\xf9L\x03H\x9dL%q,\x8f3\
+\x81\xfd\x82\xa6\xfc\xf7\xc5\xf6?p\x0e`z\x0b\xb1@\
+F\x82\xdb\x19\xf8w2[\xad\xe9\x8e\x1b\xf5B\xb1`\
+\xa3\x8c\xc9\xd2zA!\x9c\xa7\x8b\x7f{L9F\xe6\
+\x8fL6\x0fS\x15\x5c\xe8\x10*D\x01\xa6\x93\xcd\xbe\
+\xc9\xfaA\xb7j\x07C\xa5P\x0b2X\xba\xe6\xde\xe9\
+\x0d`)\x19\xea\xf4\xe6\x8dS<0\xcc\xb6t\x175\
+\x96\xa3\xca\xbe\x9e\xe6\xc3\x1f~\xbe\x9b\x82\xe7f(\xca\
+HX-\xd4\xd5<\xa2pp\x86j\x99Q\xa2\xa5=\
+\xd4\x98}W\x95lY\x92k\x08.\x94\xe5\xbf\xf1\xa5\
+\x14\xc3\xdc4\x03\xb3\xa2\x15Jc\x983\xba\xaa1\x82\
+\xa9>JZT\xa8|?\x8d\x1c\xfdOu\xd1\xc5o\
+\x1e\xa1\xe22\x03>\x9feV\x9f\xa6\xe8\xec\x22\xcd\xef\
+gN\xf5\xd0&*\xf4\xed\xa7J~\xde\x8e&2\xe0\
+b\x8c\xe3\xf5\xba\xce\x0c\xaa\xb1\x8er'\x03\xffv\x93\
+\xed\x7fPp\xfb\xc0nd\x5c\xaa\xcep\xe3\xc6\x8d\x1d\
+ccc_b\xf3-\xa2\xa7\x87\xb0\x18\xae\xd9\xfa\xb0\
+\x14\xfcP\x8fw\xfdA\x16\x09\xff\xeb\x0bt\xfd\xa1\x0b\
+\xca\xad\xear\x03=\xbcZ]\x00\x02\x9aRM>G\
+\xf6\xe0\x0f\x88\xa2\x9d\x0a((\x11sc\x02\xf8\x9e\xc7\
+\xe5\x9b-,\xab\xa9\x1e\xa9\xb9\xcbT\xce\xf4Q1\x97\
+\xa1\xd8H\x81\x12\xfd\x195b}\xf2\xf5\x1e\x0a\x9cd\
+\xca;v?\xd5\xfb\x1e\xa0jr\xa4\xd9v\x8e\xa4[\
+\x09X\x98\xe3\xcdT\x0d8\x80g\x0d\xdd\xe5\x0b\xec]\
+\xeb0\xe8s\xb0tv\xcem\xa3c;e\x92jM\
+\xd3{&\xe8\xf8W\xf6\xd3\xf4\xe0\x22\x85\x17#4w\
+z\x98\xa6_\xd9E\x8176S\xf4\xc0\x8bT\x0d\xf5\
+\xe9.\x8c\xf0y\xe4\x98PB\x0d(\xb9\xcc=\x22\xe3\
+\xe3\xe3_\xc2Y>\xe0T\xf3\xde\xf6A\xc3\xeb\x03\xbd\
+\x99\x89\x99\x88F\xc1c811\xf1\xdbl^]\xd0\
+mX\x9c\x92P\x89zi\x7fA\xf8J\x80\x0e\xfe\x1f\
+o\xab\xde\xc4\xa1\x0b\xcd\xe1H\xaa\x19E\xbd\xe1v\xf9\
+V\x96AiIe\x02\x11&\x81AK\x0f\x1dW\xc8\
+\x81\x16l\xc8;\xb0\xf8\xefV\xad\xc8\xdfc\xf1S\x89\
+\x131\xf5\xd7X\x1c\x94C=\x94\x9a:@\xe9\xf9\xa3\
+T\x0cuR5~\x8e\x82\x07\x1e\xa3\xe9\xedO\xd2\xf4\
+\x9bo\xd3\xfc\x8en\x9a\xd91K\xa1\xb3\xac}\xa3>\
+1\xbb\xbc\xa2Qe\xdb\x1f\xcc\x02\x1eMQ9\xc5\x0a\
+\xdb\xd2\xf3\xd4\x08\xbeKe^G\xaa0K7\xdf\xb9\
+H'\xbf\xf8*\x8b\xa1\x8b4\xf9\xf2[4\xf7\xd2\xab\
+|\xbd@\xc9s[\x99\xbf/\xe8\xb1[2\xfb\xd0j\
+d2\x19\x8cx\x87\xdf\xe3\x02\x03\xff\xb7\xe1\xe13#\
+{\x1f$\xf5\x7fX\x1c\xa0\x05\x09\xb0\x01\xe6\x04\x9ff\
+\x91\xf0\xbc\xd4\xed1f\xd7\x1c\x93\xbf\xe1\x9a\x8a\xa8\xcf\
+\x1f~\xa9\x97v\xff\xf3W\xe8\xec\x7f;\xc8\x07\x1ao\
+A\x84\x86n\xd6`\xb2\x7f\xa5$\xe6XFc\x84\x0d\
+\xb2m\x91\x81\xb4\xb0\x93\x0d\xe5\xc3d\x8fo\x22k\xf4\
+\x87d-\xeds\xfa\x1a\x86\x8f\xf2\xdf\xde\xa1\xea\xc0C\
+\xb4<\xfa,\xe5\xa7\xf8\x19\x89\x09\x9a\x98\x9a\xa6\x99\x99\
+(\xcd\x0f\x04h\xe2\xc4\x00\xf5\xbcx\x91\xba\x1e>M\
+#[zi\xf8\xb5\xeb4\xf0\xe25\x9a98JK\
+\xe7f)\xdc5O\xb1\xbe \xcb\xfa8\xa5&x/\
+c!\x0a\xde\x0c\xd2\xcc\xf1i\x9a\xeb\x99\xa1\xa5\xee\xdd\
+\xb4\xb4\xf5{\x148\xb2\x95\xe6\x0f\xbdM}\xf7\xdeC\
+\x9d\x7f\xf2m\x9a\xda\xbc\x99B\xbb\xdf\xa0|\xefa\xaa\
+&&Y$e\xa4\xdc\xcdvD\x84e3\xc0k\x12\
+{`\x96\xff\xfc\xe8\xe8\xe8\xa7\xbd\xc0\xff0\xae\x0f\xed\
+\xc6b\x22\xf2\x06nG5\xeaSO=\xd5\xc1\x9a\xf6\
+\x9f\xb3\xa98\xa3[\xa2;\x22\x1c\x0a\x82\x16\x09*\x9b\
+f\xff\x98\xf2\x96!\x9e\x8e\xd4s\xf4\x0er\x09M\x89\
+\x86\xba\x93\x0b YA\x86\x99\xe5$\x9b4\x9c\xd9>\
+\xd9a\xc7\x89\x83`\x13\xf2\x14\xe1e\xd4\xb1\x086;\
+\xf83!\x96\xf5\x03\x14\x9d\xb9B\xa5B\x8cJ\x95<\
+\xe5\xaa\x15\xca-W(8\x1d\xa2\x89k\x934v~\
+\x94\x86O\x0d\xd1\xe0\xde\x1b\xd4\xfb\xf4U\x1ax\xb5\x8f\
+zY\x96w=}\x91\xae={\x85\xae>r\x89N\
+\xfc\xd9[t}\xc3[4\xf9\xe2Oh\xe8\xc9\xb7\xd8\
+\xea\x18\xa3\x9e\x87{X\xc9}\x85\xae\xdeu\x9cR\x03\
+STS\xe5_\xcd\xe4\x0e'/\x06\x82^!\xbf\x85\
+\xack\x9c\x09&\xb9\xe0\x8c6m\xda\xa4j3P\xc6\
+\xf5A\xcb\xfc\x9f)\x070-\x04`3\xba\x90\xb02\
+\xf39\x16\x05;x\xa3\x16\x82/\xc83t\xb8\xbb[\
+~\xa6`\x84>\xc2\xe7\xfe\xf2 \x1d\xf9?\xdf\xa5\xeb\
+\x8f\x5cT\xce\x94\x96LY\xc7\xdb\xa89C\xc3M3\
+#\xdb\xd3\xe1_\xdc\xb8\xaaL\xdfn\xa6\xa3a\xc0r\
+1M\xb1\xe9\xcbj\xd2\x87-J\x1e\xe6\x025\x10\x98\
+\x82#\xa9\xa0/\xb8\xdcQ\x10\xc2\x0a\xad\x95e\xa92\
+C\xd9\x81+\x14=s\x9e2]{\xa92s\x86\xea\
+\xa9y\x16\x1b\x88\x0e\x8e1\xf2\xbeEC\xcf\xf5\x18M\
+\xaam\xc73\x89T:\xa7\x14L\x01\x9e\x89\xa0\xa13\
+\x93`1\xed\xc0\xd9l\xde\xbcYUf}\x90\x9a\xfe\
+\xcf\x0d\x01\xbc\xdc`\xc3\x86\x0d\xb7\x7f\xfb\xdb\xdfF{\
+\xda\xdb\xf3\xf9\xfc\x17\x19\x11\xc6dN\xaf\x16\x0b*\x96\
+ YFj`r_\x88\xba\xbe{J\xb9P/\x7f\
+\xfb\x84\xb2\x18\xd0at%2\xe8I\x19\x8d\x86\xeb3\
+\x10\xb72\x19\xd3E\xa5H\x05\xef\x95\xca\x15\x95\x9f\x0f\
+}\xc1\xaa\x16\x94[\xdabD\xb0\xe2=|uS\x03\
+W\xe4*\x9b~C\xac\xfd\xf7\xb1\x989N\xa5\x91\xe3\
+\x14\xeb<@\x85\xb1\x1eVB!\xc3\x9d\xae\x22\x89\xe1\
+\x14\xdd\xf8\xe1e\xc5\xb9\xe6\x0eN\xb8\x091V\xdd\xf5\
+]H\xb7\x15\x0b\xec^\x12a\x19\xf0c\x8c\x08_\xc4\
+\x99\xe0lpF\x1f6\xd5\xff\xcc\x11\xc0\xe3>\xbe\x1d\
+\x1a-\xb0\xbc\xb3\xb3\xf3\x97\x17\x17\x177\xb2\xcc\x0bJ\
+\x03\xc4z]\xb1\x01\x1b\xce#\xad\x1f\xd8\xd2E\xe4\xea\
+\xbdg\xe8\xd0\xbfy\x93N\xff\xd9\x1ee5`\x9c\x8d\
+\xf8\x11Z\xa8\xadn9=\x0c\xea\xcd\xce\xe7-9w\
+\xba\xb2\x06UF\xd1p\xa49rX\x8f\x95\xb1t\xeb\
+xKuB\xb1\xd4\x90*\x84g\x0bK\x19\x0a_b\
+=\xa0'\xa8\x87^,\xabh\xe4\xd5\xbbO\xd3\xa9?\
+\xdbM7\x9e\xbc\xdc\x9c\xb5\x5cw\x81nk\xc8C\xce\
+7d\x804s\xbe \xf6\x8e3@\xf6.\xce\x04g\
+\xf3\xb3\xa0\xfa\x9f\x0b\x02\xf8\x99\x8b\x92\xbdr\xe8\xd0\xa1\
+\x7f\xc2\x87\xf2,SBF\xca\xa0P\x88\xe2\xb4\xa9Q\
+\xc5(\xaeh@\xde\xdd\xe2\xc9i\x15[8\xf1\x1f\xf6\
+(\xcep\xe9\x1b\xc7T\x87\x11\xe4#J]\xc1\xca\xc9\
+>\xb6\x9bo'\x83\x94Q\xb5\xa3\xa6\xa54\x9a\xddJ\
+DV\xcb\x03Q\x06\x16\x1f`%\xf1\xd84\x15\xd1\xc7\
+h)G\xa1K\x8bts\xd3e\xea\xfc\xea~\xf5l\
+x\xffLDT\x9eOK\xfc\x86\xa8\x9f\xadY2\xde\
+\x8d)>\xc3\xd4\xff,\xf6,=\x19>\x0c\xf3\xee#\
+\x8f\x00\xe28Bg\x12x\x10\x91\xcb\xb6g\xcf\x9e_\
+O$\x12/0k\x8c\x83=\xe2\xc0\x98R\x90{\xa8\
+\xfa\xc2\xdb\x8d\xe6\x00`\xc7\x1d_U9\x01\xdd\xf7\x9d\
+e@\x1c\xa7\xd3\xffe\x9f2%\xcf\xf0+\x8aJ\x82\
+\x97\x16\x14E\xa2\xb8DR\xab\xcd\x1f\x14\x9c\xa0\xfd\x8d\
+\xd7M\x5cf$\xc3\xac\xa4\xe9\x9d\xc3L\xe1\xd3\xca:\
+A\x11&z\xef\x22\xe5\xed\xfc_\x1f\xa6\xd1\xd7o\xaa\
+\x1aF$\xa9\x0a\x82Y\x00\xbc^\x1e\xea)\x19\xa1\xeb\
+2\x0a.\x97\xcb\xc5\x19\x09^\xc0\x1e\xb1W\xec\x19{\
+\xbf\x95\xf4\xad\xff\xde8\x80\xbb\xf1G\x1f}T\x89\x05\
+h\xbe\x10\x0dg\xcf\x9e\xfd\xb5\x85\x85\x85'\x18\xf8\xa3\
+2A\x0b\xa9a\x884\xaa\xfcC\x15o\xb4[\x0c\x00\
+\x15\xd3g`#\x18\x83\xe4\xd4\xab\xf7\x9cQ\xc8p\xee\
+/\x0f\xf1\xeb\x1e\xba\xf0\xb5#\xd4\xf7\xf8e\xea\xd9x\
+\x9ez\x1f>O7Y^_\xb8\xf3(\x9d\xfd\xebC\
+t\xf3\xc9.\x95\xaf\x87\x905\xbes\xe2Ow\xd2\xa1\
+\xdf\x7f\x9b\xce\xfe\xe5a\xea\xfc\xf2\x01\x05x \x14(\
+\x1f@G\xeec3D\x80\xf8\xb7#[\xc0\xf2\x91\x17\
+!-\xdftI\xda(\xb3\xfa'\xce\x9d;\xf7k\xd8\
+\x1b\xf6\x88\xbdb\xcf?kv\xff\x91C\x00\x1f\xe7\xc6\
+m\x12]|\xec\xb1\xc7:\xf6\xef\xdf\x7f\x07\x1f\xe6W\
+\xf8\x10\x0f0G\xa8\xca\xa4l=mSY\x90\xb6\xf2\
+\xbbR\xb3\x9f\x9da\x04`\x1c}>\x90S\xf1xd\
+\xe3\x8e\xbf5\xa0Z\xde\x8e\xbf\xd5O\x93\xef\x0e\xd1\x8d\
+\x97\xd9\xb4{\xa5\x9b&\xb7\x0e\xd1\xc4\xd6A5\x17\x01\
+\x7fG\xbc\x1e\xf5\xf6\xe8Y\x88\xca\x9fV\x9b\xa2I\xf0\
+\x0e\xe8\xed:\x02_\xd2C\x08\xaeo\xa6v\xb4\xdd?\
+\xc0H\xfb\x95\x03\x07\x0e\xdc\x81\xbd\x88\x1bW\xd8\xfd\xcf\
+\x1b\xf0\x1f)\x04\xf0\x11\x0d(gR\xa2\x01f\xd1\xd3\
+O?\xfd\xf1\xabW\xaf\xfe\x06\x1f\xee\xdd|\xc8]\xa5\
+R)\x0b$\x90<=\xa4\x8c1w\xa8\xaav\xf7N\
+\xa7igl\x08\xf9\xcc}3'\xcc7X<\xd8\xa5\
+\xd5||\x06\xc0\xd9\xae\xa8\xb3\x11W\xab\x03\xe0Up\
+$s\xbe/#d\x96\x91\xa0\x8b\xff}7\xd6\x8a5\
+\xff\xe8G?R\xac\x1e{\xd1{\xfa\xc8\x9d\xf7Gn\
+A\x1e\xd1\x80\xb8\xc2\xc7\xe0H\x02\xdb\x84\xb6\xfc\xd2K\
+/u\x0c\x0d\x0d\xfd\xe6\xf0\xf0\xf0w\x180{X\xc1\
+\x82\x19U\x05B\xc0\x85*\x89\x9bL\x85v\xadZ\xb3\
+\xab\x95\xaa\xba\x94\xb3\xc9\xd2\xb3\xae\xebN\xadw\x22\x96\
+\xb0\xd3\xc9\xb4N\x0e\xb0\x9d\xb9X\x0d\xc71\x85\xef\xe0\
+\xfb\x95\xe5\x8a\x0d\xf7,\x9aJ\x03\xe0x\x06\xee\xcfH\
+\x08\x84C\x92\xff\x9e\xd1\xd1\xd1\xef`MX\x9bh\xf4\
+z\xcd\x1f\xc3\x1e>J\x14\xff\x0f\x02\x01|\x1cI\x22\
+\x1eT\xa0\x09T\x85\x03fM\x1a]\xcd>\xbbs\xe7\
+\xce\xdf\xeb\xee\xee\xfe\x1a\xb3\xe3W\x180\x97\x0a\x85B\
+R8\x84\x5c2\x85\x03\x17X\xb5L\xe5F\x15\x12\xfe\
+-\x7f\x93j!\xf9\x9e\xb4\xb8g$K2\x95_\xc2\
+3\xae_\xbf\xfe\xb5]\xbbv\xfd\x1e\x9e}\xf0\xe0A\
+\xb5\x16\xac\x09k\xd3\x0e\x9c\xdb\xf4\x9a?\xb2\x80\xff\x07\
+\x81\x00\xabq\x06>\xe0\x8f\xb3R\x85KQ\x1d\x22f\
+\xa8\x5cB\xb3\xcb\x0d\x1b6|bbb\xe23\xac\x94\
+\xfd\x01s\x88;\xf9\xf5\xa7\xfcz\x90\x91\xa2\x87Y\xf7\
+\x1c\x034\xc5W\x05\x5c\x02\x17\xfe\xcd\xef\xe3=\xfc\xad\
+\x87)\xfb\xa0\xfe\x0e\xbe\xfb\x07\xb8\x17\xee\x89{\xe3\x19\
+x\x16\x9e\x89gc\x0d\xcc\xde?\xfeQ\xa7\xf4v\xd7\
+\xff\x0fUk\xfb .\x8c\x0cE\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x0e\xab\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x01\x84iCCPICC prof\
+ile\x00\x00(\x91}\x91=H\xc3P\x14\x85O\
+S\xa5\x22\x15\x07\x83\x88:d\xa8NvQ\x11G\xa9\
+b\x11,\x94\xb6B\xab\x0e&/\xfd\x83&\x0dI\x8a\
+\x8b\xa3\xe0Zp\xf0g\xb1\xea\xe0\xe2\xac\xab\x83\xab \
+\x08\xfe\x80\xb8\x0bN\x8a.R\xe2}I\xa1E\x8c\x17\
+\x1e\xef\xe3\xbc{\x0e\xef\xdd\x07\x08\x8d\x0a\xd3\xac\xae9\
+@\xd3m3\x15\x8fI\xd9\xdc\xaa\x14zE\x00\x83\x10\
+!`Df\x96\x91H/f\xe0[_\xf7\xd4Mu\
+\x17\xe5Y\xfe}\x7fV\x9f\x9a\xb7\x18\x10\x90\x88\xe7\x98\
+a\xda\xc4\x1b\xc43\x9b\xb6\xc1y\x9fXd%Y%\
+>'\x9e0\xe9\x82\xc4\x8f\x5cW<~\xe3\x5ctY\
+\xe0\x99\xa2\x99I\xcd\x13\x8b\xc4R\xb1\x83\x95\x0ef%\
+S#\x9e&\x8e\xa8\x9aN\xf9B\xd6c\x95\xf3\x16g\
+\xadRc\xad{\xf2\x17\x86\xf3\xfaJ\x9a\xeb\xb4F\x11\
+\xc7\x12\x12HB\x82\x82\x1a\xca\xa8\xc0F\x94v\x9d\x14\
+\x0b):\x8f\xf9\xf8\x87]\x7f\x92\x5c\x0a\xb9\xca`\xe4\
+X@\x15\x1ad\xd7\x0f\xfe\x07\xbfgk\x15\xa6&\xbd\
+\xa4p\x0c\xe8~q\x9c\x8f1 \xb4\x0b4\xeb\x8e\xf3\
+}\xec8\xcd\x13 \xf8\x0c\x5c\xe9m\x7f\xb5\x01\xcc~\
+\x92^ok\x91#\xa0\x7f\x1b\xb8\xb8nk\xca\x1ep\
+\xb9\x03\x0c=\x19\xb2)\xbbR\x90\x96P(\x00\xefg\
+\xf4M9`\xe0\x16\xe8]\xf3\xe6\xd6:\xc7\xe9\x03\x90\
+\xa1Y-\xdf\x00\x07\x87\xc0x\x91\xb2\xd7}\xde\xdd\xd3\
+9\xb7\x7f{Z\xf3\xfb\x01tKr\xa7\xa0|M-\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0e\xc3\x00\x00\
+\x0e\xc3\x01\xc7o\xa8d\x00\x00\x00\x07tIME\x07\
+\xe9\x01\x16\x14#5F\xb8y\xf7\x00\x00\x00\x19tE\
+XtComment\x00Create\
+d with GIMPW\x81\x0e\x17\x00\
+\x00\x0c\x83IDATh\xde\xcdZ\x7fLS\xe9\x9a\
+~\x0eB(\x8c\xac0\xc1\x0df\x07\x14&0#D\
+I\xc8u\xcd\xe2\x8a\x9b!#\xb311\xde\xb0\x99\xb8\
+a\x9d\x98u\xf5\x9a\x0d\xfca\xae\x97\xc4\x04M\xcc%\
+&\xb3n&\x13\xfd\x83\xddv\xb2l\x1a\x0c\x1b\xac\xc3\
+L`\xd3\xa9\xd6\x09\xb8\xb7\xa4\xd6\xa9)5\xc5c\xc7\
+2\xb7\x87lK\xac\xb6\x8c\xc5\xc3!\x95\xf3\xec\x1fp\
+\xce\xf6\xd0\x1f0?\xee\xdd=I\x93\xf6\xfb\xbe\xf3}\
+\xef\xfb~\xef\x8f\xe7}\xdf\x0a\xf8\x19\x1e\x92\xb5\x00\x0e\
+\x02\xf8\x05\x80F\x00\xbb\x00\xfc)\x807\xd6\x96\xbc\x02\
+\xf0\x0c\xc0\xef\x01\xcc\x00\xf8\x06\xc0\x7f\x09\x82\xf0\xddO\
+=[\xf8\x09D\xff\x19\x80\xe3\x00~\x09\xe0@\xfa\xdc\
+\xf4\xf44\x0a\x0a\x0a\xa0\xaa*\x0a\x0a\x0a\x00\x00\xdb\xb6\
+mCMM\xcd\xfam\x5c\x00F\x01\xfc\x87 \x08\xff\
+\xfdGa\x80\xe4n\x00\xbf\x02\xf0\xf7\x00\xca\x96\x97\x97\
+\x11\x0a\x85\x90L&\xb1\xb2\xb2\x82\xb2\xb22\xec\xd9\xb3\
+\x07\x00\xf0\xe4\xc9\x13\xbc\xf3\xce;\xda{\xf8\xe6\x9bo\
+\xa0\xaa*L&\x13L&\x93>\x07 \x09\xe0\xdf\x00\
+\xfc\xab \x08\x8f\xf1\x87xH\x96\x92\xbcH\xf2\x05I\
+\x86\xc3a\xba\xddn\x86B!\xe6z\xfc~?\xf3=\
+.\x97\x8b>\x9f\x8f\xc9dR\x1bz\xb1vF\xe9\xcf\
+M\xfc{$\xef\x90d4\x1a\xe5\xe4\xe4$7\xf3l\
+\xc4\x80\xf6D\x22\x11z\xbd^*\x8a\xa2\x0d\xdd!\xf9\
+\xde\xcf\xa2B$O\x03\xb8\x08\xa0\xfa\xe1\xc3\x87hj\
+jBqq\xf1\xa6\x18\x8fF\xa3\x98\x9a\x9a\xc2\xde\xbd\
+{\xb1\xb0\xb0\xa0\x8f\x97\x97\x97c\xcb\x96-())\
+\xc1\x8e\x1d;\xf4\xf1'O\x9e\xa0\xb4\xb4\x14\xd5\xd5\xd5\
+\x000\x07\xe0\xb7\x82 X~\x8a\xe4{I\xca\xb2,\
+stttS\xd2\x8c\xc5b\xf4\xf9|\xb4\xdb\xedT\
+\x14%\xaf\x8a\xa9\xaaJ\xbb\xddN\xaf\xd7\xcbh4J\
+\xed\x86\xc7\xc7\xc7\xb5%2\xc9\xde\x9fB\xfcR2\x99\
+d$\x12!I\xfa|\xbe\x9c\xc4\xc4\xe3q:\x9dN\
+\xca\xb2l\x18\x0f\x04\x02\x9bb<\x95J\xd1\xe1p\xd0\
+\xe1p\xe8g\xa9\xaaJ\x92K?\x98\x09\x92\xa7I\xca\
+\xb1X\x8c\xf1x\xdc \xb1l\x12u\xbb\xdd\x19\x84\xff\
+P;\xd0\x98UU\x95.\x97k\xfd\xbb\xf2\x9a*o\
+l\x03k\xc6\xf3\xef\xcb\xcb\xcb\xd5\xf1x\xdc\xa0\xa3\x00\
+\xb0\xb8\xb8\x88\xc5\xc5ETUUaii\x09\x8f\x1f\
+?FKKK^\x81\xcc\xcc\xcc\xa0\xa1\xa1\x01\x0b\x0b\
+\x0b\x08\x06\x83x\xf6\xec\x19\x0a\x0b\x0b\xf1\xfa\xf5k\x14\
+\x15\x15\x81$\x1a\x1b\x1b\xf1\xf4\xe9S\x1c>|X\x8f\
+%;w\xeeD8\x1cFss\xb3f\x13'\x05A\
+\xf8z#Wy\x87$EQ\xcc)\xa9h4\xca`\
+0\xc8X,\xb6\xa1T\x13\x89\x04\xfb\xfb\xfb\x19\x0e\x87\
+7\x5c+\x8a\x22GGG\x19\x0c\x06\xf5wc\xb1\x18\
+\xbd^o\xbaw*\xcd\xc7\xc0\xc5\xcd\x5c{\x22\x91\xa0\
+\xc7\xe3I\xf7\xdfY\x0dTs\xb7\xd1h4\xefZ\xcd\
+\xf8\xd3\xd7\xf8|>F\x22\x11&\x12\x09\x8a\xa2\x98.\
+\x80\x8b9#,\xc9\x17\xa1PH3\x9e\x9c\xc6\xa6m\
+\x16\x8b\xc5\x98H\xc43\xd6$\x93\xc9\x0c!l&\xa8\
+\xa5\xdb\x9bv\x96\xdb\xed\xa6$It\xbb\xdd\xe9\xc1n\
+\xb7FwA\x1a\x0f\xbf\x02\xf0\xe6\xabW\xaf \x08\xb9\
+\xc3\xc3w\xdf}\x87Db\x09\x05\xc2\x07\xd8\xbe};\
+**\xde\x84 \xec\xc6\x83\xa9Gx\xbdL<\x7f\xfe\
+\x1c\x8b\x8b\x8b:\x9c\xd0\x9e\xda\xdaZ\xcc\xcf\xcf\xeb\xbf\
+\x97\x96\x96p\xff\xfe}\xdc\xbau\x0b\xf7\xef\xdf\xc7[\
+o\xbd\x85\x8a\x8a\x0a\xdc\xbd{\x177o\xde\xc4\xf4\xf4\
+4VVV\xb0\x7f\xff~\xcc\xcd\xcd\xa1\xb4\xb4\x14S\
+SS\x00\xf0\xe6\x1a\xadF`F\xf2e>7I\x92\
+\x93\x93.\x02[\xe9\xb4g\xae\x0b\xf8\x03\x04\xc0\xde\xee\
+O\xf2\xe8x\x90\xa9T\x8aN\xa73\xe3\x96\xc3\xe1p\
+\xc6\x98,\xcbt\xbb\xddTU\x95CCC\x1c\x1c\x1c\
+\xd4\xa6^\xae\x81I\x9d\x81_\x93\xa4\xddn\xcf\xa9>\
+\xaa\xaa\x12\x00\xe5dn\xf5\x1a\x1a\x1a\xe2\xf0\xa0\x83\x87\
+Z\xcefS>\xc6G\xcf\xe5\x0d\x88\xb9b\xc6\xe0\xe0\
+ \x15E\xe1\xf0\xf0p\xbaA\xff:\x9d\x81\xdfi\x12\
+\x08\x87\xc3\x1c\x1f\x1fg*\x952l\xd2\xde\xd6EU\
+!\xbb\x8e]\xca\xeb\xefC\xa1\x10\xdb[Opl\xd8\
+\x95\xce>\xe3\xef\x82\xf1\xa4\x92\x97PQ\x14\xa9\xaa*\
+\x15E\xd1?Z@\x0b\x87\xc3\xf4z\xbd\x1c\x18\x18\xd0\
+\x96\xff\x0e\x00\x0a\xd6\x92\x91\x03\xdf\x7f\xff=\x04A@\
+MM\x0d\x8e\x1c9\x82\xc2\xc2B\xdc\xbau\x0b33\
+3 \x89g\x92\x02\xa1\x18X\x81\x9aa\x17\x0b\x0b\x0b\
+\xd8\xbe};\x00\xa0\xae\xae\x0eN\x97\x15\xbf\xfc\xdb\x7f\
+\x04I\x00\xc0\xeb\xbf)@\xe2\xb6\x84\x8a\xad\xab\x18\xaa\
+\xa1\xa1\x01\xb3\xb3\xb3\x19\xfb|\xfe\xf9\xe7\x98\x9f\x9fG\
+qq\xb1\xfeYYY\x81\xcdfCYY\x19\xca\xca\
+\xca\xf0\xec\xd93\xcd\x96\x0e\x90\xac-X\xcb\xa4\xb0e\
+\xcb\x96\x8c\x0d;;;\xb1{w#\xbe\xfe\xfa\x1e\x82\
+\xbf\x7f\x8c\xd9\xd9Y\xec\xdd\xbb\x13\xf7'\x9f\x18\xd6\xcd\
+\xcd\xcd\xa1\xaa\xaa\xca0\xd6\xb1\xff ^\xbcx\x81\x07\
+\xbf9\x04\xff\x81\xb3\xa8[\x05h\x00\x80\xc2\xc2B\xd4\
+\xd4\xd4\xe0\xdbo\xbf\xd5A\xdf\xdc\xdc\x1c.\x5c\xb8\x80\
+\xe7\xcf\x9f\x1b\x04\xf3\xf0\xe1C\xbc\xff\xfe\xfb(--\
+E<\x1e\xc7\xdbo\xbf\x8d\xf1\xf1qm\xc9\xc1\x82\xb5\
+4\x10EEE\x19\x0c|v\xfd?QPP\x8e\xda\
+\xdaj(\x0c\xa0\xae\xae\x0e\x17.\xff\x03\xfe\xe2\xaf\xfe\
+\x12w\xef\xde\xd5%\x9c\x8d\xf9\xa6\x83;QYY\x89\
+?yp\x0f\xa6\x8e\x1eLOO\x1b\xe6\x0b\x0b\x0bQ\
+__\x8f\x9b7o\xa2\xa4\xa4DC\xa00\x99L\xf8\
+\xea\xab\xaf\xb0\xb4\xb4\x84\xf2\xf2r\x1c<xPG\xaf\
+\x8a\xa2\xa0\xbc\xbc\x1cw\xee\xdc\xd1\xb6\xf9E\x01\x80\xc6\
+G\x8f\x1e\xa1\xbe\xbe\xdep\xc0\xbf\xfc\xd3\x17\x98\x09\x06\
+A.\xe0\xd5\xabW\x86\xb9\xf7\x0e\xfd5\xda\xdb\xdb!\
+\x08\x02n\xdc\xb8\x81\xa9\xa9)D\xa3Q\xc3\x9a\xe1\x7f\
+\x0e\x00\x8fn`\xe5\xfd.466\xa2\xb9\xb9\x19\x92\
+$\xe1\xf6\xed\xdbFF\x9b\x9a033\x83\xe5\xe5e\
+\x00@*\x95BMM\x0dJJJ\x00\x00\x8a\xa2\xe0\
+\xde\xbd{\xf8\xec\xb3\xcfP]]\x8d\xa2\xa2\xa2tw\
+\xdc\x08\x92O\xb3\x05\x99*\x1c\xcb\x1d\x84Tr\x7f\xcb\
+\xf1\xacs\x13\x13\x134\x9b-lm=B^9\x9a\
+\x13\xc1\x0e\x0e\x0erdd\xc4\x10\xb4\xfa\xfa\xfa\x0c\x91\
+X\x92$\xc6\xe3q\xc3\x19\xa2(\xb2\xaa\xaaJ\xfb\xf9\
+\x14$_\xae\xf7\x0a\xe7\xce^\xa5\xd7\x15\xca\x1bE\xfb\
+\xce\x0d\xb0\xe7\xe4'Y1SkK\x17\xa9\x92b'\
+H\x92\x16\x8b\x85\x03\x03\x03\x06\x825o\x94J\xa5h\
+\xb1X\xe8\xf1x\xe8\xf7\xfb)\xcb2\xadV+eY\
+\xa6\xddn\xa7(\x8a\x8c\xc5b:\xa4'\xc9\xee\xeen\
+\x0d\xfd\xbe\x14H\xae\xcc\xcc\xcc\x14466\xea\xd7z\
+\xa0\xe1\x0c\x5cA3\x00`vv\x16\xb5\xb5\xb5Y\xa3\
+\xf3\x0d\xcbm\xfc\xdd\x99\x0e\xdd\x16\x00@\x10\x04\x04<\
+\x12\x1a\xf7U\xe3\xd1G\x7f\x8e=VO\xce\xa8~\xfd\
+\xfau\x94\x97\x97cyy\x19\x8a\xa2`\xeb\xd6\xad8\
+p\xe0\x00\x5c.\x17\x92\xc9$\xda\xda\xda\xf0\xe0\xc1\x03\
+TTT@UU\x94\x95\x95\xe1\x83\x0f>\xc0\xfc\xfc\
+<\x22\x91\x08ZZZT\x81\xe4\xca\x17_|Q\x10\
+\x8b\xc5\xf4\x8d\xcf\x9c\xf9-\xcc\xe6\x8b:t\xd8\xb1c\
+\x07L&SV\x22\x82\xc1 \x1a\x1a\x1a\xb2\xce%~\
+s\x06\x15W\xcd9\x19H\x7f\xf7\xe9\xd3\xa70\x99L\
+\xb0Z\xad0\x99L(**BOO\x0f\x00`r\
+r\x12_~\xf9%\x16\x17\x17!\x08\x02\xccf3\xf6\
+\xed\xdb\x87\xe6\xe6f5\xab\x0a\x9d\xea\xea\xd7\xbfo\x04\
+\xee\xf2\x81\xb4@W\xfd*z\x8d)\x04\xc0D,\xc9\
+\xd3]\xbd\x04\xc0s\xa7.\xd1n\xb7\x1b\xa0Doo\
+/'&&H\x92\xe7\xcf\x9f\xa7(\x8a\x14E\x91>\
+\x9f\xcfPHp\xbb\xddZD~\x99\xd5\x88O\x9f\xe8\
+\xdf4\x91\xb9\xe6F\x07=\xac\x04\xd8\xdf\xff1\x8bq\
+8\x1b\xb2 \x00VW\xb6\x19\x10\xe9\xd0\xd0\x90\xc1\xd0\
+\xb3E\xee\xaa\x8az\x83\x11;\xd7/\xd8Sqb\xf3\
+R^{\xd7\xeb\xf5\xf2\xda\xd5\x01\x02`\xd0\x17Y\xbd\
+\xb5\xab\x9d\xbcve\x88\xb6\xe1\x09C.\xa1\x11\x16\x0c\
+\x06\x99\x88\xcb\x04\xea866\xc6P(\xa4\x97V\xb4\
+}\x07\x07\x07\xf5\xc4)\x1e\x8f\xd3\xe1pp\x15\xfd\x90\
+$\x9d ym=\x81\x95\xf80\x03\xa3dK\xe2\xcd\
+f3\x9dN'\xa3\xd1(m\xd6I\x9e8z\xc5\xb8\
+H\x96(\x9e\xd8\xa5\x13\x9b\xad\x9e\xe4p8\xe8\xf7\x89\
+\xdcW\x7fJ?\xcb\xe3\xf1d\x15\x9e\xa2(\xb4Z\xad\
+\x04\x04m\xe8\x1aH~\xb4\xbe\xe2\xd0y\xf4|V)\
+\xfb\xfd~Z\xad\xd6\x8c\xec\xca16\xc9c\xed\x17\xb2\
+\xdeP\xf8\x048<<\x92uNK\x1d\xfd~?O\
+t^\xa2\xaa\xae\x9e%\xcb2-\x16\x0b#\x91\x88\x9e\
+\xba\x9a\xcdfJ\x92\xc4\x89\x89\x09\xb6\xee;\xa2m\xf1\
+\x11H\xd6\xae\xd73\xd1\x1fa\xf7\xa9UiJ\x92\xc4\
+\x81\x81\x81\xbc9\xf26\x1c\xc9Y\xf3a\x5c\xa4\xef\xc3\
+\xea\x0dmgll\x9c\x1dm=\x06\x7f\x9f.X\x8f\
+\xc7CY\x96y\xb4\xfd$\xcf\x9f\xfbX\x9b\xae\xd5\xe1\
+\xf4z;\x00\xc0D\x22\xb1);8\xdeq\xd9 \x80\
+\x8c|\xf9\xe3C\x0c\x8c^\xdf\x10\xf7W\xefh\xe5\xf0\
+\xf0\xb0\x8e\xfb\x1d\x0e\x07{{{\xf5\x146\x10\x08\x10\
+\xd8j\x80\xd3\x86\x84f``\x80n\xb7\x9b\xa9T\x8a\
+\xe7\xce^\xa5g\x22\xb8\xe1\xa1\xbe\xc90\xaf_\x19\xd3\
+\x19\xd4j:\x19OO\x1d\x03\xce\xa1\xbc\x95\xba\x93]\
+\x97r\xaaZ \x10\xa0\x18\x14\xb9\xad\xe4\xdd\xac\x09M\
+\xd6\x94\xf2\xdd\xca\xae\x0d\xbd\xd1'\x97m\x0c\xb8#\x94\
+$i\xc3\xf2c\xe2\xf2!Z[\x0b\xf30p!\xab\
+*Z,\x16\x06\x83A\x1e9r\x9c\xf61gfJ\
+\xb9\xc6\xc4\xa7\xd1h\xd4\xa06]\xc7\xfa\xe8\x1c\xf3\x19\
+\xaa\xc8\xeb+p\x83\x9f8\xd8\xd7}M\x0fv\xf9l\
+\xc5\xef\xf7\x93q\x89q\x01\xb4\xf5u1=<\x9e>\
+y\x81\xc9D\xca\xe0qFFF\xa8(\x0aS\xa9\x14\
+\xc7\xc6F\xd3\xdd\xe7\xa79\xcb*\xebo\x01x7\xef\
+-\x8c\x8fN\xb0\xaf\xc7l\x18K\xcb[s\xbb\xe2H\
+\x80\xb2\xb4\x0a\xd4\xae]5\x13\x00m6\x1bGFF\
+\x98L&\xf5x\x90H$(I\x12\x81\x12z\x5c\xbe\
+\x8c\xb2JFa+\xbd\xeeCr-\xd04geB\
+\xb3\x8b\x0f;\xfa\xb2\xd6K7\x1b\x0c\x81}\xf4\xfb3\
+m\xcc\xe7\xf3Q\x96evw_\xe2\xb1\x8e\xb3\xf9\x0b\
+[\xe9\xa5\xc5\xf5\x87\x05|A\x1ei\xeb6\x8c\xd9l\
+6\xfd\xfb\xd1\xd6\xde\x9c\x15<\xa7\xd3\x99\xd7p+p\
+\x98\xb1h\xc2pK\xb1XLg\xd8:8J\xa0R\
+S\xd1;\x1bvo\xd6\xba1\xd2zU\xb2\x5c\x1f\xe3\
+\x89\xce^\x03\x8e\xd7T%\x22%x\xee\xf4\xb5\x9cD\
+:\x1c\x0e\xda\xed\xf6\x8c[\x01\xf63\x1a\x8d\xeb\xd5\xbc\
+\xfe\xfe~\x06\x83A]}\xc6m\x13\x04\x8a\xb5\x8a\x9d\
+\xb4\xd9\xae\x8d^^_\xef:\xcd\xd7F\xd9\xb8\xab=\
+\xe3\x9aS\xa9\x14\xdb\x1a{\x18\x93\xe4\xac\x85\xe0\xa8\x14\
+g\xc0\x1b\xd1\xa5{\xf5\x8a\x85\x00\xe8\xf5\xfaV\xe7\xd7\
+j\xa7Zd&\xc9\xf6\xd6\xe3,D3\xc5@0o\
+y=o\x83CU\xd5\xa5t\x83\x0cKa\x8e\xdb&\
+\xd3\x83\x89\x8e\x8b\xdcn7\xab\x85N*\x095\x03\x86\
+\xec)\xee!\xb0\x7fumT\xe6V\xa1-\xe7m\xd9\
+Fl\x04\xc0\xd1\x11\x07\x03b\xe0\xc758\xd6\xb7\x98\
+\xdcn7\xe3\xf1\xb8\xeeb\x93I\x85\x1dm=\x04v\
+\x91)c\xe9\x10\x00#\xa1\xffu\xc5!1D\x00<\
+\xd9\xf11\xaf\x5c\xb0R@kV\xc2=\x1e7\x0f\xef\
+;E\x00\x0c\x05%\xcdn~|\x8bi\x9d:I.\
+\x97+\x03\xc4\xc9\x89\x14\xfb/YX\x88\x0e\x02U\x04\
+ZX\x8cv\x02X\xfb4\xaf\xaa\x8a\xc7O\xbf7\xcc\
+\x80OZU\xa3x\x8c\xa7O\xf6\x11\xd8\xc5\xcb=\x16\
+\x02\x85\x04\xda9\xe1\xf41\x10\xf0k\xfd2\xe9\x07\xab\
+\xcdFm\xd6X,\xa6gL\x1b66b\x0a\x8f\xb6\
+\x9d'\xb0\x8b\x95[\x0f\xf3R\xb7\x99m\xcd\xa7\x08\xd4\
+\x13\x00-\xd7\xc7\x18\x8f\xca\x1c\x19rRM\x91)5\
+E\x8f\xc7\xa3\x9547\xddf\xfdQ\x8d\xee@ \xb0\
+\xa9^\xb1\xe6\x04RI\xd264I\xcf\xa4H9\x91\
+\xca\xe8%\xb8\x5c.-i\xf9\xc34\xba\xb3D\xecO\
+I\xbe\x0c\x06\x83\xe9\xf9\xe9\xa6\xd3\xcdT*\xa5w\xe9\
+\xd7\x08\x7f\xb9\xb6\xe7\xee\xff\xb3?{\xcc\xcc\xcc`e\
+e\x05\xc9dR_\x13\x08\x04\xd0\xd4\xd4\xa4\xff~\xe3\
+\x8d7PTT\x84\xb2\xb22\xad\x94\xf8\xc7\xff\xb3\xc7\
+\xff\xb7\xbf\xdb\xfc\x0f\xeaFCc\x9a,f!\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\xe0Kg\
+\x00w\
+\x00i\x00n\x00d\x00o\x00w\
+\x00\x10\
+\x0e\x0f?\xa7\
+\x00l\
+\x00o\x00g\x00o\x00_\x001\x002\x008\x00x\x001\x002\x008\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0f\xb3\x03G\
+\x00i\
+\x00c\x00o\x00n\x00_\x004\x008\x00x\x004\x008\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a%r\x11\xc0\
+\x00\x00\x008\x00\x00\x00\x00\x00\x01\x00\x00V\xfb\
+\x00\x00\x01\x9a%r\x11\xc0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,91 @@
+#  NanoVNASaver
+#
+#  A python program to view and export Touchstone data from a NanoVNA
+#  Copyright (C) 2019, 2020  Rune B. Broberg
+#  Copyright (C) 2020ff NanoVNA-Saver Authors
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import math
+import os
+import unittest
+
+from PySide6 import QtWidgets
+
+# Import targets to be tested
+from NanoVNASaver.Charts.LogMag import (
+    LogMagChart,
+    TickVal,
+    gain_arrays,
+    span2ticks,
+)
+from NanoVNASaver.RFTools import Datapoint
+from NanoVNASaver.Touchstone import Touchstone
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class TestGainArrays(unittest.TestCase):
+    def test_gain(self):
+        data = [
+            Datapoint(100000, 0.1, 0.0),
+            Datapoint(200000, 0.0, -1.0),
+            Datapoint(300000, 0.6, 0.8),
+            Datapoint(400000, -3.0, 4.0),
+        ]
+        freq, gain = gain_arrays(data)
+        self.assertEqual(list(freq), [d.freq for d in data])
+        for value, d in zip(gain, data, strict=True):
+            self.assertAlmostEqual(value, d.gain)
+
+    def test_zero(self):
+        _, gain = gain_arrays([Datapoint(100000, 0.0, 0.0)])
+        self.assertEqual(gain[0], -math.inf)
+
+    def test_empty(self):
+        freq, gain = gain_arrays([])
+        self.assertEqual(len(freq), 0)
+        self.assertEqual(len(gain), 0)
+
+
+class TestSpan2Ticks(unittest.TestCase):
+    def test_ticks(self):
+        self.assertEqual(span2ticks(90.0, -80.0), TickVal(9, -70.0, 10.0))
+        self.assertEqual(span2ticks(-90.0, -80.0), TickVal(9, -70.0, 10.0))
+        self.assertEqual(span2ticks(7.0, -3.3), TickVal(7, -3.0, 1.0))
+        self.assertEqual(span2ticks(100.0, -15.0), TickVal(5, 0.0, 20.0))
+
+    def test_cached(self):
+        ticks = span2ticks(42.0, -21.0)
+        self.assertIs(span2ticks(42.0, -21.0), ticks)
+        with self.assertRaises(AttributeError):
+            ticks.count = 0  # type: ignore
+
+
+class TestGetYPositions(unittest.TestCase):
+    def test_scalar(self):
+        QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        touchstone = Touchstone("tests/data/attenuator-0643_RI.s2p")
+        touchstone.load()
+        for sweep in (touchstone.s11, touchstone.s21):
+            # with a zero magnitude point, its gain is -inf
+            data = [*sweep, Datapoint(sweep[-1].freq + 1, 0.0, 0.0)]
+            for inverted in (False, True):
+                chart = LogMagChart("S21 Gain")
+                chart.isInverted = inverted
+                chart.setData(data)
+                chart.calc_scaling()
+                y = chart.getYPositions(data)
+                with self.subTest(inverted=inverted):
+                    self.assertEqual(y, [chart.getYPosition(d) for d in data])
+                    self.assertEqual(y[-1], chart.topMargin)
@@ -0,0 +1,264 @@
+#  NanoVNASaver
+#
+#  A python program to view and export Touchstone data from a NanoVNA
+#  Copyright (C) 2019, 2020  Rune B. Broberg
+#  Copyright (C) 2020ff NanoVNA-Saver Authors
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import glob
+import os
+import unittest
+
+import numpy as np
+from PySide6 import QtWidgets
+from scipy.constants import speed_of_light  # type: ignore
+
+from NanoVNASaver.Charts.TDR import TDRChart
+from NanoVNASaver.RFTools import Datapoint
+from NanoVNASaver.Touchstone import Touchstone
+
+# Import targets to be tested
+from NanoVNASaver.Windows.TDR import (
+    WINDOWING_FUNCTION,
+    TDRWindow,
+    find_peak,
+    get_window,
+    step_convolve,
+)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class StubApp:
+    """the parts of NanoVNASaver the TDR window uses"""
+
+    def __init__(self, s11: list[Datapoint]) -> None:
+        self.tdr_chart = TDRChart("TDR")
+        self.tdr_result_label = QtWidgets.QLabel()
+        self.data = Touchstone("")
+        self.data.s11 = s11
+        self.data_version = 0
+
+    def dataUpdated(self) -> None:
+        pass
+
+
+def make_window(s11: list[Datapoint]) -> TDRWindow:
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = StubApp(s11)
+    window = TDRWindow(app)  # type: ignore
+    app.tdr_chart.tdrWindow = window
+    return window
+
+
+def reference_td(s11, lowpass, function, arg, fft_points):
+    """the former double precision impulse response"""
+    if lowpass:
+        s11 = np.fft.fftshift(np.concatenate([s11, np.conj(s11[-1:0:-1])]))
+    window = function(len(s11)) if arg is None else function(len(s11), arg)
+    windowed_s11 = window * s11
+    if not lowpass:
+        return np.abs(np.fft.ifft(windowed_s11, fft_points))
+    pad_points = (fft_points - len(windowed_s11)) // 2
+    return np.fft.ifft(
+        np.fft.ifftshift(np.pad(windowed_s11, [pad_points + 1, pad_points]))
+    )
+
+
+class TestStepConvolve(unittest.TestCase):
+    def check(self, td):
+        ones = np.ones(len(td))
+        expected = np.convolve(td, ones) + np.convolve(td[::-1], ones)
+        result = step_convolve(td)
+        self.assertEqual(result.shape, expected.shape)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_two_points(self):
+        self.check(np.array([0.25 + 0.5j, -1.0 + 0.125j]))
+
+    def test_odd_length(self):
+        rng = np.random.default_rng(1)
+        self.check(rng.normal(size=101) + 1j * rng.normal(size=101))
+
+    def test_fft_length(self):
+        rng = np.random.default_rng(2)
+        self.check(rng.normal(size=1024) + 1j * rng.normal(size=1024))
+
+    def test_single_precision_input(self):
+        rng = np.random.default_rng(3)
+        td = (rng.normal(size=64) + 1j * rng.normal(size=64)).astype(
+            np.complex64
+        )
+        result = step_convolve(td)
+        self.assertEqual(result.dtype, np.complex128)
+        ones = np.ones(len(td))
+        td = td.astype(np.complex128)
+        np.testing.assert_allclose(
+            result,
+            np.convolve(td, ones) + np.convolve(td[::-1], ones),
+            atol=1e-9,
+        )
+
+
+class TestFindPeak(unittest.TestCase):
+    def test_most_prominent(self):
+        td = np.array([0.0, 0.2, 0.0, 1.0, 0.1, 0.9, 0.0])
+        self.assertEqual(find_peak(td), 3)
+
+    def test_peak_at_start(self):
+        td = np.array([1.0, 0.5, 0.0, 0.2, 0.0])
+        self.assertEqual(find_peak(td), 0)
+
+    def test_no_peak(self):
+        # rising to the end, there is no peak, fall back to the maximum
+        td = np.linspace(0.0, 1.0, 16)
+        self.assertEqual(find_peak(td), 15)
+
+    def test_not_positive(self):
+        td = np.array([-3.0, -1.0, -2.0, 0.0, -4.0])
+        self.assertEqual(find_peak(td), 3)
+        self.assertEqual(find_peak(np.full(8, -1.0)), 0)
+
+    def test_complex(self):
+        td = np.array([0.1 + 5j, 0.3 - 5j, 0.1 + 0j, 0.0 + 1j])
+        self.assertEqual(find_peak(td), 1)
+
+
+class TestGetWindow(unittest.TestCase):
+    def test_correction(self):
+        # values of the former per call corrections
+        length = 201
+        expected = {
+            "Hanning": length / 2.0,
+            "Blackman": length * 0.42,
+        }
+        for name, function, correction, arg in WINDOWING_FUNCTION:
+            window, factor = get_window(function, correction, arg, length)
+            if arg is None:
+                np.testing.assert_array_equal(window, function(length))
+                self.assertAlmostEqual(factor, expected[name])
+            else:
+                np.testing.assert_array_equal(window, function(length, arg))
+                self.assertAlmostEqual(
+                    factor, np.sum(np.kaiser(length, arg)), places=9
+                )
+
+    def test_cached(self):
+        _, function, correction, arg = WINDOWING_FUNCTION[3]
+        window, _ = get_window(function, correction, arg, 64)
+        self.assertIs(get_window(function, correction, arg, 64)[0], window)
+        self.assertFalse(window.flags.writeable)
+
+
+class TestCableLength(unittest.TestCase):
+    def test_double_precision(self):
+        for filename in sorted(glob.glob("tests/data/*.s[12]p")):
+            touchstone = Touchstone(filename)
+            touchstone.load()
+            data = touchstone.s11
+            if len(data) < 2:
+                continue
+            s11 = np.array([d.z for d in data])
+            step = data[1].freq - data[0].freq
+            window = make_window(data)
+            v = float(window.tdr_velocity_input.text())
+            fft_points = window.app.tdr_chart.get_fft_points()
+            distance = np.linspace(0, 1 / step, fft_points) * v * speed_of_light
+            for tdr_format in ("|Z| (lowpass)", "Refl (bandpass)"):
+                window.format_dropdown.setCurrentText(tdr_format)
+                for index, (_, function, _, arg) in enumerate(
+                    WINDOWING_FUNCTION
+                ):
+                    window.window_dropdown.setCurrentIndex(index)
+                    window.updateTDR()
+                    td = reference_td(
+                        s11, "lowpass" in tdr_format, function, arg, fft_points
+                    )
+                    cable_len = round(distance[find_peak(td)] / 2, 3)
+                    with self.subTest(
+                        file=filename, format=tdr_format, window=index
+                    ):
+                        self.assertEqual(
+                            window.tdr_result_label.text().split("m")[0],
+                            f"{cable_len}",
+                        )
+
+
+class TestFFTInput(unittest.TestCase):
+    def test_pad_and_shift(self):
+        window = make_window([])
+        rng = np.random.default_rng(4)
+        for fft_points in (2**12, 2**14):
+            for points in (2, 3, 101, 1010, 2020, 2021):
+                # the mirrored sweep holds 2 * points - 1 values
+                length = 2 * points - 1
+                windowed_s11 = rng.normal(size=length) + 1j * rng.normal(
+                    size=length
+                )
+                window.windowed_s11 = windowed_s11
+                pad_points = (fft_points - length) // 2
+                expected = np.fft.ifftshift(
+                    np.pad(windowed_s11, [pad_points + 1, pad_points])
+                )
+                with self.subTest(fft_points=fft_points, points=points):
+                    np.testing.assert_array_equal(
+                        window._fft_input(fft_points), expected
+                    )
+
+
+class TestS11Mirrored(unittest.TestCase):
+    def test_mirror(self):
+        window = make_window([])
+        rng = np.random.default_rng(5)
+        for points in (2, 3, 101, 1010):
+            s11 = rng.normal(size=points) + 1j * rng.normal(size=points)
+            expected = np.fft.fftshift(
+                np.concatenate([s11, np.conj(s11[-1:0:-1])])
+            )
+            with self.subTest(points=points):
+                np.testing.assert_array_equal(
+                    window._s11_mirrored(s11), expected
+                )
+
+    def test_cached(self):
+        window = make_window([])
+        s11 = np.array([1.0 + 1j, 0.5 - 0.5j, 0.25j])
+        mirror = window._s11_mirrored(s11)
+        self.assertIs(window._s11_mirrored(s11), mirror)
+        self.assertFalse(mirror.flags.writeable)
+        other = s11 * 2
+        self.assertIsNot(window._s11_mirrored(other), mirror)
+        np.testing.assert_array_equal(window._s11_mirrored(other), mirror * 2)
+
+
+class TestS11Array(unittest.TestCase):
+    def test_refilled_in_place(self):
+        # sweeps write their segments into the same list
+        s11 = [Datapoint(100000 * (i + 1), 0.0, 0.0) for i in range(101)]
+        window = make_window(s11)
+        np.testing.assert_array_equal(window._s11_array(), np.zeros(101))
+        for i, d in enumerate(s11):
+            s11[i] = Datapoint(d.freq, 0.5, -0.25)
+        window.app.data_version += 1
+        np.testing.assert_array_equal(
+            window._s11_array(), np.full(101, 0.5 - 0.25j)
+        )
+
+    def test_cached(self):
+        s11 = [Datapoint(100000 * (i + 1), 0.5, 0.5) for i in range(11)]
+        window = make_window(s11)
+        converted = window._s11_array()
+        self.assertIs(window._s11_array(), converted)
+        window.app.data.s11 = s11[:]
+        self.assertIsNot(window._s11_array(), converted)